@@ -0,0 +1,130 @@
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from math import floor
+from typing import Any
+
+from capella_console_client.columnar import SPATIAL_FILTER_FIELDS
+from capella_console_client.config import AOI_MERGE_CELL_SIZE, CATALOG_DEFAULT_LIMIT, CATALOG_MAX_CONCURRENCY
+from capella_console_client.logconf import logger
+from capella_console_client.search import StacSearch, StacSearchResult
+from capella_console_client.session import CapellaConsoleSession
+from capella_console_client.spatial import _as_geometry, geometry_bbox
+
+# (spatial search filter, ids of AOIs covered by query)
+AoiQuery = tuple[dict[str, Any], list[str]]
+
+
+def _get_aoi_geometries(features) -> dict[str, dict[str, Any]]:
+    """AOI geometry by AOI id (feature `id`, `properties.id` or position in `features`)"""
+    if isinstance(features, dict) and features.get("type") == "FeatureCollection":
+        features = features["features"]
+
+    geometries = {}
+    for idx, feature in enumerate(features):
+        aoi_id = feature.get("id")
+        if aoi_id is None:
+            aoi_id = (feature.get("properties") or {}).get("id")
+        if aoi_id is None:
+            aoi_id = idx
+
+        aoi_id = str(aoi_id)
+        if aoi_id in geometries:
+            raise ValueError(f"duplicate AOI id {aoi_id}")
+        geometries[aoi_id] = _as_geometry(feature)
+    return geometries
+
+
+class MultiAoiSearch:
+    """
+    search STAC items of many AOIs and join them back to the AOIs
+
+    * identical AOI geometries are searched once
+    * AOIs with bbox center in the same `merge_cell_size` degrees grid cell share a bbox query
+    * queries are issued concurrently (max. `max_concurrency`)
+    """
+
+    def __init__(
+        self,
+        session: CapellaConsoleSession,
+        features,
+        max_concurrency: int | None = None,
+        merge_cell_size: float | None = AOI_MERGE_CELL_SIZE,
+        **kwargs,
+    ) -> None:
+        spatial_filters = SPATIAL_FILTER_FIELDS & kwargs.keys()
+        if spatial_filters:
+            raise ValueError(f"{', '.join(sorted(spatial_filters))} not supported - AOIs are provided by features")
+
+        self.session = session
+        self.aois = _get_aoi_geometries(features)
+        self.max_concurrency = max_concurrency or CATALOG_MAX_CONCURRENCY
+        self.merge_cell_size = merge_cell_size
+        self.kwargs = kwargs
+        self.limit = kwargs.get("limit", CATALOG_DEFAULT_LIMIT)
+
+    def _get_queries(self) -> list[AoiQuery]:
+        aoi_ids_by_geometry: dict[str, list[str]] = defaultdict(list)
+        for aoi_id, geometry in self.aois.items():
+            aoi_ids_by_geometry[json.dumps(geometry, sort_keys=True)].append(aoi_id)
+
+        cells: dict[Any, list[str]] = defaultdict(list)
+        for geometry_key in aoi_ids_by_geometry:
+            if not self.merge_cell_size:
+                cells[geometry_key].append(geometry_key)
+                continue
+            min_x, min_y, max_x, max_y = geometry_bbox(json.loads(geometry_key))
+            cell = (
+                floor((min_x + max_x) / 2 / self.merge_cell_size),
+                floor((min_y + max_y) / 2 / self.merge_cell_size),
+            )
+            cells[cell].append(geometry_key)
+
+        queries = []
+        for geometry_keys in cells.values():
+            aoi_ids = [aoi_id for key in geometry_keys for aoi_id in aoi_ids_by_geometry[key]]
+            if len(geometry_keys) == 1:
+                queries.append(({"intersects": json.loads(geometry_keys[0])}, aoi_ids))
+                continue
+
+            bboxes = [geometry_bbox(json.loads(key)) for key in geometry_keys]
+            bbox = [
+                min(b[0] for b in bboxes),
+                min(b[1] for b in bboxes),
+                max(b[2] for b in bboxes),
+                max(b[3] for b in bboxes),
+            ]
+            queries.append(({"bbox": bbox}, aoi_ids))
+
+        logger.info(f"searching {len(self.aois)} AOIs with {len(queries)} queries")
+        return queries
+
+    def _search(self, query: AoiQuery) -> list[dict[str, Any]]:
+        spatial_filter, aoi_ids = query
+        result = StacSearch(self.session, **self.kwargs, **spatial_filter).fetch_all()
+
+        if "bbox" in spatial_filter and len(result) >= self.limit:
+            # shared query possibly truncated by limit - search AOIs individually
+            logger.info(f"shared bbox query of {len(aoi_ids)} AOIs reached limit ... searching AOIs individually")
+            return [
+                item
+                for aoi_id in aoi_ids
+                for item in StacSearch(self.session, **self.kwargs, intersects=self.aois[aoi_id]).fetch_all()
+            ]
+        return list(result)
+
+    def fetch_all(self) -> dict[str, list[str]]:
+        queries = self._get_queries()
+
+        items_by_id: dict[str, dict[str, Any]] = {}
+        if queries:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(queries))) as executor:
+                for items in executor.map(self._search, queries):
+                    items_by_id.update((item["id"], item) for item in items)
+
+        result = StacSearchResult()
+        result.add({"features": list(items_by_id.values())}, keep_duplicates=True)
+        index = result.spatial_index()
+
+        # local spatial join of matched STAC items back to AOIs
+        return {aoi_id: [item["id"] for item in index.intersecting(geometry)] for aoi_id, geometry in self.aois.items()}
@@ -0,0 +1,232 @@
+import hashlib
+import inspect
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+
+from capella_console_client.config import (
+    BULK_CREATE_IDEMPOTENCY_LOOKBACK,
+    BULK_CREATE_MAX_CONCURRENCY,
+    BULK_CREATE_RATE,
+)
+from capella_console_client.exceptions import CapellaConsoleClientError
+from capella_console_client.executor import _get_error_result
+from capella_console_client.hooks import is_transient_error
+from capella_console_client.logconf import logger
+from capella_console_client.rate_limit import RateLimiter, _retrying
+from capella_console_client.repeat_request import (
+    _build_repeat_request_payload,
+    _build_validated_repeat_request_payload,
+)
+from capella_console_client.search import AbstractTaskRepeatSearch, RepeatRequestSearch, TaskingRequestSearch
+from capella_console_client.session import CapellaConsoleSession
+from capella_console_client.tasking_request import _build_tasking_request_payload
+from capella_console_client.validate import _datetime_to_iso8601_str
+
+IDEMPOTENCY_KEY_PREFIX = "ccc-"
+
+
+def _iter_features(features: Any) -> list[dict[str, Any]]:
+    """Features of GeoJSON FeatureCollection or list of Features"""
+    if isinstance(features, dict) and features.get("type") == "FeatureCollection":
+        features = features["features"]
+    return list(features)
+
+
+def _get_parameter_names(fct: Callable[..., Any]) -> set[str]:
+    return {
+        name for name, param in inspect.signature(fct).parameters.items() if param.kind != inspect.Parameter.VAR_KEYWORD
+    }
+
+
+def _get_idempotency_key(index: int, kwargs: dict[str, Any]) -> str:
+    """hash of feature index and request kwargs (stable across reruns of the same batch)"""
+    canonical = json.dumps([index, kwargs], sort_keys=True, separators=(",", ":"), default=str)
+    return f"{IDEMPOTENCY_KEY_PREFIX}{hashlib.sha256(canonical.encode()).hexdigest()[:24]}"
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    return isinstance(exc, CapellaConsoleClientError) and exc.response is not None and exc.response.status_code == 429
+
+
+def _find_existing_requests(
+    search_cls: type[AbstractTaskRepeatSearch],
+    session: CapellaConsoleSession,
+    keys: set[str],
+    submitted_since: datetime,
+) -> dict[str, dict[str, Any]]:
+    """tasking/ repeat requests of user submitted since `submitted_since` by `customAttribute1` contained in `keys`"""
+    search = search_cls(session=session, submission_time__gte=_datetime_to_iso8601_str(submitted_since))
+    existing = {}
+    for task in search.iter_results():
+        key = task["properties"].get("customAttribute1")
+        if key in keys:
+            existing[key] = task
+    return existing
+
+
+def _create_worker(
+    session: CapellaConsoleSession,
+    endpoint: str,
+    payload: dict[str, Any],
+    key: str | None,
+    limiter: RateLimiter,
+    find_existing: Callable[[set[str]], dict[str, dict[str, Any]]],
+) -> dict[str, Any]:
+    # previous attempt failed ambiguously (5xx, connection error), i.e. the request might have been created
+    ambiguous = False
+
+    def _post() -> dict[str, Any]:
+        nonlocal ambiguous
+        if ambiguous and key is not None:
+            existing = find_existing({key})
+            if key in existing:
+                return {"success": True, "existing": True, "result": existing[key]}
+
+        limiter.acquire()
+        try:
+            return {
+                "success": True,
+                "existing": False,
+                "result": session.decode_json(session.post(endpoint, json=payload)),
+            }
+        except CapellaConsoleClientError as exc:
+            ambiguous = exc.response is None or exc.response.status_code != 429
+            raise
+        except httpx.TransportError:
+            ambiguous = True
+            raise
+
+    # submissions without idempotency key can't be checked for existence, i.e. only retried if rate limited
+    predicate = is_transient_error if key is not None else _is_rate_limited
+    try:
+        result: dict[str, Any] = _retrying(predicate=predicate)(_post)
+    except (CapellaConsoleClientError, httpx.TransportError) as exc:
+        return _get_error_result(exc)
+    return result
+
+
+def _create_multi_parallel(
+    features: Any,
+    session: CapellaConsoleSession,
+    build_payload: Callable[..., dict[str, Any]],
+    endpoint: str,
+    find_existing: Callable[[set[str]], dict[str, dict[str, Any]]] | None = None,
+    payload_signature: Callable[..., Any] | None = None,
+    max_concurrency: int = BULK_CREATE_MAX_CONCURRENCY,
+    rate: float = BULK_CREATE_RATE,
+    **common_kwargs: Any,
+) -> list[dict[str, Any]]:
+    features = _iter_features(features)
+    # feature properties other than arguments of `build_payload` (`payload_signature` if `build_payload` takes
+    # **kwargs) are feature metadata, e.g. `id`, `site`
+    payload_args = _get_parameter_names(payload_signature or build_payload)
+
+    # validate all payloads before any network call
+    keys: list[str | None] = []
+    results_by_index: dict[int, dict[str, Any]] = {}
+    payloads_by_index: dict[int, dict[str, Any]] = {}
+    for idx, feature in enumerate(features):
+        properties = feature.get("properties") or {}
+        explicit_key = properties.get("idempotency_key")
+        kwargs = {
+            **common_kwargs,
+            **{k: v for k, v in properties.items() if k in payload_args},
+            "geometry": feature["geometry"],
+        }
+
+        # idempotency key is stored as customAttribute1, user provided custom_attribute_1 is kept (not tracked)
+        key = None
+        if not kwargs.get("custom_attribute_1"):
+            key = explicit_key or _get_idempotency_key(idx, kwargs)
+            kwargs["custom_attribute_1"] = key
+        keys.append(key)
+
+        if explicit_key and key is None:
+            results_by_index[idx] = {
+                "success": False,
+                "message": "invalid payload: idempotency_key requires custom_attribute_1 to be unset",
+            }
+            continue
+        try:
+            payloads_by_index[idx] = build_payload(**kwargs)
+        except (TypeError, ValueError, CapellaConsoleClientError) as exc:
+            results_by_index[idx] = {"success": False, "message": f"invalid payload: {exc}"}
+
+    pending = []
+    valid_keys = {key for idx in payloads_by_index if (key := keys[idx]) is not None}
+    existing = find_existing(valid_keys) if find_existing is not None and valid_keys else {}
+    seen = set()
+    for idx in payloads_by_index:
+        key = keys[idx]
+        if key is None:
+            pending.append(idx)
+        elif key in existing:
+            logger.info(f"request with idempotency key {key} already exists ... skipping")
+            results_by_index[idx] = {"success": True, "existing": True, "result": existing[key]}
+        elif key in seen:
+            results_by_index[idx] = {"success": False, "message": f"duplicate idempotency key {key}"}
+        else:
+            seen.add(key)
+            pending.append(idx)
+
+    limiter = RateLimiter(rate)
+    max_workers = max(min(max_concurrency, len(pending)), 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            idx: executor.submit(
+                _create_worker,
+                session=session,
+                endpoint=endpoint,
+                payload=payloads_by_index[idx],
+                key=keys[idx],
+                limiter=limiter,
+                find_existing=find_existing or _no_existing,
+            )
+            for idx in pending
+        }
+        for idx, fut in futures.items():
+            results_by_index[idx] = fut.result()
+
+    return [{"index": idx, "idempotency_key": key, **results_by_index[idx]} for idx, key in enumerate(keys)]
+
+
+def _no_existing(keys: set[str]) -> dict[str, dict[str, Any]]:
+    return {}
+
+
+def create_tasking_requests(features: Any, session: CapellaConsoleSession, **kwargs: Any) -> list[dict[str, Any]]:
+    submitted_since = datetime.now(timezone.utc) - BULK_CREATE_IDEMPOTENCY_LOOKBACK
+
+    def find_existing(keys: set[str]) -> dict[str, dict[str, Any]]:
+        return _find_existing_requests(TaskingRequestSearch, session, keys, submitted_since)
+
+    return _create_multi_parallel(
+        features,
+        session=session,
+        build_payload=_build_tasking_request_payload,
+        endpoint="/task",
+        find_existing=find_existing,
+        **kwargs,
+    )
+
+
+def create_repeat_requests(features: Any, session: CapellaConsoleSession, **kwargs: Any) -> list[dict[str, Any]]:
+    submitted_since = datetime.now(timezone.utc) - BULK_CREATE_IDEMPOTENCY_LOOKBACK
+
+    def find_existing(keys: set[str]) -> dict[str, dict[str, Any]]:
+        return _find_existing_requests(RepeatRequestSearch, session, keys, submitted_since)
+
+    return _create_multi_parallel(
+        features,
+        session=session,
+        build_payload=_build_validated_repeat_request_payload,
+        endpoint="/repeat-requests",
+        find_existing=find_existing,
+        payload_signature=_build_repeat_request_payload,
+        **kwargs,
+    )
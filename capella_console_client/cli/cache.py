@@ -5,6 +5,8 @@ from typing import Any
 
 import keyring
 
+from capella_console_client.config import CONSOLE_WIZARD_ROOT, MY_SEARCH_QUERIES_PATH
+
 
 def _safe_load_json(file_path: Path) -> dict[str, Any]:
     content = {}
@@ -16,12 +18,12 @@ def _safe_load_json(file_path: Path) -> dict[str, Any]:
 
 
 class CLICache:
-    ROOT = Path.home() / ".capella-console-wizard"
+    ROOT = CONSOLE_WIZARD_ROOT
     SETTINGS = ROOT / "settings.json"  # LEGACY - for migration
     PROFILES_DIR = ROOT / "profiles"
     PROFILES_META = ROOT / "profiles.json"
     MY_SEARCH_RESULTS = ROOT / "my-search-results.json"
-    MY_SEARCH_QUERIES = ROOT / "my-search-queries.json"
+    MY_SEARCH_QUERIES = MY_SEARCH_QUERIES_PATH
     KEYRING_SYSTEM_NAME = "capella-console-wizard"
     KEYRING_USERNAME = "console-api-key"  # LEGACY - for migration
     DEFAULT_PROFILE = "default"
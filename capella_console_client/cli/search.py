@@ -8,6 +8,7 @@ from typing import Any
 import questionary
 import typer
 
+from capella_console_client import columnar
 from capella_console_client.cli.cache import CLICache
 from capella_console_client.cli.client_singleton import CLIENT
 from capella_console_client.cli.config import (
@@ -221,14 +222,28 @@ class PostSearchActions(str, BaseEnum):
         return path
 
     @classmethod
-    def refine_search_cmd(cls, prev_search: STACQueryPayload) -> tuple[STACQueryPayload, StacSearchResult]:
+    def refine_search_cmd(
+        cls,
+        prev_search: STACQueryPayload,
+        prev_result: StacSearchResult | None = None,
+        prev_search_kwargs: dict[str, Any] | None = None,
+    ) -> tuple[STACQueryPayload, StacSearchResult]:
         prev_search.pop("constellation", None)
         if prev_search["limit"][0][1] == CURRENT_SETTINGS["limit"]:
             prev_search.pop("limit")
 
         typer.echo(f"Refining\n\t{json.dumps(prev_search)}")
         search_query = _prompt_search_filters(prev_search=prev_search)
-        stac_items = CLIENT.search(**search_query)
+
+        if (
+            prev_result is not None
+            and prev_search_kwargs is not None
+            and columnar.is_narrower_search(prev_search_kwargs, search_query, len(prev_result))
+        ):
+            typer.echo("Refined search is narrower than previous search ... filtering previous result")
+            stac_items = prev_result.filter(**columnar.get_narrowing_filters(prev_search_kwargs, search_query))
+        else:
+            stac_items = CLIENT.search(**search_query)
         return (search_query, stac_items)
 
     @classmethod
@@ -280,7 +295,9 @@ def _prompt_post_search_actions(
 
         if action_selection == PostSearchActions.refine_search:
             prev_search = STACQueryPayload.unflatten(search_kwargs)
-            search_kwargs, result = PostSearchActions.refine_search_cmd(prev_search)
+            search_kwargs, result = PostSearchActions.refine_search_cmd(
+                prev_search, prev_result=result, prev_search_kwargs=search_kwargs
+            )
             show_tabulated(result, show_row_number=True)
             choices = PostSearchActions._get_choices(results_found=bool(result))
 
@@ -1,10 +1,11 @@
 import logging
-import sys
 import tempfile
 from collections import defaultdict
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any, cast
 
+from capella_console_client.aoi_search import MultiAoiSearch
 from capella_console_client.assets import (
     DownloadRequest,
     _derive_stac_id,
@@ -13,7 +14,9 @@ from capella_console_client.assets import (
     _get_asset_bytesize,
     _perform_download,
 )
-from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.bulk import create_repeat_requests, create_tasking_requests
+from capella_console_client.codec import JsonCodec
+from capella_console_client.config import CATALOG_DEFAULT_LIMIT, CONSOLE_API_URL, STAC_SUPPORTED_QUERY_FIELDS
 from capella_console_client.enumerations import AssetType, ProductType
 from capella_console_client.exceptions import (
     InsufficientFundsError,
@@ -21,10 +24,18 @@ from capella_console_client.exceptions import (
     OrderRejectedError,
     TaskNotCompleteError,
 )
+from capella_console_client.incremental import (
+    get_boundary_ids,
+    get_ids_with_value,
+    get_newest_value,
+    get_watermark,
+    save_watermark,
+)
 from capella_console_client.logconf import logger
 from capella_console_client.order import get_non_expired_orders, get_order
+from capella_console_client.pipeline import TaskDownloadPipeline
 from capella_console_client.repeat_request import cancel_repeat_requests, create_repeat_request, update_repeat_requests
-from capella_console_client.report import print_cancelation_result
+from capella_console_client.report import print_cancelation_result, print_creation_result
 from capella_console_client.s3 import S3Path
 from capella_console_client.search import (
     RepeatRequestSearch,
@@ -33,13 +44,19 @@ from capella_console_client.search import (
     StacSearchResult,
     TaskingRequestSearch,
     TaskingRequestSearchResult,
+    facet_counts,
+    search_by_ids,
 )
+from capella_console_client.search_cache import SearchCache
 from capella_console_client.session import CapellaConsoleSession
-from capella_console_client.sort import _sort_stac_items
+from capella_console_client.sort import _sort_stac_items, _sort_stac_items_by_properties
+from capella_console_client.task_mirror import TaskingRequestMirror
+from capella_console_client.task_watch import TaskingRequestWatcher
 from capella_console_client.tasking_request import (
     _task_contains_status,
     cancel_tasking_requests,
     create_tasking_request,
+    get_collects_for_tasking_requests,
     get_tasking_request,
     update_tasking_requests,
 )
@@ -68,6 +85,9 @@ class CapellaConsoleClient:
         base_url: Capella console API base URL override
         search_url: Capella catalog/search/ override
         no_auth: bypass authentication
+        search_cache: opt-in on-disk cache of catalog search responses, e.g. `SearchCache(ttl=600)`
+        json_codec: JSON codec for request/ response bodies, one of "orjson", "msgspec", "json"
+                    (default: fastest installed, see `pip install capella-console-client[speedups]`)
 
     NOTE:
         not providing either `api_key` (can be set by CAPELLA_API_KEY env) or `token`
@@ -88,9 +108,14 @@ class CapellaConsoleClient:
         base_url: str | None = CONSOLE_API_URL,
         search_url: str | None = None,
         no_auth: bool = False,
+        search_cache: SearchCache | None = None,
+        json_codec: JsonCodec | str | None = None,
     ):
         self._set_verbosity(verbose)
-        self._sesh = CapellaConsoleSession(base_url=base_url, search_url=search_url, verbose=verbose)
+        self._search_cache = search_cache
+        self._sesh = CapellaConsoleSession(
+            base_url=base_url, search_url=search_url, verbose=verbose, json_codec=json_codec
+        )
 
         if not no_auth:
             self._sesh.authenticate(api_key, token, no_token_check)
@@ -110,7 +135,7 @@ class CapellaConsoleClient:
             Dict[str, Any]: return of GET /user
         """
         resp = self._sesh.get("/user")
-        return resp.json()
+        return self._sesh.decode_json(resp)
 
     # TASKING
     def create_tasking_request(self, **kwargs) -> dict[str, Any]:
@@ -150,25 +175,76 @@ class CapellaConsoleClient:
         """
         return create_tasking_request(session=self._sesh, **kwargs)
 
-    def update_tasking_requests(self, *tasking_request_ids: str, **kwargs) -> dict[str, Any]:
+    def create_tasking_requests(
+        self, features: dict[str, Any] | list[dict[str, Any]], **kwargs
+    ) -> list[dict[str, Any]]:
         """
-        Update multiple tasking requests with the same field values (parallel)
+        Create a tasking request per GeoJSON Feature (parallel, rate limited)
+
+        Each feature's `properties` (same arguments as :py:meth:`create_tasking_request`, e.g. `name`, `window_open`)
+        take precedence over `kwargs` shared by all features, other properties (e.g. `id`) are ignored. Submissions
+        failing with 429, 5xx or connection errors are retried.
+
+        Submissions are tracked by an idempotency key stored as `customAttribute1`: the feature's `idempotency_key`
+        property if provided, else derived from the feature's index and arguments (stable across reruns of the same
+        batch). Tasking requests of the same key submitted within the last 7 days are not created again, e.g. when
+        rerunning a partially failed batch. Features providing `custom_attribute_1` keep it and are not tracked,
+        i.e. are not checked for existence and not retried after ambiguous failures (5xx, connection errors).
 
         Args:
-            tasking_request_ids: UUIDs of tasking requests to update
+            features: GeoJSON FeatureCollection or list of Features
+            kwargs: arguments shared by all tasking requests, see :py:meth:`create_tasking_request`
+                    max_concurrency: max. parallel submissions, default: 8
+                    rate: max. submissions per second, default: 5
+
+        Returns:
+            List[Dict[str, Any]]: result per feature (in order of `features`), e.g.
+
+            .. highlight:: python
+            .. code-block:: python
+
+                [
+                    {"index": 0, "idempotency_key": "...", "success": True, "existing": False, "result": <created tasking request>},
+                    {"index": 1, "idempotency_key": "...", "success": False, "message": "..."},
+                ]
+        """
+        results = create_tasking_requests(features, session=self._sesh, **kwargs)
+
+        if self.verbose:
+            print_creation_result(results, task_type="tasking")
+
+        return results
+
+    def update_tasking_requests(
+        self,
+        *tasking_request_ids: str,
+        properties_by_id: dict[str, dict[str, Any]] | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Update multiple tasking requests (parallel, rate limited, retried on 429 and 5xx)
+
+        e.g. different custom attribute per tasking request:
+
+            client.update_tasking_requests(properties_by_id={"<tr-id-1>": {"custom_attribute_1": "project-a"}, "<tr-id-2>": {"custom_attribute_1": "project-b"}})
+
+        Args:
+            tasking_request_ids: UUIDs of tasking requests to update with the field values of `kwargs`
+            properties_by_id: field values by tasking request id, take precedence over `kwargs`
             name: updated name
             description: updated description
             custom_attribute_1: updated custom attribute 1
             custom_attribute_2: updated custom attribute 2
             product_types: updated list of product types
+            rate: max. updates per second, default: 10
 
         Returns:
             Dict[str, Any]: results keyed by tasking request id — the updated TR dict on
             success, or ``{"success": False, ...}`` on failure
         """
-        filtered_ids = _compact_unique(tasking_request_ids)
+        filtered_ids = _compact_unique([*tasking_request_ids, *(properties_by_id or {})])
         _validate_uuids(filtered_ids)
-        return update_tasking_requests(*filtered_ids, session=self._sesh, **kwargs)
+        return update_tasking_requests(*filtered_ids, session=self._sesh, properties_by_id=properties_by_id, **kwargs)
 
     def search_tasking_requests(self, **kwargs: Any) -> TaskingRequestSearchResult:
         """
@@ -193,6 +269,11 @@ class CapellaConsoleClient:
          • page_size: int, page size, default: 250, needs to be between 250 and 500
          • show_progress: bool, display interactive progress bar during pagination, default: False
          • threaded: bool, enable parallel pagination requests, default: True
+         • max_results: int, max. number of results, pages beyond are not requested, default: None (all)
+         • include_repeating_tasks: bool, include tasking requests derived from repeat requests, default: False
+         • sortby: str | List[str], client side sort of all matched results, direction prefix "-" (descending) or "+" (ascending), e.g. ["-last_status_time"]
+           fields: collection_tier, collection_type, last_status_time, status, submission_time, window_open, window_close or (dotted) property names
+           combined with max_results the top max_results sorted results are returned, e.g. latest 10: sortby="-last_status_time", max_results=10
 
         supported operators:
          • eq: equality search
@@ -207,6 +288,67 @@ class CapellaConsoleClient:
         search = TaskingRequestSearch(session=self._sesh, **kwargs)
         return cast(TaskingRequestSearchResult, search.fetch_all())
 
+    def iter_tasking_requests(self, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """
+        iterate over matched tasking requests in page order while pages are fetched,
+        see :py:meth:`search_tasking_requests` for supported query filters
+
+        Returns:
+            Iterator[Dict[str, Any]]: matched tasking requests
+        """
+        return TaskingRequestSearch(session=self._sesh, **kwargs).iter_results()
+
+    def sync_tasking_requests(
+        self,
+        db_path: Path | str | None = None,
+        for_org: bool = False,
+        include_repeat_requests: bool = True,
+        **kwargs: Any,
+    ) -> TaskingRequestMirror:
+        """
+        sync local SQLite mirror of tasking (and repeat) requests
+
+        only requests whose status changed since the previous sync (`last_status_time__gt` newest status time seen)
+        are fetched, use :py:meth:`TaskingRequestMirror.query` to query the mirrored requests, e.g.
+
+            mirror = client.sync_tasking_requests(for_org=True)
+            mirror.query(status=["accepted", "active"], window_open__gte="2024-01-01")
+
+        Args:
+            db_path: SQLite file of the mirror, default: ~/.cache/capella-console-client/tasking-requests.sqlite
+            for_org: mirror requests of user's org (requires elevated permissions)
+            include_repeat_requests: mirror repeat requests as well
+            kwargs: additional search filters, see :py:meth:`search_tasking_requests`
+
+        Returns:
+            TaskingRequestMirror: synced mirror
+        """
+        mirror = TaskingRequestMirror(db_path) if db_path is not None else TaskingRequestMirror()
+
+        if not self._sesh.customer_id or not self._sesh.organization_id:
+            self._sesh._cache_user_info()
+        owner = f"org:{self._sesh.organization_id}" if for_org else f"user:{self._sesh.customer_id}"
+
+        searches: list[tuple[str, type[TaskingRequestSearch] | type[RepeatRequestSearch]]] = [
+            ("tasking_request", TaskingRequestSearch)
+        ]
+        if include_repeat_requests:
+            searches.append(("repeat_request", RepeatRequestSearch))
+
+        for entity, search_cls in searches:
+            # changing filters starts a separate sync
+            scope = f"{self._sesh.base_url}|{owner}|{entity}|{sorted(kwargs.items())}"
+            search_kwargs = {**kwargs, "for_org": for_org}
+            watermark = mirror.get_watermark(scope)
+            if watermark is not None:
+                search_kwargs["last_status_time__gt"] = watermark
+
+            result = search_cls(session=self._sesh, **search_kwargs).fetch_all()
+            num_upserted = mirror.upsert(entity, list(result), scope=scope)
+            logger.info(f"synced {num_upserted} changed {entity.replace('_', ' ')}s since {watermark or 'beginning'}")
+
+        return mirror
+
     def get_task(self, tasking_request_id: str) -> dict[str, Any]:
         """
         fetch task for the specified `tasking_request_id`
@@ -226,6 +368,72 @@ class CapellaConsoleClient:
         """
         return _task_contains_status(task, "completed")
 
+    def watch_tasking_requests(
+        self,
+        tasking_request_ids: list[str],
+        on_status_change: Callable[[dict[str, Any], str | None, str | None], Any] | None = None,
+        on_completed: Callable[[dict[str, Any]], Any] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        watch status of tasking requests until all reached a terminal status (completed, rejected, expired, canceled, error, failed)
+        or were not found by 3 consecutive polls (status "not_found", e.g. tasking requests of other users without `for_org`)
+
+        tasking requests due are polled by a single tasking request search per cycle, polling intervals back off
+        exponentially (with jitter) per tasking request while its status is unchanged
+
+        Args:
+            tasking_request_ids: tasking requests to watch
+            on_status_change: called with (task, previous status, current status) on every status change (previous status is None on first poll)
+            on_completed: called with task once completed
+            timeout: stop watching after `timeout` seconds, default: None (no timeout)
+            kwargs: min_interval, max_interval (seconds) or for_org, see :py:class:`TaskingRequestWatcher`
+
+        Returns:
+            Dict[str, Dict[str, Any]]: latest task by tasking request id
+        """
+        _validate_uuids(tasking_request_ids)
+        watcher = TaskingRequestWatcher(
+            session=self._sesh,
+            tasking_request_ids=tasking_request_ids,
+            on_status_change=on_status_change,
+            on_completed=on_completed,
+            **kwargs,
+        )
+        return watcher.watch(timeout=timeout)
+
+    def download_on_completion(
+        self,
+        tasking_request_ids: list[str],
+        local_dir: Path | str = Path(tempfile.gettempdir()),
+        state_path: Path | str | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        long running pipeline: watch tasking requests and order + download their products once completed
+
+        stages overlap across tasking requests with bounded concurrency per stage, progress is persisted to `state_path`
+        and a rerun with the same `state_path` resumes where the previous run stopped
+
+        Args:
+            tasking_request_ids: tasking requests to watch
+            local_dir: Path where assets are saved to, tempdir if not provided
+            state_path: JSON file pipeline state is persisted to, default: ~/.cache/capella-console-client/download-pipeline.json
+            timeout: stop watching after `timeout` seconds, default: None (no timeout)
+            kwargs: order_concurrency, download_concurrency, product_types, contract_id
+                    or download options (include, exclude, override, separate_dirs, ...) see :py:meth:`download_products`
+
+        Returns:
+            Dict[str, Dict[str, Any]]: pipeline state by tasking request id, see :py:meth:`TaskDownloadPipeline.run`
+        """
+        _validate_uuids(tasking_request_ids)
+        if state_path is not None:
+            kwargs["state_path"] = state_path
+        pipeline = TaskDownloadPipeline(self, tasking_request_ids, local_dir=local_dir, **kwargs)
+        return pipeline.run(timeout=timeout)
+
     def cancel_tasking_requests(self, *tasking_request_ids: str | None) -> dict[str, Any]:
         """
         cancel tasking requests
@@ -283,7 +491,28 @@ class CapellaConsoleClient:
 
         collects_list_resp = self._sesh.get(f"/collects/list/{tasking_request_id}")
 
-        return collects_list_resp.json()
+        return self._sesh.decode_json(collects_list_resp)
+
+    def get_collects_for_tasks(self, tasking_request_ids: list[str]) -> dict[str, Any]:
+        """
+        get all the collects associated with multiple tasks, tasks and collects are fetched in parallel
+
+        Args:
+            tasking_request_ids: tasking request UUIDs
+
+        Returns:
+            Dict[str, Any]: result by tasking request id, tasks not in completed state are reported instead of raised, e.g.
+
+            .. highlight:: python
+            .. code-block:: python
+
+                {
+                    "<tasking_request_id_1>": {"success": True, "collects": [...]},
+                    "<tasking_request_id_2>": {"success": False, "status": "active", "message": "... not in completed state"},
+                }
+        """
+        _validate_uuids(tasking_request_ids)
+        return get_collects_for_tasking_requests(*tasking_request_ids, session=self._sesh)
 
     # REPEAT REQUESTS
     def create_repeat_request(self, **kwargs) -> dict[str, Any]:
@@ -329,6 +558,36 @@ class CapellaConsoleClient:
         """
         return create_repeat_request(session=self._sesh, **kwargs)
 
+    def create_repeat_requests(self, features: dict[str, Any] | list[dict[str, Any]], **kwargs) -> list[dict[str, Any]]:
+        """
+        Create a repeat request per GeoJSON Feature (parallel, rate limited)
+
+        Each feature's `properties` (same arguments as :py:meth:`create_repeat_request`, e.g. `name`, `repeat_start`)
+        take precedence over `kwargs` shared by all features, other properties (e.g. `id`) are ignored. All payloads
+        are validated (repetition start/ end, enumeration values, geometry type) before any submission, invalid
+        features are reported and not submitted.
+        Submissions failing with 429, 5xx or connection errors are retried.
+
+        Submissions are tracked by an idempotency key stored as `customAttribute1`, see
+        :py:meth:`create_tasking_requests`: repeat requests of the same key submitted within the last 7 days are not
+        created again.
+
+        Args:
+            features: GeoJSON FeatureCollection or list of Features
+            kwargs: arguments shared by all repeat requests, see :py:meth:`create_repeat_request`
+                    max_concurrency: max. parallel submissions, default: 8
+                    rate: max. submissions per second, default: 5
+
+        Returns:
+            List[Dict[str, Any]]: result per feature (in order of `features`), see :py:meth:`create_tasking_requests`
+        """
+        results = create_repeat_requests(features, session=self._sesh, **kwargs)
+
+        if self.verbose:
+            print_creation_result(results, task_type="repeat")
+
+        return results
+
     def search_repeat_requests(self, **kwargs: Any) -> RepeatRequestSearchResult:
         """
         search repeat requests
@@ -353,6 +612,10 @@ class CapellaConsoleClient:
          • page_size: int, page size, default: 250, needs to be between 250 and 500
          • show_progress: bool, display interactive progress bar during pagination, default: False
          • threaded: bool, enable parallel pagination requests, default: True
+         • max_results: int, max. number of results, pages beyond are not requested, default: None (all)
+         • sortby: str | List[str], client side sort of all matched results, direction prefix "-" (descending) or "+" (ascending), e.g. ["-last_status_time"]
+           fields: collection_tier, collection_type, last_status_time, repeat_start, repeat_end, repetition_interval, status, submission_time or (dotted) property names
+           combined with max_results the top max_results sorted results are returned
 
         supported operators:
          • eq: equality search
@@ -367,6 +630,16 @@ class CapellaConsoleClient:
         search = RepeatRequestSearch(session=self._sesh, **kwargs)
         return cast(RepeatRequestSearchResult, search.fetch_all())
 
+    def iter_repeat_requests(self, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """
+        iterate over matched repeat requests in page order while pages are fetched,
+        see :py:meth:`search_repeat_requests` for supported query filters
+
+        Returns:
+            Iterator[Dict[str, Any]]: matched repeat requests
+        """
+        return RepeatRequestSearch(session=self._sesh, **kwargs).iter_results()
+
     def cancel_repeat_requests(self, *repeat_request_ids: str | None) -> dict[str, Any]:
         """
         cancel repeat requests
@@ -405,24 +678,31 @@ class CapellaConsoleClient:
 
         return results_by_tr_id
 
-    def update_repeat_requests(self, *repeat_request_ids: str, **kwargs) -> dict[str, Any]:
+    def update_repeat_requests(
+        self,
+        *repeat_request_ids: str,
+        properties_by_id: dict[str, dict[str, Any]] | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
         """
-        Update multiple repeat requests with the same field values (parallel)
+        Update multiple repeat requests (parallel, rate limited, retried on 429 and 5xx)
 
         Args:
-            repeat_request_ids: UUIDs of the repeat requests to update
+            repeat_request_ids: UUIDs of the repeat requests to update with the field values of `kwargs`
+            properties_by_id: field values by repeat request id, take precedence over `kwargs`, e.g. {"<rr-id>": {"name": "new name"}}
             name: updated name
             description: updated description
             custom_attribute_1: updated custom attribute 1
             custom_attribute_2: updated custom attribute 2
             product_types: updated list of product types
+            rate: max. updates per second, default: 10
 
         Returns:
             Dict[str, Any]: update results keyed by repeat request ID
         """
-        filtered_ids = _compact_unique(repeat_request_ids)
+        filtered_ids = _compact_unique([*repeat_request_ids, *(properties_by_id or {})])
         _validate_uuids(filtered_ids)
-        return update_repeat_requests(*filtered_ids, session=self._sesh, **kwargs)
+        return update_repeat_requests(*filtered_ids, session=self._sesh, properties_by_id=properties_by_id, **kwargs)
 
     # ORDER
     def list_orders(self, *order_ids: str | None, is_active: bool | None = False) -> list[dict[str, Any]]:
@@ -452,7 +732,7 @@ class CapellaConsoleClient:
 
         # list specific orders
         if filtered_order_ids:
-            orders = [self._sesh.get(f"/orders/{order_id}").json() for order_id in filtered_order_ids]
+            orders = [self._sesh.decode_json(self._sesh.get(f"/orders/{order_id}")) for order_id in filtered_order_ids]
             return orders
 
         # list all orders of customer
@@ -460,7 +740,7 @@ class CapellaConsoleClient:
             "customerId": self._sesh.customer_id,
         }
         resp = self._sesh.get("/orders", params=params)
-        orders = resp.json()
+        orders = self._sesh.decode_json(resp)
         return orders
 
     def get_stac_items_of_order(self, order_id: str, ids_only: bool = False) -> list[str] | StacSearchResult:
@@ -477,7 +757,10 @@ class CapellaConsoleClient:
         if ids_only:
             return stac_ids
 
-        return self.search(ids=stac_ids)
+        return self._search_by_ids(stac_ids)
+
+    def _search_by_ids(self, stac_ids: list[str]) -> StacSearchResult:
+        return search_by_ids(self._sesh, stac_ids, cache=self._search_cache)
 
     def review_order(
         self,
@@ -490,7 +773,7 @@ class CapellaConsoleClient:
 
         stac_items: list[dict[str, Any]] | StacSearchResult
         if not items:
-            stac_items = self.search(ids=stac_ids)
+            stac_items = self._search_by_ids(stac_ids)
         else:
             stac_items = items
 
@@ -499,7 +782,7 @@ class CapellaConsoleClient:
 
         # review order
         order_payload = self._construct_order_payload(stac_items, contract_id)
-        review_order_response = self._sesh.post("/orders/review", json=order_payload).json()
+        review_order_response = self._sesh.decode_json(self._sesh.post("/orders/review", json=order_payload))
 
         if not review_order_response.get("authorized", False):
             raise InsufficientFundsError(review_order_response["authorizationDenialReason"]["message"])
@@ -544,13 +827,13 @@ class CapellaConsoleClient:
         def _get_stac_items() -> list[dict[str, Any]] | StacSearchResult:
             stac_items: list[dict[str, Any]] | StacSearchResult
             if stac_ids and not omit_search:
-                stac_items = self.search(ids=stac_ids)
+                stac_items = self._search_by_ids(stac_ids)
             else:
                 if omit_search and not items:
                     logger.warning(
                         "setting omit_search=True only works in combination providing items instead of stac_ids"
                     )
-                    stac_items = self.search(ids=stac_ids)
+                    stac_items = self._search_by_ids(stac_ids)
                 else:
                     if items is None:
                         raise ValueError("items must be provided when omit_search is True")
@@ -570,7 +853,7 @@ class CapellaConsoleClient:
         order_payload = self._construct_order_payload(stac_items, contract_id)
         res_order = self._sesh.post("/orders", json=order_payload)
 
-        con = res_order.json()
+        con = self._sesh.decode_json(res_order)
         order_id = con["orderId"]
         if con["orderStatus"] == "rejected":
             raise OrderRejectedError(f"Order for {', '.join(stac_ids)} rejected.")
@@ -598,6 +881,7 @@ class CapellaConsoleClient:
         order_id: str,
         stac_ids: list[str] | None = None,
         sort_by: list[str] | None = None,
+        sort_by_properties: str | list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         get presigned items hrefs for all products contained in order
@@ -606,6 +890,7 @@ class CapellaConsoleClient:
             order_id: active order ID (see :py:meth:`submit_order`)
             stac_ids: filter presigned assets by STAC IDs
             sort_by: list of stac ids to sort by
+            sort_by_properties: STAC item properties to sort by (same syntax as `sortby` of :py:meth:`search`), e.g. ["-datetime"]
 
         Returns:
             List[Dict[str, Any]]: List of assets of respective product, e.g.
@@ -631,13 +916,16 @@ class CapellaConsoleClient:
         logger.info(f"getting presigned items for order {order_id}")
         response = self._sesh.get(f"/orders/{order_id}/download")
 
-        presigned_stac_items = response.json()
+        presigned_stac_items = self._sesh.decode_json(response)
 
         # ensure sort
         sort_by = _validate_and_filter_stac_ids(sort_by)
         if sort_by:
             presigned_stac_items = _sort_stac_items(items=presigned_stac_items, stac_ids=sort_by)
 
+        if sort_by_properties:
+            presigned_stac_items = _sort_stac_items_by_properties(items=presigned_stac_items, sortby=sort_by_properties)
+
         # no filter
         if not stac_ids:
             return presigned_stac_items
@@ -906,8 +1194,7 @@ class CapellaConsoleClient:
 
         result = self.search(**search_kwargs)
         if not result:
-            logger.warning("No STAC items found ... aborting")
-            sys.exit(0)
+            raise NoValidStacIdsError(f"No STAC items found for collects {', '.join(collect_ids)}")
 
         order_id = self.submit_order(items=result, omit_search=True, check_active_orders=True, contract_id=contract_id)
         return order_id, result.stac_ids
@@ -1052,12 +1339,134 @@ class CapellaConsoleClient:
         sorting:
          • sortby: List[str] - must be supported fields, e.g. ["+datetime"]
 
+        pagination:
+         • threaded: bool, fetch pages in parallel requests, default: False
+         • max_concurrency: int, max. number of parallel page requests if threaded, default: 8
+         • prefetch: bool, request next page while current page is processed if not threaded, default: True
+         • cache: SearchCache, serve repeated searches from on-disk cache, default: client's `search_cache`
+         • compact: bool, hold STAC items as CompactStacItem decoding properties/ assets once on first access, default: False
+
 
         Returns:
             StacSearchResult: STAC items matched
         """
+        kwargs.setdefault("cache", self._search_cache)
         search = StacSearch(session=self._sesh, **kwargs)
         return search.fetch_all()
 
     def catalog_search(self, **kwargs) -> StacSearchResult:
         return self.search(**kwargs)
+
+    def count(self, **kwargs) -> int | None:
+        """
+        number of STAC items matching search filters without fetching them
+
+        Args:
+            kwargs: search filters, see :py:meth:`search`
+
+        Returns:
+            int | None: number of STAC items matched, None if not reported by the STAC server
+        """
+        return StacSearch(session=self._sesh, **kwargs).count()
+
+    def facet_counts(
+        self, facet: str, buckets: list[Any] | None = None, interval: str | None = None, **kwargs
+    ) -> dict[Any, int | None]:
+        """
+        number of STAC items matching search filters per bucket, counted by concurrent count queries, e.g.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            client.facet_counts("product_type", collections=["capella-open-data"])
+            # {"SLC": 1034, "GEO": 1021, ...}
+
+            client.facet_counts("datetime", interval="month", datetime__gte="2024-01-01", datetime__lt="2024-07-01")
+            # {"2024-01-01T00:00:00.000Z": 312, "2024-02-01T00:00:00.000Z": 298, ...}
+
+        Args:
+            facet: field to count by, e.g. "product_type", "orbit_state" or "datetime"
+            buckets: values of `facet` to count (default: all values of enum fields) or time bin edges for "datetime"
+            interval: time bin size for "datetime", one of "day", "week", "month", "year" - requires
+                      datetime__gte and datetime__lt filters
+            kwargs: search filters, see :py:meth:`search`
+                    • max_concurrency: int, max. number of parallel count queries, default: 8
+
+        Returns:
+            dict[Any, int | None]: number of STAC items matched by bucket (time bins keyed by bin start), None if not reported
+        """
+        return facet_counts(self._sesh, facet, buckets=buckets, interval=interval, **kwargs)
+
+    def search_many_aoi(self, features, **kwargs) -> dict[str, list[str]]:
+        """
+        search STAC items intersecting each of many AOIs
+
+        queries are deduplicated, AOIs close to each other are searched by shared bbox queries and issued concurrently.
+        Matched STAC items are joined back to the AOIs locally.
+
+        Args:
+            features: GeoJSON FeatureCollection or list of Features of AOIs, identified by `id` or `properties.id`
+                      (position in `features` if neither is present), raises ValueError on duplicate ids
+            kwargs: search filters applied to every AOI, see :py:meth:`search` (except bbox and intersects)
+                    • max_concurrency: int, max. number of parallel queries, default: 8
+                    • merge_cell_size: float, grid cell size (degrees) of AOIs merged into shared bbox queries,
+                      default: 0.5, `None` disables merging
+
+        Returns:
+            dict[str, list[str]]: stac_ids intersecting AOI by AOI id
+        """
+        kwargs.setdefault("cache", self._search_cache)
+        return MultiAoiSearch(self._sesh, features, **kwargs).fetch_all()
+
+    def search_incremental(self, name: str, watermark_field: str = "datetime", **kwargs) -> StacSearchResult:
+        """
+        search only STAC items not returned by previous calls of the saved query `name`
+
+        The newest `watermark_field` value seen (and the ids of items with that value) is persisted along with the
+        query in `my-search-queries` (see `capella-console-wizard my-search-queries list`). Subsequent calls search
+        `watermark_field >= watermark` and drop the items already seen at the watermark, i.e. items sharing the same
+        value are not skipped if `limit` is reached within them. Changing the filters of `name` resets its watermark.
+
+        Note: the default watermark `datetime` is the acquisition time. Items published after a previous call but
+        acquired before its watermark (e.g. late processed or reprocessed products) are NOT returned.
+
+        Args:
+            name: identifier of the saved query
+            watermark_field: datetime-like field used as watermark, default: "datetime"
+            kwargs: search filters, see :py:meth:`search`
+
+        Returns:
+            StacSearchResult: STAC items added since the previous call
+        """
+        if watermark_field not in STAC_SUPPORTED_QUERY_FIELDS:
+            raise ValueError(f"watermark_field {watermark_field} not supported")
+
+        watermark = get_watermark(name, kwargs)
+        seen_ids = set(get_boundary_ids(name)) if watermark is not None else set()
+
+        search_kwargs = dict(kwargs)
+        # oldest first in order to resume from watermark if more than `limit` items are new
+        search_kwargs.setdefault("sortby", f"+{watermark_field}")
+        limit = search_kwargs.get("limit", CATALOG_DEFAULT_LIMIT)
+        if watermark is not None:
+            logger.info(f"searching {watermark_field} >= {watermark} for saved query '{name}'")
+            search_kwargs[f"{watermark_field}__gte"] = watermark
+            # items seen at the watermark are returned again
+            search_kwargs["limit"] = limit + len(seen_ids)
+
+        result = self.search(**search_kwargs)
+        if seen_ids:
+            result._features = [item for item in result._features if item["id"] not in seen_ids]
+            result._reset_indexes()
+            result._truncate(limit=limit)
+
+        newest = get_newest_value(result, watermark_field)
+        if newest is None:
+            newest, boundary_ids = watermark, sorted(seen_ids)
+        else:
+            boundary_ids = get_ids_with_value(result, watermark_field, newest)
+            if newest == watermark:
+                boundary_ids = sorted(seen_ids.union(boundary_ids))
+
+        save_watermark(name, kwargs, newest, boundary_ids=boundary_ids)
+        return result
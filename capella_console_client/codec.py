@@ -0,0 +1,93 @@
+"""JSON codec used for API request bodies and responses - uses orjson or msgspec if installed"""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from capella_console_client.logconf import logger
+
+# order of preference if no codec is requested explicitly
+FAST_JSON_CODECS = ("orjson", "msgspec")
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _with_stdlib_fallback(fast_dumps: Callable[[Any], bytes]) -> Callable[[Any], bytes]:
+    def dumps(obj: Any) -> bytes:
+        try:
+            return fast_dumps(obj)
+        except (TypeError, ValueError):
+            # e.g. integers exceeding 64 bit
+            return _stdlib_dumps(obj)
+
+    return dumps
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec(name="json", loads=json.loads, dumps=_stdlib_dumps)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return JsonCodec(name="orjson", loads=orjson.loads, dumps=_with_stdlib_fallback(dumps))
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JsonCodec(name="msgspec", loads=decoder.decode, dumps=_with_stdlib_fallback(encoder.encode))
+
+
+CODEC_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def get_json_codec(codec: JsonCodec | str | None = None) -> JsonCodec:
+    """
+    resolve JSON codec
+
+    Args:
+        codec: JsonCodec instance, codec name (one of "orjson", "msgspec", "json") or None for fastest installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    if codec is not None:
+        if codec not in CODEC_FACTORIES:
+            raise ValueError(f"unknown json codec {codec} - supported: {', '.join(CODEC_FACTORIES)}")
+        try:
+            return CODEC_FACTORIES[codec]()
+        except ImportError:
+            raise ImportError(
+                f"json codec '{codec}' requires the '{codec}' package. "
+                "Install it with 'pip install capella-console-client[speedups]'."
+            ) from None
+
+    for name in FAST_JSON_CODECS:
+        try:
+            fast_codec = CODEC_FACTORIES[name]()
+        except ImportError:
+            continue
+        logger.debug(f"using {name} json codec")
+        return fast_codec
+
+    return _stdlib_codec()
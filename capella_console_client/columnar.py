@@ -0,0 +1,377 @@
+"""columnar export and filtering of STAC items (export requires optional numpy / pyarrow dependencies)"""
+
+import importlib
+import operator
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from dateutil.parser import parse
+
+from capella_console_client.config import (
+    CATALOG_DEFAULT_LIMIT,
+    CATALOG_STAC_MAX_ITEM_RETURN,
+    QUERY_OPERATORS,
+    STAC_DATETIME_FIELDS,
+    STAC_PREFIXED_BY_QUERY_FIELDS,
+    STAC_ROOT_LEVEL_GROUPBY_FIELDS,
+    STAC_SUPPORTED_QUERY_FIELDS,
+)
+from capella_console_client.logconf import logger
+
+# search filters evaluated against root level item fields
+ROOT_FILTER_FIELDS = {"ids": "id", "collections": "collection"}
+
+# spatial search filters - local evaluation only approximates server side geometry intersection
+SPATIAL_FILTER_FIELDS = {"bbox", "intersects"}
+
+COMPARISON_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def _require(module_name: str):
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise ImportError(
+            f"columnar export requires the '{module_name.split('.')[0]}' package. "
+            "Install it with 'pip install capella-console-client[columnar]'."
+        ) from None
+
+
+def _get_field_values(features: list[dict[str, Any]], field: str) -> list[Any]:
+    if field in STAC_ROOT_LEVEL_GROUPBY_FIELDS:
+        return [feature.get(field) for feature in features]
+
+    target_field = STAC_PREFIXED_BY_QUERY_FIELDS.get(field, field)
+    return [feature.get("properties", {}).get(target_field) for feature in features]
+
+
+def _get_default_fields(features: list[dict[str, Any]]) -> list[str]:
+    """root level fields followed by all (unprefixed) query and datetime fields contained in any item"""
+    present: set[str] = set()
+    for feature in features:
+        present.update(feature.get("properties", {}).keys())
+
+    property_fields = sorted(STAC_SUPPORTED_QUERY_FIELDS | STAC_DATETIME_FIELDS)
+    return [
+        *sorted(STAC_ROOT_LEVEL_GROUPBY_FIELDS),
+        *(f for f in property_fields if STAC_PREFIXED_BY_QUERY_FIELDS.get(f, f) in present),
+    ]
+
+
+def _optional_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _parse_utc(value: str | datetime | None) -> datetime | None:
+    if not value:
+        return None
+    parsed = value if isinstance(value, datetime) else parse(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _is_numeric(values: list[Any]) -> bool:
+    non_null = [v for v in values if v is not None]
+    return bool(non_null) and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in non_null)
+
+
+def to_numpy(features: list[dict[str, Any]], fields: list[str] | None = None) -> dict[str, Any]:
+    np = _require("numpy")
+    fields = fields or _get_default_fields(features)
+
+    arrays = {}
+    for field in fields:
+        values = _get_field_values(features, field)
+
+        if field in STAC_DATETIME_FIELDS:
+            parsed = [_parse_utc(v) for v in values]
+            arrays[field] = np.array(
+                [p.replace(tzinfo=None) if p is not None else "NaT" for p in parsed], dtype="datetime64[us]"
+            )
+        elif _is_numeric(values):
+            is_int = None not in values and all(isinstance(v, int) for v in values)
+            arrays[field] = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.int64 if is_int else np.float64
+            )
+        else:
+            # element wise assignment keeps list values (e.g. polarizations) from being broadcast
+            arr = np.empty(len(values), dtype=object)
+            for idx, value in enumerate(values):
+                arr[idx] = value
+            arrays[field] = arr
+
+    return arrays
+
+
+def to_arrow(features: list[dict[str, Any]], fields: list[str] | None = None):
+    pa = _require("pyarrow")
+    fields = fields or _get_default_fields(features)
+
+    columns = {}
+    for field in fields:
+        values = _get_field_values(features, field)
+
+        if field in STAC_DATETIME_FIELDS:
+            columns[field] = pa.array([_parse_utc(v) for v in values], type=pa.timestamp("us", tz="UTC"))
+            continue
+
+        try:
+            columns[field] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # mixed types
+            columns[field] = pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+    return pa.table(columns)
+
+
+def to_parquet(features: list[dict[str, Any]], path: Path | str, fields: list[str] | None = None) -> Path:
+    pq = _require("pyarrow.parquet")
+    pq.write_table(to_arrow(features, fields), str(path))
+    return Path(path)
+
+
+def build_filter_column(features: list[dict[str, Any]], field: str) -> Any:
+    """
+    column of `field` values used by `filter_features`
+
+    numpy array for datetime and numeric fields if numpy is installed, list of values otherwise
+    """
+    values = _get_field_values(features, ROOT_FILTER_FIELDS.get(field, field))
+    if field in STAC_DATETIME_FIELDS:
+        values = [_parse_utc(v) for v in values]
+
+    np = _optional_numpy()
+    if np is None:
+        return values
+
+    if field in STAC_DATETIME_FIELDS:
+        return np.array([v.replace(tzinfo=None) if v is not None else "NaT" for v in values], dtype="datetime64[us]")
+    if _is_numeric(values):
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return values
+
+
+def _to_column_value(column: Any, field: str, value: Any) -> Any:
+    if field not in STAC_DATETIME_FIELDS:
+        return value
+
+    parsed = _parse_utc(value)
+    np = _optional_numpy()
+    if np is not None and isinstance(column, np.ndarray):
+        return np.datetime64(parsed.replace(tzinfo=None), "us")  # type: ignore[union-attr]
+    return parsed
+
+
+def _matches_any(item_value: Any, values: list[Any]) -> bool:
+    # list valued properties (e.g. polarizations) match if any of their values match
+    if isinstance(item_value, list):
+        return any(v in values for v in item_value)
+    return item_value in values
+
+
+def _compare(compare: Callable[[Any, Any], bool], item_value: Any, value: Any) -> bool:
+    if item_value is None:
+        return False
+    try:
+        return compare(item_value, value)
+    except TypeError:
+        return False
+
+
+def _evaluate(column: Any, op: str, value: Any) -> Any:
+    np = _optional_numpy()
+    if np is not None and isinstance(column, np.ndarray):
+        if op == "in":
+            return np.isin(column, value)
+        if op == "eq":
+            return column == value
+        return COMPARISON_OPERATORS[op](column, value)
+
+    if op == "in":
+        return [_matches_any(v, value) for v in column]
+    if op == "eq":
+        return [v == value or (isinstance(v, list) and value in v) for v in column]
+    compare = COMPARISON_OPERATORS[op]
+    return [_compare(compare, v, value) for v in column]
+
+
+def _split_filter_name(filter_name: str) -> tuple[str, str]:
+    parts = filter_name.split("__")
+    return (parts[0], parts[1]) if len(parts) == 2 else (parts[0], "eq")
+
+
+def _bbox_2d(bbox: list[float]) -> tuple[float, float, float, float]:
+    """(min_x, min_y, max_x, max_y) of 2D or 3D ([min_x, min_y, min_z, max_x, max_y, max_z]) bbox"""
+    if len(bbox) == 6:
+        return bbox[0], bbox[1], bbox[3], bbox[4]
+    return bbox[0], bbox[1], bbox[2], bbox[3]
+
+
+def _bbox_intersects(item_bbox: list[float] | None, bbox: list[float]) -> bool:
+    if not item_bbox:
+        return False
+    min_x, min_y, max_x, max_y = _bbox_2d(item_bbox)
+    bbox_min_x, bbox_min_y, bbox_max_x, bbox_max_y = _bbox_2d(bbox)
+    return not (min_x > bbox_max_x or max_x < bbox_min_x or min_y > bbox_max_y or max_y < bbox_min_y)
+
+
+def filter_features(
+    features: list[dict[str, Any]],
+    filters: dict[str, Any],
+    get_column: Callable[[str], Any] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    features matching all `filters` (same `field__op` syntax as catalog search)
+
+    Args:
+        features: STAC items
+        filters: e.g. {"incidence_angle__gt": 30, "orbit_state": "ascending", "product_type__in": ["SLC", "GEO"]}
+        get_column: callable returning (cached) column of field, default: `build_filter_column`
+    """
+    get_column = get_column or partial(build_filter_column, features)
+    np = _optional_numpy()
+
+    mask: Any = np.ones(len(features), dtype=bool) if np is not None else [True] * len(features)
+    limit = None
+
+    for filter_name, value in filters.items():
+        field, op = _split_filter_name(filter_name)
+
+        if op not in QUERY_OPERATORS:
+            logger.warning(f"operator {op} not supported ... omitting")
+            continue
+
+        if field == "limit":
+            limit = value
+            continue
+
+        if field == "bbox":
+            cur_mask: Any = [_bbox_intersects(f.get("bbox"), value) for f in features]
+        elif field in STAC_SUPPORTED_QUERY_FIELDS or field in ROOT_FILTER_FIELDS:
+            if isinstance(value, (list, tuple, set)):
+                op = "in"
+                value = list(value)
+            elif op == "in" or field in ROOT_FILTER_FIELDS:
+                op = "in"
+                value = [value]
+
+            column = get_column(field)
+            if op == "in":
+                value = [_to_column_value(column, field, v) for v in value]
+            else:
+                value = _to_column_value(column, field, value)
+            cur_mask = _evaluate(column, op, value)
+        else:
+            logger.warning(f"filter {field} not supported ... omitting")
+            continue
+
+        if np is not None:
+            mask &= np.asarray(cur_mask, dtype=bool)
+        else:
+            mask = [a and b for a, b in zip(mask, cur_mask)]
+
+    indices = np.flatnonzero(mask).tolist() if np is not None else [idx for idx, keep in enumerate(mask) if keep]
+    if limit is not None:
+        indices = indices[:limit]
+    return [features[idx] for idx in indices]
+
+
+def _get_constraints(filters: dict[str, Any]) -> dict[str, list[tuple[str, Any]]]:
+    """(operator, value) constraints by field, list values normalized to `in` and datetimes parsed"""
+    constraints: dict[str, list[tuple[str, Any]]] = defaultdict(list)
+    for filter_name, value in filters.items():
+        field, op = _split_filter_name(filter_name)
+        if field == "limit" or field in SPATIAL_FILTER_FIELDS:
+            continue
+
+        if isinstance(value, (list, tuple, set)):
+            op, value = "in", list(value)
+        elif op == "in" or field in ROOT_FILTER_FIELDS:
+            op, value = "in", [value]
+
+        if field in STAC_DATETIME_FIELDS:
+            value = [_parse_utc(v) for v in value] if op == "in" else _parse_utc(value)
+        constraints[field].append((op, value))
+    return constraints
+
+
+def _satisfies(value: Any, op: str, constraint_value: Any) -> bool:
+    if op == "eq":
+        return bool(value == constraint_value)
+    if op == "in":
+        return value in constraint_value
+    return _compare(COMPARISON_OPERATORS[op], value, constraint_value)
+
+
+def _implies(new: tuple[str, Any], prev: tuple[str, Any]) -> bool:
+    """True if every value matching constraint `new` also matches constraint `prev`"""
+    new_op, new_value = new
+    prev_op, prev_value = prev
+
+    if new_op == "eq":
+        return _satisfies(new_value, prev_op, prev_value)
+    if new_op == "in":
+        return all(_satisfies(v, prev_op, prev_value) for v in new_value)
+
+    for bounds in (("gt", "gte"), ("lt", "lte")):
+        if new_op in bounds and prev_op in bounds:
+            # equal bounds suffice unless new bound is inclusive and previous one exclusive
+            allow_equal = new_op in ("gt", "lt") or prev_op in ("gte", "lte")
+            compare = COMPARISON_OPERATORS[bounds[1]] if allow_equal else COMPARISON_OPERATORS[bounds[0]]
+            return _compare(compare, new_value, prev_value)
+    return False
+
+
+def is_narrower_search(prev_filters: dict[str, Any], filters: dict[str, Any], prev_result_count: int) -> bool:
+    """
+    True if search `filters` can be answered from the result of search `prev_filters`
+
+    * requires every previous constraint to be implied by the new constraints (added filters, tighter ranges, subsets)
+    * spatial filters, sortby and filters not supported locally need to be unchanged
+    * a previous result truncated by its limit or the STAC server's max. item return can only answer the same filters
+      with a lower or equal limit
+    """
+    # previous result is complete only if it returned less items than requested and than the server returns at most
+    prev_limit = min(prev_filters.get("limit", CATALOG_DEFAULT_LIMIT), CATALOG_STAC_MAX_ITEM_RETURN)
+    limit = filters.get("limit", CATALOG_DEFAULT_LIMIT)
+
+    local_fields = STAC_SUPPORTED_QUERY_FIELDS | set(ROOT_FILTER_FIELDS)
+    for filter_name in prev_filters.keys() | filters.keys():
+        field, _ = _split_filter_name(filter_name)
+        if field != "limit" and field not in local_fields and prev_filters.get(filter_name) != filters.get(filter_name):
+            return False
+
+    prev_constraints = _get_constraints(prev_filters)
+    constraints = _get_constraints(filters)
+
+    if prev_result_count >= prev_limit:
+        return prev_constraints == constraints and limit <= prev_result_count
+
+    return all(
+        any(_implies(new, prev) for new in constraints.get(field, []))
+        for field, field_constraints in prev_constraints.items()
+        for prev in field_constraints
+    )
+
+
+def get_narrowing_filters(prev_filters: dict[str, Any], filters: dict[str, Any]) -> dict[str, Any]:
+    """filters of narrower search `filters` not already applied by search `prev_filters`"""
+    narrowing = {k: v for k, v in filters.items() if k not in prev_filters or prev_filters[k] != v}
+    narrowing["limit"] = filters.get("limit", CATALOG_DEFAULT_LIMIT)
+    for field in SPATIAL_FILTER_FIELDS:
+        narrowing.pop(field, None)
+    return narrowing
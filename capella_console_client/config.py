@@ -1,3 +1,6 @@
+from datetime import timedelta
+from pathlib import Path
+
 CONSOLE_API_URL = "https://api.capellaspace.com"
 CAPELLA_API_KEY_ENV = "CAPELLA_API_KEY"
 DEFAULT_TIMEOUT = 60
@@ -6,15 +9,66 @@ DEFAULT_TIMEOUT = 60
 CATALOG_MAX_PAGE_SIZE = 900
 CATALOG_DEFAULT_LIMIT = 500
 CATALOG_STAC_MAX_ITEM_RETURN = 10000
+CATALOG_MAX_CONCURRENCY = 8  # protection from getting 429ed
+CATALOG_PAGE_MAX_ATTEMPTS = 4
+# max. number of ids per catalog search of chunked ids lookups
+CATALOG_IDS_CHUNK_SIZE = 100
+# AOIs with bbox center within same grid cell (degrees) are searched by a shared bbox query
+AOI_MERGE_CELL_SIZE = 0.5
+
+# opt-in catalog search cache
+SEARCH_CACHE_DEFAULT_PATH = Path.home() / ".cache" / "capella-console-client" / "search-cache.sqlite"
+SEARCH_CACHE_DEFAULT_TTL = 3600  # seconds
+SEARCH_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# local mirror of tasking/ repeat requests
+TASK_MIRROR_DEFAULT_PATH = Path.home() / ".cache" / "capella-console-client" / "tasking-requests.sqlite"
+
+# saved search queries (shared with capella-console-wizard)
+CONSOLE_WIZARD_ROOT = Path.home() / ".capella-console-wizard"
+MY_SEARCH_QUERIES_PATH = CONSOLE_WIZARD_ROOT / "my-search-queries.json"
 
 # tasking
 TR_SEARCH_DEFAULT_PAGE_SIZE = 250
 TR_MAX_CONCURRENCY = 8  # protection from getting 429ed
+# max. concurrent requests per bulk call (cancel, update, collects), intentionally capped within the shared bulk
+# concurrency budget (see below) so that a single bulk call doesn't claim the entire budget
 TR_CANCEL_MAX_CONCURRENCY = 10
 TR_UPDATE_MAX_CONCURRENCY = 10
+TR_COLLECTS_MAX_CONCURRENCY = 10
 RR_CANCEL_MAX_CONCURRENCY = 10
 RR_UPDATE_MAX_CONCURRENCY = 10
 
+# concurrency budget of API requests shared by bulk operations (cancel, update, tasking/ repeat request pagination),
+# adapted by AIMD: additive increase per successful request, multiplicative decrease on 429
+BULK_INITIAL_CONCURRENCY = 8
+BULK_MAX_CONCURRENCY = 16
+BULK_AIMD_DECREASE_FACTOR = 0.5
+BULK_AIMD_COOLDOWN = 1.0  # seconds between decreases
+
+# bulk creation/ updates of tasking/ repeat requests
+BULK_CREATE_MAX_CONCURRENCY = 8
+BULK_CREATE_RATE = 5  # requests per second
+BULK_UPDATE_RATE = 10  # requests per second
+BULK_MAX_ATTEMPTS = 4
+# existing tasking requests with same idempotency key (customAttribute1) submitted within lookback are not resubmitted
+BULK_CREATE_IDEMPOTENCY_LOOKBACK = timedelta(days=7)
+
+# watch_tasking_requests polling (seconds), backoff resets on status change
+TR_WATCH_MIN_INTERVAL = 30
+TR_WATCH_MAX_INTERVAL = 30 * 60
+TR_WATCH_BACKOFF_FACTOR = 2
+# consecutive polls not finding a tasking request before it is no longer watched
+TR_WATCH_MAX_NOT_FOUND = 3
+
+# download_on_completion pipeline
+PIPELINE_ORDER_MAX_CONCURRENCY = 4
+PIPELINE_DOWNLOAD_MAX_CONCURRENCY = 2
+PIPELINE_STATE_DEFAULT_PATH = Path.home() / ".cache" / "capella-console-client" / "download-pipeline.json"
+
+# transient API errors worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 
 STAC_SUPPORTED_ROOT_FIELDS = {
     "bbox",
@@ -120,6 +174,9 @@ STAC_PREFIXED_BY_QUERY_FIELDS = {
 
 STAC_ROOT_LEVEL_GROUPBY_FIELDS = {"id", "collection"}
 
+# UTC datetime properties exported as datetime64 / timestamp columns
+STAC_DATETIME_FIELDS = {"datetime", "start_datetime", "end_datetime"}
+
 STAC_ALL_SUPPORTED_GROUPBY_FIELDS = STAC_ROOT_LEVEL_GROUPBY_FIELDS | STAC_SUPPORTED_QUERY_FIELDS
 UNKNOWN_GROUPBY_FIELD = "unknown"
 
@@ -217,6 +274,37 @@ RR_FILTERS_BY_QUERY_FIELDS = {
 
 SUPPORTED_RR_SEARCH_QUERY_FIELDS = set(RR_FILTERS_BY_QUERY_FIELDS.keys())
 
+# client side sortby of tasking/ repeat request searches, other fields are treated as (dotted) property names
+TR_SORTBY_FIELDS = {
+    "collection_tier": "collectionTier",
+    "collection_type": "collectionType",
+    "last_status_time": "lastStatusTime",
+    "status": "lastStatusCode",
+    "submission_time": "submissionTime",
+    "window_close": "windowClose",
+    "window_open": "windowOpen",
+}
+
+RR_SORTBY_FIELDS = {
+    "collection_tier": "collectionTier",
+    "collection_type": "collectionType",
+    "last_status_time": "lastStatusTime",
+    "repeat_end": "repetitionProperties.repeatEnd",
+    "repeat_start": "repetitionProperties.repeatStart",
+    "repetition_interval": "repetitionProperties.repetitionInterval",
+    "status": "lastStatusCode",
+    "submission_time": "submissionTime",
+}
+
+TASK_REPEAT_SORTBY_DATETIME_PROPERTIES = {
+    "lastStatusTime",
+    "repetitionProperties.repeatEnd",
+    "repetitionProperties.repeatStart",
+    "submissionTime",
+    "windowClose",
+    "windowOpen",
+}
+
 
 RR_SUPPORTED_GROUPBY_FIELDS = {
     "archiveHoldback",
@@ -0,0 +1,212 @@
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+import httpx
+
+from capella_console_client.config import (
+    BULK_AIMD_COOLDOWN,
+    BULK_AIMD_DECREASE_FACTOR,
+    BULK_INITIAL_CONCURRENCY,
+    BULK_MAX_ATTEMPTS,
+    BULK_MAX_CONCURRENCY,
+)
+from capella_console_client.exceptions import CapellaConsoleClientError
+from capella_console_client.hooks import is_transient_error
+from capella_console_client.logconf import logger
+from capella_console_client.rate_limit import RateLimiter, _retrying
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    thread safe concurrency limit adapted by AIMD (additive increase, multiplicative decrease)
+
+    * every successful request increases the limit by 1 / limit, i.e. by ~1 per round of `limit` requests
+    * 429 (rate limited) responses multiply the limit by `decrease_factor`, at most once per `cooldown` (seconds)
+      as requests in flight at the same time are typically rate limited together. :py:class:`BulkExecutor` reports
+      connection errors (timeouts, resets) as 429
+
+    Args:
+        initial: initial limit
+        max_limit: upper bound of limit
+        min_limit: lower bound of limit
+        decrease_factor: multiplicative decrease on 429
+        cooldown: min. seconds between decreases
+    """
+
+    def __init__(
+        self,
+        initial: int = BULK_INITIAL_CONCURRENCY,
+        max_limit: int = BULK_MAX_CONCURRENCY,
+        min_limit: int = 1,
+        decrease_factor: float = BULK_AIMD_DECREASE_FACTOR,
+        cooldown: float = BULK_AIMD_COOLDOWN,
+    ):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, status_code: int | None = None) -> None:
+        """release slot, `status_code` of failed request or None if succeeded"""
+        with self._cond:
+            self._in_flight -= 1
+            if status_code is None:
+                self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+            elif status_code == 429:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self._limit * self.decrease_factor, self.min_limit)
+                    self._last_decrease = now
+                    logger.info(f"rate limited ... reducing concurrency to {self.limit}")
+            self._cond.notify_all()
+
+
+# concurrency budget shared by all bulk executors
+GLOBAL_CONCURRENCY_LIMIT = AdaptiveConcurrencyLimit()
+
+# set while thread holds budget slot, i.e. runs call of bulk executor
+_worker_state = threading.local()
+
+
+def _in_worker() -> bool:
+    return getattr(_worker_state, "active", False)
+
+
+def _get_error_result(exc: Exception) -> dict[str, Any]:
+    if isinstance(exc, CapellaConsoleClientError) and exc.response is not None:
+        try:
+            return {"success": False, **exc.response.json()}
+        except ValueError:
+            pass
+    return {"success": False, "message": str(exc)}
+
+
+def _get_result(get: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    try:
+        return get()
+    except (CapellaConsoleClientError, httpx.TransportError) as exc:
+        return _get_error_result(exc)
+
+
+class BulkExecutor:
+    """
+    thread pool of API requests sharing the adaptive concurrency budget `limit`
+
+    calls are retried on 429, 5xx responses and connection errors (max. `max_attempts`), the budget slot is released
+    while waiting. calls nested in a call of a bulk executor (`call`, `submit`, `map`) run inline on the budget slot
+    already held, waiting for another slot of the shared budget could deadlock
+
+    Args:
+        max_workers: max. concurrent calls of this executor (capped by `limit`), bounds the share of the budget
+                     claimed by a single bulk operation
+        limit: shared concurrency budget, default: budget shared by all bulk executors
+        max_attempts: max. attempts per call
+        rate_limiter: rate limit of calls, acquired before budget slot
+    """
+
+    def __init__(
+        self,
+        max_workers: int = BULK_MAX_CONCURRENCY,
+        limit: AdaptiveConcurrencyLimit | None = None,
+        max_attempts: int = BULK_MAX_ATTEMPTS,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self.max_workers = max(max_workers, 1)
+        self.limit = limit or GLOBAL_CONCURRENCY_LIMIT
+        self.max_attempts = max_attempts
+        self.rate_limiter = rate_limiter
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> "BulkExecutor":
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        assert self._executor is not None
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """call `fn` within budget (blocking), retried on 429, 5xx responses and connection errors"""
+        if _in_worker():
+            return _retrying(self.max_attempts, predicate=is_transient_error)(fn, *args, **kwargs)
+
+        def _attempt() -> T:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            self.limit.acquire()
+            _worker_state.active = True
+            status_code = None
+            try:
+                return fn(*args, **kwargs)
+            except CapellaConsoleClientError as exc:
+                status_code = exc.response.status_code if exc.response is not None else 0
+                raise
+            except httpx.TransportError:
+                # no response (timeout, connection reset), congestion signal like rate limiting
+                status_code = 429
+                raise
+            except Exception:
+                status_code = 0
+                raise
+            finally:
+                _worker_state.active = False
+                self.limit.release(status_code)
+
+        return _retrying(self.max_attempts, predicate=is_transient_error)(_attempt)
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        if _in_worker():
+            future: Future[T] = Future()
+            try:
+                future.set_result(self.call(fn, *args, **kwargs))
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+
+        assert self._executor is not None, "submit requires BulkExecutor context"
+        return self._executor.submit(self.call, fn, *args, **kwargs)
+
+    def map(
+        self, fn: Callable[..., dict[str, Any]], kwargs_by_key: Mapping[K, dict[str, Any]]
+    ) -> dict[K, dict[str, Any]]:
+        """
+        call `fn(**kwargs)` per key
+
+        Returns:
+            Dict[K, Dict[str, Any]]: result of `fn` by key, ``{"success": False, ...}`` (API error response or
+            connection error message) on failure
+        """
+        if not kwargs_by_key:
+            return {}
+
+        if _in_worker():
+            return {key: _get_result(partial(self.call, fn, **kwargs)) for key, kwargs in kwargs_by_key.items()}
+
+        with BulkExecutor(
+            min(self.max_workers, len(kwargs_by_key)), self.limit, self.max_attempts, self.rate_limiter
+        ) as executor:
+            futures = {key: executor.submit(fn, **kwargs) for key, kwargs in kwargs_by_key.items()}
+            return {key: _get_result(fut.result) for key, fut in futures.items()}
@@ -2,7 +2,9 @@ from dataclasses import dataclass
 
 import httpx
 
+from capella_console_client.config import RETRYABLE_STATUS_CODES
 from capella_console_client.exceptions import (
+    CapellaConsoleClientError,
     handle_error_response_and_raise,
 )
 from capella_console_client.logconf import logger
@@ -50,3 +52,16 @@ def log_retry_attempt(retry_state) -> None:
     attempt_number = retry_state.attempt_number
     sleep_time = retry_state.next_action.sleep
     logger.info(f"Attempt #{attempt_number}, retrying in {sleep_time * 1000:.0f} ms")
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Tenacity predicate: retry on 429 (rate limited) and 5xx responses"""
+    if not isinstance(exc, (CapellaConsoleClientError, httpx.HTTPStatusError)):
+        return False
+    response = exc.response
+    return response is not None and response.status_code in RETRYABLE_STATUS_CODES
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Tenacity predicate: retry on 429, 5xx responses and connection errors (timeouts, resets)"""
+    return is_retryable_error(exc) or isinstance(exc, httpx.TransportError)
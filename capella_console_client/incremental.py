@@ -0,0 +1,83 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from capella_console_client.config import MY_SEARCH_QUERIES_PATH, STAC_PREFIXED_BY_QUERY_FIELDS
+from capella_console_client.logconf import logger
+
+
+def _load_saved_queries(path: Path | None = None) -> dict[str, Any]:
+    path = path or MY_SEARCH_QUERIES_PATH
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _to_jsonable(search_kwargs: dict[str, Any]) -> dict[str, Any]:
+    return json.loads(json.dumps(search_kwargs, default=str))
+
+
+def get_watermark(name: str, search_kwargs: dict[str, Any], path: Path | None = None) -> str | None:
+    """
+    newest watermark seen by previous run of saved query `name`
+
+    watermark is discarded if the saved query filters differ from `search_kwargs`
+    """
+    record = _load_saved_queries(path).get(name)
+    if not record or "watermark" not in record:
+        return None
+
+    if record["data"] != _to_jsonable(search_kwargs):
+        logger.warning(f"filters of saved query '{name}' changed ... discarding watermark {record['watermark']}")
+        return None
+
+    watermark: str = record["watermark"]
+    return watermark
+
+
+def get_boundary_ids(name: str, path: Path | None = None) -> list[str]:
+    """ids of items seen by previous run of saved query `name` whose value equals its watermark"""
+    record = _load_saved_queries(path).get(name) or {}
+    boundary_ids: list[str] = record.get("watermark_ids", [])
+    return boundary_ids
+
+
+def save_watermark(
+    name: str,
+    search_kwargs: dict[str, Any],
+    watermark: str | None,
+    path: Path | None = None,
+    boundary_ids: list[str] | None = None,
+) -> None:
+    """persist query, its watermark and ids seen at the watermark in my-search-queries (same format as capella-console-wizard)"""
+    path = path or MY_SEARCH_QUERIES_PATH
+    saved = _load_saved_queries(path)
+    now = str(datetime.now())[:-7]
+
+    record = saved.get(name, {"created_at": now})
+    record.update({"data": _to_jsonable(search_kwargs), "updated_at": now})
+    if watermark is None:
+        record.pop("watermark", None)
+        record.pop("watermark_ids", None)
+    else:
+        record["watermark"] = watermark
+        record["watermark_ids"] = sorted(boundary_ids or [])
+
+    saved[name] = record
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(saved))
+
+
+def get_newest_value(items, field: str) -> str | None:
+    """max value of `field` across `items`, e.g. newest datetime"""
+    target_field = STAC_PREFIXED_BY_QUERY_FIELDS.get(field, field)
+    values = [item["properties"][target_field] for item in items if item.get("properties", {}).get(target_field)]
+    return max(values, default=None)
+
+
+def get_ids_with_value(items, field: str, value: str) -> list[str]:
+    """ids of `items` whose `field` equals `value`"""
+    target_field = STAC_PREFIXED_BY_QUERY_FIELDS.get(field, field)
+    return [item["id"] for item in items if item.get("properties", {}).get(target_field) == value]
@@ -30,7 +30,7 @@ def get_non_expired_orders(session: CapellaConsoleSession) -> list[dict[str, Any
     params = {"customerId": session.customer_id}
     res = session.get("/orders", params=params)
 
-    all_orders = res.json()
+    all_orders = session.decode_json(res)
 
     ordered_by_exp_date = sorted(all_orders, key=lambda x: x["expirationDate"])
     now = datetime.now(tz=timezone.utc)
@@ -0,0 +1,206 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from capella_console_client.config import (
+    PIPELINE_DOWNLOAD_MAX_CONCURRENCY,
+    PIPELINE_ORDER_MAX_CONCURRENCY,
+    PIPELINE_STATE_DEFAULT_PATH,
+)
+from capella_console_client.hooks import is_transient_error
+from capella_console_client.logconf import logger
+from capella_console_client.task_watch import TR_TERMINAL_STATUSES, TaskingRequestWatcher
+
+if TYPE_CHECKING:
+    from capella_console_client.client import CapellaConsoleClient
+
+# pipeline stages of tasking request
+STAGE_WATCHING = "watching"
+STAGE_ORDERING = "ordering"
+STAGE_DOWNLOADING = "downloading"
+STAGE_DONE = "done"
+STAGE_FAILED = "failed"
+
+
+def _load_state(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        state: dict[str, dict[str, Any]] = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return state
+
+
+class TaskDownloadPipeline:
+    """
+    order and download products of tasking requests once completed, see :py:meth:`CapellaConsoleClient.download_on_completion`
+
+    stages (overlapping across tasking requests):
+
+    1. watching: poll status of tasking requests (:py:class:`TaskingRequestWatcher`)
+    2. ordering: collects of completed task, order of their products (max. `order_concurrency` in parallel)
+    3. downloading: presigned items of order, download of products (max. `download_concurrency` in parallel)
+
+    progress of every tasking request is persisted to `state_path` after each stage, rerunning the pipeline with the
+    same `state_path` resumes from the last completed stage (existing downloads are resumed/ skipped)
+
+    transient errors (429, 5xx, connection errors) are recorded as `error` of the current stage, which is retried on
+    the next run; other errors fail the tasking request. transient errors while watching are retried by the watcher
+    """
+
+    def __init__(
+        self,
+        client: "CapellaConsoleClient",
+        tasking_request_ids: list[str],
+        local_dir: Path | str,
+        state_path: Path | str = PIPELINE_STATE_DEFAULT_PATH,
+        order_concurrency: int = PIPELINE_ORDER_MAX_CONCURRENCY,
+        download_concurrency: int = PIPELINE_DOWNLOAD_MAX_CONCURRENCY,
+        product_types: list[str] | None = None,
+        contract_id: str | None = None,
+        **download_kwargs: Any,
+    ):
+        self.client = client
+        self.tasking_request_ids = list(dict.fromkeys(tasking_request_ids))
+        self.local_dir = local_dir
+        self.state_path = Path(state_path)
+        self.order_concurrency = order_concurrency
+        self.download_concurrency = download_concurrency
+        self.product_types = product_types
+        self.contract_id = contract_id
+        self.download_kwargs = download_kwargs
+
+        self._lock = threading.Lock()
+        self._state = _load_state(self.state_path)
+        self._order_executor: ThreadPoolExecutor | None = None
+        self._download_executor: ThreadPoolExecutor | None = None
+
+    def _update(self, tasking_request_id: str, **values: Any) -> None:
+        with self._lock:
+            state = self._state.setdefault(tasking_request_id, {})
+            if values.get("stage", STAGE_FAILED) != STAGE_FAILED:
+                # error of previous attempt resolved
+                state.pop("error", None)
+            state.update(values)
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._state))
+            tmp_path.replace(self.state_path)
+
+    def _get_stage(self, tasking_request_id: str) -> str:
+        stage: str = self._state.get(tasking_request_id, {}).get("stage", STAGE_WATCHING)
+        return stage
+
+    def run(self, timeout: float | None = None) -> dict[str, dict[str, Any]]:
+        """
+        run pipeline until all tasking requests are done/ failed or watching exceeded `timeout` (seconds)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: pipeline state by tasking request id, e.g.
+
+            .. highlight:: python
+            .. code-block:: python
+
+                {
+                    "<tasking_request_id>": {
+                        "stage": "done",
+                        "order_id": ...,
+                        "stac_ids": [...],
+                        "paths": {"<stac_id>": {"<asset_type>": "<path-to-asset>"}},
+                    }
+                }
+        """
+        self._order_executor = ThreadPoolExecutor(max_workers=self.order_concurrency)
+        self._download_executor = ThreadPoolExecutor(max_workers=self.download_concurrency)
+
+        try:
+            to_watch = []
+            for tr_id in self.tasking_request_ids:
+                stage = self._get_stage(tr_id)
+                if stage in (STAGE_DONE, STAGE_FAILED):
+                    continue
+                if stage == STAGE_DOWNLOADING:
+                    self._download_executor.submit(self._download, tr_id)
+                elif stage == STAGE_ORDERING:
+                    self._order_executor.submit(self._order, tr_id)
+                else:
+                    to_watch.append(tr_id)
+
+            if to_watch:
+                logger.info(f"watching {len(to_watch)} tasking requests")
+                watcher = TaskingRequestWatcher(
+                    session=self.client._sesh,
+                    tasking_request_ids=to_watch,
+                    on_status_change=self._on_status_change,
+                    on_completed=self._on_completed,
+                )
+                watcher.watch(timeout=timeout)
+        finally:
+            # ordering stage submits to download stage
+            self._order_executor.shutdown(wait=True)
+            self._download_executor.shutdown(wait=True)
+
+        return {tr_id: self._state.get(tr_id, {"stage": STAGE_WATCHING}) for tr_id in self.tasking_request_ids}
+
+    def _on_status_change(self, task: dict[str, Any], previous: str | None, status: str | None) -> None:
+        tr_id = task["properties"]["taskingrequestId"]
+        if status in TR_TERMINAL_STATUSES and status != "completed":
+            logger.warning(f"TaskingRequest<{tr_id}> {status} ... not downloading")
+            self._update(tr_id, stage=STAGE_FAILED, error=f"tasking request {status}")
+
+    def _on_completed(self, task: dict[str, Any]) -> None:
+        tr_id = task["properties"]["taskingrequestId"]
+        self._update(tr_id, stage=STAGE_ORDERING)
+        assert self._order_executor is not None
+        self._order_executor.submit(self._order, tr_id)
+
+    def _order(self, tasking_request_id: str) -> None:
+        try:
+            if self._state[tasking_request_id].get("order_id") is None:
+                collect_ids = [coll["collectId"] for coll in self.client.get_collects_for_task(tasking_request_id)]
+                if not collect_ids:
+                    raise ValueError("no collects found")
+                # active order of the same products is reused, i.e. an order submitted before a restart is not
+                # submitted again
+                order_id, stac_ids = self.client._order_products_for_collect_ids(
+                    collect_ids, self.product_types, self.contract_id
+                )
+                self._update(tasking_request_id, order_id=order_id, stac_ids=stac_ids)
+        except Exception as exc:
+            return self._handle_error(tasking_request_id, exc)
+
+        self._update(tasking_request_id, stage=STAGE_DOWNLOADING)
+        assert self._download_executor is not None
+        self._download_executor.submit(self._download, tasking_request_id)
+
+    def _download(self, tasking_request_id: str) -> None:
+        state = self._state[tasking_request_id]
+        try:
+            # presigned urls expire, i.e. are resolved again after restart
+            items_presigned = self.client.get_presigned_items(state["order_id"], state["stac_ids"])
+            if not items_presigned:
+                raise ValueError(f"no presigned items in order {state['order_id']}")
+            paths_by_stac_id = self.client.download_products(
+                items_presigned=items_presigned, local_dir=self.local_dir, **self.download_kwargs
+            )
+        except Exception as exc:
+            return self._handle_error(tasking_request_id, exc)
+
+        paths = {
+            stac_id: {asset_key: str(path) for asset_key, path in paths.items()}
+            for stac_id, paths in paths_by_stac_id.items()
+        }
+        self._update(tasking_request_id, stage=STAGE_DONE, paths=paths)
+        logger.info(f"downloaded {len(paths)} products of TaskingRequest<{tasking_request_id}>")
+
+    def _handle_error(self, tasking_request_id: str, exc: Exception) -> None:
+        if not is_transient_error(exc):
+            return self._fail(tasking_request_id, exc)
+        stage = self._get_stage(tasking_request_id)
+        logger.warning(f"{stage} TaskingRequest<{tasking_request_id}> failed: {exc} ... retrying on next run")
+        self._update(tasking_request_id, error=str(exc))
+
+    def _fail(self, tasking_request_id: str, error: Any) -> None:
+        logger.error(f"pipeline failed for TaskingRequest<{tasking_request_id}>: {error}")
+        self._update(tasking_request_id, stage=STAGE_FAILED, error=str(error))
@@ -0,0 +1,50 @@
+import threading
+import time
+from collections.abc import Callable
+
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_exponential
+
+from capella_console_client.config import BULK_MAX_ATTEMPTS
+from capella_console_client.hooks import is_retryable_error, log_retry_attempt
+
+
+class RateLimiter:
+    """
+    thread safe token bucket
+
+    Args:
+        rate: max. sustained acquisitions per second
+        burst: max. acquisitions without waiting
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _retrying(
+    max_attempts: int = BULK_MAX_ATTEMPTS, predicate: Callable[[BaseException], bool] = is_retryable_error
+) -> Retrying:
+    """retry errors matching `predicate`, default: 429 (rate limited) and 5xx responses, with exponential backoff"""
+    return Retrying(
+        retry=retry_if_exception(predicate),
+        stop=stop_after_attempt(max_attempts),
+        wait=wait_exponential(multiplier=1, max=16),
+        before_sleep=log_retry_attempt,
+        reraise=True,
+    )
@@ -4,6 +4,7 @@ from typing import Any
 import geojson
 
 from capella_console_client.config import (
+    BULK_UPDATE_RATE,
     REPEAT_REQUEST_COLLECT_CONSTRAINTS_FIELDS,
     RR_CANCEL_MAX_CONCURRENCY,
     RR_REPETITION_PROPERTIES_FIELDS,
@@ -12,6 +13,7 @@ from capella_console_client.config import (
 )
 from capella_console_client.enumerations import (
     ArchiveHoldback,
+    BaseEnum,
     CollectionType,
     InsarOrbit,
     LocalTimeOption,
@@ -30,6 +32,7 @@ from capella_console_client.session import CapellaConsoleSession
 from capella_console_client.tasking_request import (
     _cancel_multi_parallel,
     _cancel_worker,
+    _get_properties_by_id,
     _update_multi_parallel,
     _update_worker,
 )
@@ -69,6 +72,44 @@ def create_repeat_request(
     azimuth_angle_tolerance: float | None = None,
     window_duration: float | None = None,
     insar_orbit: InsarOrbit | str | None = None,
+) -> dict[str, Any]:
+    payload = _build_repeat_request_payload(**{k: v for k, v in locals().items() if k != "session"})
+    logger.info(f"creating repeat request with payload {payload}")
+    return session.decode_json(session.post("/repeat-requests", json=payload))
+
+
+def _build_repeat_request_payload(
+    geometry: geojson.geometry.Geometry,
+    name: str,
+    description: str | None = "",
+    collection_type: CollectionType | str | None = CollectionType.SPOTLIGHT,
+    collection_tier: str | RepeatCollectionTier | None = RepeatCollectionTier.routine,
+    repeat_start: datetime | str | None = None,
+    repeat_end: datetime | str | None = None,
+    repetition_interval: RepeatCycle | int | None = RepeatCycle.WEEKLY,
+    repetition_count: int | None = None,
+    local_time: LocalTimeOption | list[int] | None = None,
+    product_types: list[ProductType | str] | None = None,
+    off_nadir_min: int | None = None,
+    off_nadir_max: int | None = None,
+    image_width: int | None = None,
+    orbital_planes: list[OrbitalPlane | int] | None = None,
+    asc_dsc: OrbitState | str | None = OrbitState.either,
+    look_direction: ObservationDirection | str | None = ObservationDirection.either,
+    polarization: Polarization | str | None = None,
+    archive_holdback: str | ArchiveHoldback | None = ArchiveHoldback.none,
+    custom_attribute_1: str | None = None,
+    custom_attribute_2: str | None = None,
+    azimuth_angle_min: int | None = None,
+    azimuth_angle_max: int | None = None,
+    squint: SquintMode | str | None = None,
+    max_squint_angle: int | None = None,
+    contract_id: str | None = None,
+    maintain_scene_framing: bool | None = None,
+    look_angle_tolerance: float | None = None,
+    azimuth_angle_tolerance: float | None = None,
+    window_duration: float | None = None,
+    insar_orbit: InsarOrbit | str | None = None,
 ) -> dict[str, Any]:
     repeat_start, repeat_end = _set_repetition_start_end(repeat_start, repeat_end, repetition_count)
 
@@ -111,8 +152,53 @@ def create_repeat_request(
     if insar_orbit:
         payload["properties"]["insar"] = {"orbit": insar_orbit}
 
-    logger.info(f"creating repeat request with payload {payload}")
-    return session.post("/repeat-requests", json=payload).json()
+    return payload
+
+
+# enum validated arguments of repeat request
+RR_ENUM_ARGUMENTS: dict[str, type[BaseEnum]] = {
+    "archive_holdback": ArchiveHoldback,
+    "asc_dsc": OrbitState,
+    "collection_tier": RepeatCollectionTier,
+    "collection_type": CollectionType,
+    "insar_orbit": InsarOrbit,
+    "look_direction": ObservationDirection,
+    "orbital_planes": OrbitalPlane,
+    "polarization": Polarization,
+    "product_types": ProductType,
+    "squint": SquintMode,
+}
+
+
+def _validate_repeat_request_arguments(**kwargs) -> None:
+    """validate repeat request arguments locally (without network calls)"""
+    errors = []
+    geometry = kwargs.get("geometry")
+    if not geometry or geometry.get("type") not in ("Point", "Polygon"):
+        errors.append("geometry must be a GeoJSON Point or Polygon")
+
+    for arg, enum_cls in RR_ENUM_ARGUMENTS.items():
+        value = kwargs.get(arg)
+        if value is None:
+            continue
+        values = value if isinstance(value, list) else [value]
+        invalid = [cur for cur in values if cur not in enum_cls]
+        if invalid:
+            errors.append(
+                f"invalid {arg} {', '.join(map(str, invalid))}, must be one of {', '.join(str(e.value) for e in enum_cls)}"
+            )
+
+    local_time = kwargs.get("local_time")
+    if isinstance(local_time, str) and local_time not in LocalTimeOption:
+        errors.append(f"invalid local_time {local_time}, must be one of {', '.join(e.value for e in LocalTimeOption)}")
+
+    if errors:
+        raise RepeatRequestPayloadValidationError("; ".join(errors))
+
+
+def _build_validated_repeat_request_payload(**kwargs) -> dict[str, Any]:
+    _validate_repeat_request_arguments(**kwargs)
+    return _build_repeat_request_payload(**kwargs)
 
 
 def _set_repetition_start_end(
@@ -155,14 +241,16 @@ def _cancel_repeat_request(session: CapellaConsoleSession, cancel_id: str):
 def update_repeat_requests(
     *repeat_request_ids: str,
     session: CapellaConsoleSession,
+    properties_by_id: dict[str, dict[str, Any]] | None = None,
+    rate: float = BULK_UPDATE_RATE,
     **kwargs,
 ) -> dict[str, Any]:
     return _update_multi_parallel(
-        *repeat_request_ids,
+        _get_properties_by_id(repeat_request_ids, properties_by_id, **kwargs),
         session=session,
         update_fct=_update_repeat_request_worker,
         max_concurrency=RR_UPDATE_MAX_CONCURRENCY,
-        **kwargs,
+        rate=rate,
     )
 
 
@@ -21,6 +21,19 @@ def print_cancelation_result(results_by_tr_id: dict[str, Any], task_type: str):
             logger.info(f"{_id:25s}: {cancel_result['error']} ❌")
 
 
+def print_creation_result(results: list[dict[str, Any]], task_type: str):
+    created = [r for r in results if r["success"] and not r.get("existing")]
+    existing = [r for r in results if r["success"] and r.get("existing")]
+    failed = [r for r in results if not r["success"]]
+
+    logger.info(f"{len(created)} out of {len(results)} {task_type} requests successfully created")
+    if existing:
+        logger.info(f"{len(existing)} out of {len(results)} {task_type} requests already existed")
+
+    for result in failed:
+        logger.info(f"feature #{result['index']} ({result['idempotency_key']}): {result.get('message')} ❌")
+
+
 def print_task_search_result(search_result, search_entity):
     if not search_result:
         logger.info(f"found no {search_entity}s matching search query")
@@ -1,35 +1,49 @@
 from abc import ABCMeta, abstractmethod
-from collections import defaultdict
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass, field
+from datetime import datetime
 from functools import partial, wraps
-from itertools import repeat
+from itertools import islice, repeat
 from math import ceil
+from pathlib import Path
 from typing import Any, ClassVar
 from urllib.parse import urlparse
 
+from dateutil.parser import parse
+from dateutil.relativedelta import relativedelta
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
+from capella_console_client import columnar
+from capella_console_client.codec import JsonCodec, get_json_codec
 from capella_console_client.config import (
     CATALOG_DEFAULT_LIMIT,
+    CATALOG_IDS_CHUNK_SIZE,
+    CATALOG_MAX_CONCURRENCY,
     CATALOG_MAX_PAGE_SIZE,
+    CATALOG_PAGE_MAX_ATTEMPTS,
     CATALOG_STAC_MAX_ITEM_RETURN,
     QUERY_OPERATORS,
     RR_FILTERS_BY_QUERY_FIELDS,
+    RR_SORTBY_FIELDS,
     RR_SUPPORTED_GROUPBY_FIELDS,
     STAC_ALL_SUPPORTED_SEARCH_FIELDS,
     STAC_ALL_SUPPORTED_SORTBY,
+    STAC_DATETIME_FIELDS,
     STAC_PREFIXED_BY_QUERY_FIELDS,
     STAC_ROOT_LEVEL_GROUPBY_FIELDS,
     STAC_SUPPORTED_QUERY_FIELDS,
     STAC_SUPPORTED_ROOT_FIELDS,
     SUPPORTED_RR_SEARCH_QUERY_FIELDS,
     SUPPORTED_TASKING_REQUEST_SEARCH_QUERY_FIELDS,
+    TASK_REPEAT_SORTBY_DATETIME_PROPERTIES,
     TR_FILTERS_BY_QUERY_FIELDS,
     TR_MAX_CONCURRENCY,
     TR_SEARCH_DEFAULT_PAGE_SIZE,
+    TR_SORTBY_FIELDS,
     TR_SUPPORTED_GROUPBY_FIELDS,
     UNKNOWN_GROUPBY_FIELD,
 )
@@ -37,14 +51,26 @@ from capella_console_client.enumerations import (
     BaseEnum,
     CollectionTier,
     CollectionType,
+    InstrumentMode,
+    ObservationDirection,
+    OrbitalPlane,
+    OrbitState,
     OwnershipOption,
+    Polarization,
+    ProductType,
     RepeatCollectionTier,
     TaskingRequestStatus,
 )
+from capella_console_client.executor import BulkExecutor
+from capella_console_client.hooks import is_retryable_error, log_retry_attempt
 from capella_console_client.logconf import logger
 from capella_console_client.report import print_task_search_result
+from capella_console_client.search_cache import SearchCache
 from capella_console_client.session import CapellaConsoleSession
-from capella_console_client.validate import _compact_unique, _validate_uuids
+from capella_console_client.sort import _parse_sort_arg, _sort_items
+from capella_console_client.spatial import SpatialIndex
+from capella_console_client.stac_item import CompactStacItem
+from capella_console_client.validate import _compact_unique, _datetime_to_iso8601_str, _validate_uuids
 
 
 class SearchEntity(str, BaseEnum):
@@ -56,31 +82,79 @@ class SearchEntity(str, BaseEnum):
 class Groupby(metaclass=ABCMeta):
     ROOT_GROUPBY_FIELDS: ClassVar[set[str]] = NotImplemented
     PROPERTIES_GROUPBY_FIELDS: ClassVar[set[str]] = NotImplemented
+    AGGREGATIONS: ClassVar[set[str]] = {"count", "min", "max", "mean"}
 
     @property
     def supported_fields(self):
         return self.ROOT_GROUPBY_FIELDS | self.PROPERTIES_GROUPBY_FIELDS
 
-    def groupby(self, features, field: str) -> dict[str, Any]:
+    def get_keys(self, features, field: str) -> list[Any]:
+        """group key of each feature for provided field name"""
+        if field not in self.supported_fields:
+            logger.warning(
+                f"groupby(field='{field}') not supported - using '{UNKNOWN_GROUPBY_FIELD}' as value - supported: {', '.join(self.supported_fields)}"
+            )
+
+        return [self._get_safe_field_value(field=field, item=feature) for feature in features]
+
+    def groupby(self, features, field: str | list[str], keys: list[Any] | None = None) -> dict[Any, Any]:
         """
-        group matched features by provided field name
+        group matched features by provided field name(s)
 
         * items not containing the respective field will returned as part of 'unknown' key
         * non-hashable fields (lists, sets) are '-'.joined (e.g. polarizations = ["HH", "HV"] -> "HH-HV")
+        * multiple fields are grouped by tuple of values, e.g. ("ascending", "GEO")
         """
-
-        if field not in self.supported_fields:
-            logger.warning(
-                f"groupby(field='{field}') not supported - using '{UNKNOWN_GROUPBY_FIELD}' as value - supported: {', '.join(self.supported_fields)}"
-            )
+        if keys is None:
+            keys = self._get_multi_keys(features, field)
 
         features_by_field = defaultdict(list)
-        for feature in features:
-            value = self._get_safe_field_value(field=field, item=feature)
-            features_by_field[value].append(feature)
+        for key, feature in zip(keys, features):
+            features_by_field[key].append(feature)
 
         return dict(features_by_field)
 
+    def aggregate(self, keys: list[Any], agg: str, values: list[Any] | None = None) -> dict[Any, Any]:
+        """
+        aggregate `values` by group `keys` without materializing groups
+
+        * count: number of features per group
+        * min, max, mean: of values per group, features missing the value are skipped (None if no values)
+        * mean: requires numeric values, raises ValueError otherwise
+        """
+        if agg not in self.AGGREGATIONS:
+            raise ValueError(f"aggregation {agg} not supported - supported: {', '.join(sorted(self.AGGREGATIONS))}")
+
+        if agg == "count":
+            return dict(Counter(keys))
+
+        if values is None:
+            raise ValueError(f"aggregation {agg} requires values")
+
+        aggregated: dict[Any, Any] = dict.fromkeys(keys)
+        counts: Counter = Counter()
+        for key, value in zip(keys, values):
+            if value is None or value == UNKNOWN_GROUPBY_FIELD:
+                continue
+
+            cur = aggregated[key]
+            if agg == "mean":
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"aggregation mean requires numeric values, got {value!r}")
+                aggregated[key] = value if cur is None else cur + value
+                counts[key] += 1
+            elif cur is None or (value < cur if agg == "min" else value > cur):
+                aggregated[key] = value
+
+        if agg == "mean":
+            aggregated = {key: total / counts[key] if counts[key] else None for key, total in aggregated.items()}
+        return aggregated
+
+    def _get_multi_keys(self, features, field: str | list[str]) -> list[Any]:
+        if isinstance(field, str):
+            return self.get_keys(features, field)
+        return list(zip(*(self.get_keys(features, cur) for cur in field)))
+
     @abstractmethod
     def _get_safe_field_value(self, field: str, item: dict[str, Any]): ...
 
@@ -91,13 +165,20 @@ class SearchResult(metaclass=ABCMeta):
     _pages: list[dict[str, Any]] = field(default_factory=list)
     _features: list[dict[str, Any]] = field(default_factory=list)
 
+    # group keys by field, reset on add
+    _group_keys: dict[str, list[Any]] = field(default_factory=dict, repr=False, compare=False)
+
     grouper: ClassVar[Groupby] = NotImplemented
 
-    def _truncate(self):
+    def _truncate(self, limit: int | None = None):
         len_features = len(self)
-        requested_limit = self.request_body.get("limit")
+        requested_limit = limit or self.request_body.get("limit")
         if requested_limit and len_features > requested_limit:
             self._features = self._features[:requested_limit]
+            self._reset_indexes()
+
+    def _reset_indexes(self):
+        self._group_keys.clear()
 
     def _report(self):
         len_results = len(self)
@@ -135,14 +216,34 @@ class SearchResult(metaclass=ABCMeta):
 
         return copy
 
-    def groupby(self, field: str) -> dict[str, Any]:
+    def groupby(self, field: str | list[str]) -> dict[Any, Any]:
         """
-        group matched features by provided field name
+        group matched features by provided field name(s)
 
         * items not containing the respective field will returned as part of 'unknown' key
         * non-hashable fields (lists, sets) are '-'.joined
+        * multiple fields, e.g. ["orbit_state", "product_type"] are grouped by tuple of values
+        """
+        return self.grouper.groupby(features=self._features, field=field, keys=self._get_group_keys(field))
+
+    def aggregate(self, by: str | list[str], agg: str = "count", field: str | None = None) -> dict[Any, Any]:
+        """
+        aggregate matched features grouped by provided field name(s) without building lists of features
+
+        e.g. `result.aggregate(by=["orbit_state", "product_type"], agg="mean", field="incidence_angle")`
+
+        * agg: one of count, min, max, mean - min, max and mean aggregate values of `field`
         """
-        return self.grouper.groupby(field=field, features=self._features)
+        values = self._get_group_keys(field) if field is not None else None
+        return self.grouper.aggregate(keys=self._get_group_keys(by), agg=agg, values=values)
+
+    def _get_group_keys(self, field: str | list[str]) -> list[Any]:
+        if not isinstance(field, str):
+            return list(zip(*(self._get_group_keys(cur) for cur in field)))
+
+        if field not in self._group_keys:
+            self._group_keys[field] = self.grouper.get_keys(self._features, field)
+        return self._group_keys[field]
 
 
 class StacGroupby(Groupby):
@@ -166,10 +267,17 @@ class StacGroupby(Groupby):
         return value
 
 
+@dataclass
 class StacSearchResult(SearchResult):
     entity: SearchEntity = SearchEntity.STAC_ITEM
     grouper: ClassVar[Groupby] = StacGroupby()
 
+    # ids requested but not found by ids lookup, see `search_by_ids`
+    missing_ids: list[str] = field(default_factory=list, compare=False)
+    # columns of filtered fields, reset on add
+    _columns: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    _spatial_index: SpatialIndex | None = field(default=None, repr=False, compare=False)
+
     def __repr__(self):
         return f"{self.__class__} ({len(self)} {self.entity.value}{self.multiple_suffix})"
 
@@ -181,9 +289,66 @@ class StacSearchResult(SearchResult):
     def collect_ids(self):
         return [item["properties"].get("capella:collect_id", "N/A") for item in self._features]
 
+    def to_numpy(self, fields: list[str] | None = None) -> dict[str, Any]:
+        """
+        columnar representation of STAC items as numpy arrays keyed by field (requires numpy)
+
+        * fields are search filter names (e.g. "incidence_angle" for "view:incidence_angle"), default: all present
+        * datetime fields are converted to datetime64[us] (UTC), numeric fields to int64/ float64 (missing: nan)
+        """
+        return columnar.to_numpy(self._features, fields)
+
+    def to_arrow(self, fields: list[str] | None = None):
+        """
+        columnar representation of STAC items as pyarrow.Table (requires pyarrow)
+
+        * fields are search filter names (e.g. "incidence_angle" for "view:incidence_angle"), default: all present
+        * datetime fields are converted to timestamp[us, tz=UTC]
+        """
+        return columnar.to_arrow(self._features, fields)
+
+    def to_parquet(self, path: Path | str, fields: list[str] | None = None) -> Path:
+        """write columnar representation of STAC items to parquet file `path` (requires pyarrow)"""
+        return columnar.to_parquet(self._features, path, fields)
+
+    def filter(self, **filters) -> "StacSearchResult":
+        """
+        filter STAC items client side, e.g. `result.filter(incidence_angle__gt=30, orbit_state="ascending")`
+
+        * supports the same `field__op` syntax as search (eq, in, gt, gte, lt, lte) as well as ids, collections, bbox and limit
+        * field values are cached per field (as numpy arrays if installed) for repeated filtering
+        """
+        features = columnar.filter_features(self._features, filters, get_column=self._get_column)
+        filtered = self.__class__(request_body=deepcopy(self.request_body))
+        filtered.add({"type": "FeatureCollection", "features": features}, keep_duplicates=True)
+        return filtered
+
+    def spatial_index(self) -> SpatialIndex:
+        """
+        spatial index (STR-tree) over footprints of STAC items, e.g.
+
+        * `index.intersecting(aoi_geometry)`: STAC items intersecting geometry
+        * `index.covering((lon, lat))`: STAC items containing point
+        * `index.nearest((lon, lat), k=3)`: 3 STAC items with footprint nearest to point
+        """
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self._features)
+        return self._spatial_index
+
+    def _reset_indexes(self):
+        super()._reset_indexes()
+        self._columns.clear()
+        self._spatial_index = None
+
+    def _get_column(self, field: str) -> Any:
+        if field not in self._columns:
+            self._columns[field] = columnar.build_filter_column(self._features, field)
+        return self._columns[field]
+
     def add(self, page: dict[str, Any], keep_duplicates: bool = False) -> int:
         if not keep_duplicates:
             page = self._filter_dupes(page)
+        self._reset_indexes()
         self._pages.append(page)
         self._features.extend(page["features"])
         return len(page["features"])
@@ -205,6 +370,24 @@ class StacSearchResult(SearchResult):
         return page
 
 
+@dataclass
+class CompactStacSearchResult(StacSearchResult):
+    """
+    StacSearchResult holding STAC items as :py:class:`CompactStacItem` (properties, assets, ... decoded on first access)
+    """
+
+    # json codec of items, default: fastest installed
+    codec: JsonCodec | None = field(default=None, repr=False, compare=False)
+
+    def add(self, page: dict[str, Any], keep_duplicates: bool = False) -> int:
+        codec = self.codec or get_json_codec()
+        page = {**page, "features": [CompactStacItem.from_feature(f, codec) for f in page["features"]]}
+        return super().add(page, keep_duplicates=keep_duplicates)
+
+    def to_feature_collection(self):
+        return {"type": "FeatureCollection", "features": [f.to_dict() for f in self._features]}
+
+
 class TaskingRequestGroupby(Groupby):
     ROOT_GROUPBY_FIELDS: ClassVar[set[str]] = set()
     PROPERTIES_GROUPBY_FIELDS: ClassVar[set[str]] = TR_SUPPORTED_GROUPBY_FIELDS
@@ -246,6 +429,7 @@ class TaskingRequestSearchResult(SearchResult):
         return [item["properties"].get("repeatrequestId", "N/A") for item in self._features]
 
     def add(self, page: dict[str, Any], keep_duplicates: bool = False) -> int:
+        self._reset_indexes()
         self._pages.append(page)
         self._features.extend(page["results"])
         return len(page["results"])
@@ -263,6 +447,7 @@ class RepeatRequestSearchResult(SearchResult):
         return [item["properties"]["repeatrequestId"] for item in self._features]
 
     def add(self, page: dict[str, Any], keep_duplicates: bool = False) -> int:
+        self._reset_indexes()
         self._pages.append(page)
         self._features.extend(page["results"])
         return len(page["results"])
@@ -293,6 +478,10 @@ class StacSearch(AbstractSearch):
         self.session = session
         self.payload: dict[str, Any] = {}
         self.threaded = cur_kwargs.pop("threaded", False)
+        self.max_concurrency = cur_kwargs.pop("max_concurrency", None) or CATALOG_MAX_CONCURRENCY
+        self.prefetch = cur_kwargs.pop("prefetch", True)
+        self.cache: SearchCache | None = cur_kwargs.pop("cache", None)
+        self.compact = cur_kwargs.pop("compact", False)
 
         sortby = cur_kwargs.pop("sortby", None)
         if sortby:
@@ -364,93 +553,173 @@ class StacSearch(AbstractSearch):
             sorts.append({"field": field, "direction": directions[direction]})
         return sorts
 
+    def count(self) -> int | None:
+        """
+        number of STAC items matching the query (`numberMatched` of single item page)
+
+        None if the STAC server does not report the number of matched items (and at least one item matched)
+        """
+        page = _page_search(self.session, {**self.payload, "limit": 1})
+        number_matched: int | None = page.get("numberMatched", (page.get("context") or {}).get("matched"))
+        if number_matched is None and not page.get("features"):
+            return 0
+        return number_matched
+
     def fetch_all(self) -> StacSearchResult:
         logger.info(f"searching catalog with payload {self.payload}")
+        if self.cache is not None:
+            if self.session.identity is not None:
+                return self._fetch_all_cached(self.cache)
+            logger.warning("unable to scope search cache to user (unauthenticated) ... not caching")
+
         if not self.threaded:
             return self._fetch_all_sync()
         else:
             return self._fetch_all_threaded()
 
-    def _fetch_all_sync(self):
-        search_result = StacSearchResult(request_body=self.payload)
-        cur_payload = deepcopy(self.payload)
+    def _fetch_all_cached(self, cache: SearchCache) -> StacSearchResult:
+        scope = f"{self.session.search_url}|{self.session.identity}"
+        cache_key = cache.key(self.payload, scope=scope)
 
-        # limit page size
-        cur_payload["limit"] = min(CATALOG_MAX_PAGE_SIZE, self.payload["limit"])
+        pages = cache.get(cache_key)
+        if pages is None:
+            search_result = self._fetch_all_threaded() if self.threaded else self._fetch_all_sync()
+            cache.set(cache_key, search_result._pages)
+            return search_result
 
-        page_cnt = 1
-        next_href = None
+        search_result = self._new_result()
+        for page in pages:
+            # pages were deduped when cached
+            search_result.add(page, keep_duplicates=True)
 
-        while True:
-            start = len(search_result)
-            end = min(start + cur_payload["limit"], self.payload["limit"])
-            _log_page_query(page_cnt=page_cnt, start=start, end=end)
+        search_result._truncate()
+        search_result._report()
+        return search_result
 
-            # safeguard to not step over 10000
-            if start + cur_payload["limit"] > CATALOG_STAC_MAX_ITEM_RETURN:
-                # translate limit/ page for last request
-                missing = CATALOG_STAC_MAX_ITEM_RETURN - len(search_result)
-                if not missing:
-                    break
+    def _new_result(self) -> StacSearchResult:
+        if self.compact:
+            return CompactStacSearchResult(request_body=self.payload, codec=self.session.json_codec)
+        return StacSearchResult(request_body=self.payload)
 
-                cur_payload["limit"] = missing
-                cur_payload["page"] = int(len(search_result) / missing) + 1
+    def _fetch_all_sync(self):
+        search_result = self._new_result()
 
-            page_data = _page_search(self.session, cur_payload, next_href)
-            number_matched = page_data["numberMatched"]
-            items_added = search_result.add(page_data)
+        page_cnt = 1
+        next_href = None
+        # (page request, future) of next page requested while current page is processed
+        prefetched: tuple[tuple[dict[str, Any], str | None], Future] | None = None
 
-            limit_reached = len(search_result) >= self.payload["limit"] or len(search_result) >= number_matched
+        prefetcher = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            while True:
+                start = len(search_result)
+                cur_payload = self._get_sync_page_payload(page_cnt=page_cnt, start=start)
+                if cur_payload is None:
+                    break
 
-            # all dupes
-            size_unchanged = items_added == 0
-            if limit_reached or size_unchanged:
-                break
+                end = min(start + cur_payload["limit"], self.payload["limit"])
+                _log_page_query(page_cnt=page_cnt, start=start, end=end)
+
+                if prefetched is not None and prefetched[0] == (cur_payload, next_href):
+                    page_data = prefetched[1].result()
+                else:
+                    page_data = _page_search(self.session, cur_payload, next_href)
+                prefetched = None
+
+                number_matched = page_data["numberMatched"]
+                next_href = _get_next_page_href(page_data)
+
+                # request next page before deduping current one - discarded if dedupe shifts the page offset
+                expected_len = start + len(page_data["features"])
+                if (
+                    prefetcher is not None
+                    and next_href is not None
+                    and expected_len < min(self.payload["limit"], number_matched)
+                ):
+                    next_payload = self._get_sync_page_payload(page_cnt=page_cnt + 1, start=expected_len)
+                    if next_payload is not None:
+                        future = prefetcher.submit(_page_search, self.session, next_payload, next_href)
+                        prefetched = ((next_payload, next_href), future)
+
+                items_added = search_result.add(page_data)
+
+                limit_reached = len(search_result) >= self.payload["limit"] or len(search_result) >= number_matched
+
+                # all dupes
+                size_unchanged = items_added == 0
+                if limit_reached or size_unchanged:
+                    break
 
-            next_href = _get_next_page_href(page_data)
-            if next_href is None:
-                break
+                if next_href is None:
+                    break
 
-            if page_cnt == 1:
-                logger.info(f"Matched a total of {number_matched} stac items - returning up to {self.payload['limit']}")
+                if page_cnt == 1:
+                    logger.info(
+                        f"Matched a total of {number_matched} stac items - returning up to {self.payload['limit']}"
+                    )
 
-            page_cnt += 1
-            cur_payload["page"] = page_cnt
+                page_cnt += 1
+        finally:
+            if prefetcher is not None:
+                # don't wait for prefetched page not needed after early exit
+                prefetcher.shutdown(wait=False, cancel_futures=True)
 
         search_result._truncate()
         search_result._report()
         return search_result
 
+    def _get_sync_page_payload(self, page_cnt: int, start: int) -> dict[str, Any] | None:
+        # limit page size
+        cur_payload = {**self.payload, "limit": min(CATALOG_MAX_PAGE_SIZE, self.payload["limit"])}
+        if page_cnt > 1:
+            cur_payload["page"] = page_cnt
+
+        # safeguard to not step over 10000
+        if start + cur_payload["limit"] > CATALOG_STAC_MAX_ITEM_RETURN:
+            # translate limit/ page for last request
+            missing = CATALOG_STAC_MAX_ITEM_RETURN - start
+            if not missing:
+                return None
+
+            cur_payload["limit"] = missing
+            cur_payload["page"] = int(start / missing) + 1
+
+        return cur_payload
+
     def _fetch_all_threaded(self):
-        search_result = StacSearchResult(request_body=self.payload)
-        page_payloads = self._get_page_payloads()
+        search_result = self._new_result()
+        first_page, page_payloads = self._get_page_payloads()
+        search_result.add(first_page)
 
-        # TODO: configurable max threads
-        with ThreadPoolExecutor(max_workers=len(page_payloads)) as executor:
-            results = executor.map(_page_search, repeat(self.session), page_payloads)
+        if page_payloads:
+            max_workers = min(self.max_concurrency, len(page_payloads))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(_page_search, repeat(self.session), page_payloads)
 
-        for page in results:
-            search_result.add(page)
+                for page in results:
+                    search_result.add(page)
 
         search_result._truncate()
         search_result._report()
         return search_result
 
-    def _get_page_payloads(self) -> list[dict[str, Any]]:
-        # ping for how many matches in total
-        cur_payload = {**self.payload, "limit": 1}
-        single_match_page = _page_search(self.session, cur_payload)
-        number_matched = single_match_page["numberMatched"]
+    def _get_page_payloads(self) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """
+        fetch first page (which also reports total number of matches) and derive payloads of remaining pages
+        """
+        page_size = min(CATALOG_MAX_PAGE_SIZE, self.payload["limit"])
+        first_page = _page_search(self.session, {**self.payload, "limit": page_size, "page": 1})
+        number_matched = first_page["numberMatched"]
 
-        num_pages = ceil(min(number_matched, self.payload["limit"]) / CATALOG_MAX_PAGE_SIZE)
+        num_pages = ceil(min(number_matched, self.payload["limit"]) / page_size)
         logger.info(
-            f"Matched a total of {number_matched} stac items - fetching in {num_pages} parallel requests (page size {CATALOG_MAX_PAGE_SIZE}) - returning up to {self.payload['limit']}"
+            f"Matched a total of {number_matched} stac items - fetching in {num_pages} requests (page size {page_size}, max. {self.max_concurrency} parallel) - returning up to {self.payload['limit']}"
         )
 
-        payloads = [
-            {**self.payload, "limit": min(CATALOG_MAX_PAGE_SIZE, self.payload["limit"]), "page": i}
-            for i in range(1, num_pages + 1)
-        ]
+        if num_pages <= 1:
+            return first_page, []
+
+        payloads = [{**self.payload, "limit": page_size, "page": i} for i in range(1, num_pages + 1)]
 
         # safeguard to not step over 10000
         overflow = payloads[-1]["limit"] * payloads[-1]["page"] > CATALOG_STAC_MAX_ITEM_RETURN
@@ -460,7 +729,8 @@ class StacSearch(AbstractSearch):
             payloads[-1]["limit"] = missing
             payloads[-1]["page"] = int(offset / missing) + 1
 
-        return payloads
+        # first page already fetched
+        return first_page, payloads[1:]
 
 
 def _log_page_query(page_cnt: int, start: int, end: int):
@@ -478,6 +748,130 @@ def _get_next_page_href(page_data: dict[str, Any]) -> str | None:
     return next_href
 
 
+# default facet buckets
+FACET_BUCKETS_BY_FIELD: dict[str, list[Any]] = {
+    "instrument_mode": [e.value for e in InstrumentMode],
+    "observation_direction": [e.value for e in ObservationDirection if e != ObservationDirection.either],
+    "orbit_state": [e.value for e in OrbitState if e != OrbitState.either],
+    "orbital_plane": [e.value for e in OrbitalPlane],
+    "polarizations": [e.value for e in Polarization],
+    "product_type": [e.value for e in ProductType],
+}
+
+FACET_INTERVALS = {
+    "day": relativedelta(days=1),
+    "week": relativedelta(weeks=1),
+    "month": relativedelta(months=1),
+    "year": relativedelta(years=1),
+}
+
+
+def _get_time_bin_edges(interval: str, kwargs: dict[str, Any], facet: str) -> list[datetime]:
+    if interval not in FACET_INTERVALS:
+        raise ValueError(f"interval {interval} not supported - supported: {', '.join(FACET_INTERVALS)}")
+
+    start = kwargs.get(f"{facet}__gte") or kwargs.get(f"{facet}__gt")
+    end = kwargs.get(f"{facet}__lt") or kwargs.get(f"{facet}__lte")
+    if not start or not end:
+        raise ValueError(f"interval facets require {facet}__gte and {facet}__lt filters")
+
+    start_dt, end_dt = (parse(v) if isinstance(v, str) else v for v in (start, end))
+    edges = [start_dt]
+    while edges[-1] < end_dt:
+        edges.append(min(edges[-1] + FACET_INTERVALS[interval], end_dt))
+    return edges
+
+
+def facet_counts(
+    session: CapellaConsoleSession,
+    facet: str,
+    buckets: list[Any] | None = None,
+    interval: str | None = None,
+    max_concurrency: int | None = None,
+    **kwargs,
+) -> dict[Any, int | None]:
+    """
+    number of STAC items matching search filters `kwargs` per bucket of `facet`, counted by concurrent count queries
+
+    * field facets: count per value of `buckets` (default: all values of enum fields, e.g. product_type)
+    * datetime facets: count per time bin [edge_i, edge_i+1) of bin edges `buckets` or per `interval`
+      (one of day, week, month, year) between `{facet}__gte` and `{facet}__lt` filters, keyed by bin start
+    """
+    bucket_kwargs: dict[Any, dict[str, Any]] = {}
+    if facet in STAC_DATETIME_FIELDS:
+        edges = buckets if interval is None else _get_time_bin_edges(interval, kwargs, facet)
+        if not edges or len(edges) < 2:
+            raise ValueError(f"{facet} facets require at least 2 bin edges or interval")
+
+        bounds = {k: v for k, v in kwargs.items() if not k.startswith(f"{facet}__")}
+        for start, end in zip(edges[:-1], edges[1:]):
+            start, end = _datetime_to_iso8601_str(start), _datetime_to_iso8601_str(end)
+            bucket_kwargs[start] = {**bounds, f"{facet}__gte": start, f"{facet}__lt": end}
+    else:
+        if buckets is None:
+            if facet not in FACET_BUCKETS_BY_FIELD:
+                raise ValueError(
+                    f"buckets required for facet {facet} - default buckets available for: {', '.join(FACET_BUCKETS_BY_FIELD)}"
+                )
+            buckets = FACET_BUCKETS_BY_FIELD[facet]
+        bucket_kwargs = {bucket: {**kwargs, facet: bucket} for bucket in buckets}
+
+    def _count(cur_kwargs: dict[str, Any]) -> int | None:
+        return StacSearch(session, **cur_kwargs).count()
+
+    if not bucket_kwargs:
+        return {}
+
+    max_workers = min(max_concurrency or CATALOG_MAX_CONCURRENCY, len(bucket_kwargs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        counts = executor.map(_count, bucket_kwargs.values())
+        return dict(zip(bucket_kwargs.keys(), counts))
+
+
+def search_by_ids(
+    session: CapellaConsoleSession,
+    stac_ids: list[str],
+    chunk_size: int = CATALOG_IDS_CHUNK_SIZE,
+    max_concurrency: int | None = None,
+    **kwargs,
+) -> StacSearchResult:
+    """
+    look up STAC items of `stac_ids` by parallel searches of max. `chunk_size` ids each
+
+    * STAC items are returned in order of `stac_ids`
+    * ids not found are logged and available as `missing_ids` of the returned result
+    """
+    unique_stac_ids = _compact_unique(stac_ids)
+    chunks = [unique_stac_ids[idx : idx + chunk_size] for idx in range(0, len(unique_stac_ids), chunk_size)]
+
+    def _search_chunk(chunk: list[str]) -> StacSearchResult:
+        return StacSearch(session, ids=chunk, limit=len(chunk), **kwargs).fetch_all()
+
+    items_by_id: dict[str, Any] = {}
+    if chunks:
+        max_workers = min(max_concurrency or CATALOG_MAX_CONCURRENCY, len(chunks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_result in executor.map(_search_chunk, chunks):
+                items_by_id.update((item["id"], item) for item in chunk_result)
+
+    # requested ids first (in requested order), followed by anything else returned
+    ordered = [items_by_id.pop(i) for i in unique_stac_ids if i in items_by_id]
+    result = StacSearchResult(request_body={"ids": unique_stac_ids})
+    result.add({"type": "FeatureCollection", "features": [*ordered, *items_by_id.values()]}, keep_duplicates=True)
+    found_ids = {item["id"] for item in ordered}
+    result.missing_ids = [i for i in unique_stac_ids if i not in found_ids]
+    if result.missing_ids:
+        logger.warning(f"{len(result.missing_ids)} STAC IDs not found: {', '.join(result.missing_ids)}")
+    return result
+
+
+@retry(
+    retry=retry_if_exception(is_retryable_error),
+    stop=stop_after_attempt(CATALOG_PAGE_MAX_ATTEMPTS),
+    wait=wait_exponential(multiplier=1, max=16),
+    before_sleep=log_retry_attempt,
+    reraise=True,
+)
 def _page_search(session: CapellaConsoleSession, payload: dict[str, Any], next_href: str = None) -> dict[str, Any]:
     if next_href:
         # STAC API to return normalized asset hrefs, not api gateway - fixing this here ...
@@ -488,7 +882,7 @@ def _page_search(session: CapellaConsoleSession, payload: dict[str, Any], next_h
     url = session.search_url if next_href is None else next_href
     resp = session.post(url, json=payload)
 
-    data: dict[str, Any] = resp.json()
+    data: dict[str, Any] = session.decode_json(resp)
     return data
 
 
@@ -583,7 +977,7 @@ class RepeatRequestQuerySanitizer(AbstractQuerySanitizer):
 
 def _fetch_page(params, session, search_endpoint, search_entity, search_payload, silent=False):
     resp = session.post(search_endpoint, params=params, json=search_payload)
-    page = resp.json()
+    page = session.decode_json(resp)
     if page["currentPage"] > 1 and not silent:
         logger.info(f"page {page['currentPage']} out of {page['totalPages']}: {len(page['results'])} {search_entity}")
     return page
@@ -595,6 +989,7 @@ class AbstractTaskRepeatSearch(AbstractSearch):
     QUERY_PAYLOAD_FIELD: str
     SUPPORTED_QUERY_FIELDS: set[str]
     FILTERS_BY_QUERY_FIELDS: dict[str, str]
+    SORTBY_FIELDS: dict[str, str]
     QUERY_SANITIZER_CLS: type[AbstractQuerySanitizer]
 
     def __init_subclass__(cls, **kwargs):
@@ -605,6 +1000,7 @@ class AbstractTaskRepeatSearch(AbstractSearch):
             "QUERY_PAYLOAD_FIELD",
             "SUPPORTED_QUERY_FIELDS",
             "FILTERS_BY_QUERY_FIELDS",
+            "SORTBY_FIELDS",
             "QUERY_SANITIZER_CLS",
         }
 
@@ -619,24 +1015,41 @@ class AbstractTaskRepeatSearch(AbstractSearch):
         self.page_size = kwargs.pop("page_size", None) or TR_SEARCH_DEFAULT_PAGE_SIZE
         self.threaded = kwargs.pop("threaded", True)
         self.show_progress = kwargs.pop("show_progress", False)
-        # TODO: max results (limit)
+        self.max_results: int | None = kwargs.pop("max_results", None)
+        # tasking requests derived from repeat requests
+        self.include_repeating_tasks: bool = kwargs.pop("include_repeating_tasks", False)
+
+        # sortby not supported by api, results are sorted client side after fetching all pages
+        sortby = kwargs.pop("sortby", None)
+        self.sortby: list[tuple[str, bool]] = self._get_sort_payload(sortby) if sortby else []
 
         query_payload = self._get_query_payload(kwargs)
         if query_payload:
             self.payload[self.QUERY_PAYLOAD_FIELD] = dict(query_payload)
 
-        # sortby = cur_kwargs.pop("sortby", None)
-        # if sortby:
-        #     self.payload["sortby"] = self._get_sort_payload(sortby)
+    def _get_sort_payload(self, sortby) -> list[tuple[str, bool]]:
+        """(property path, descending) per sort field"""
+        sorts = []
+        if not isinstance(sortby, list):
+            sortby = [sortby]
+
+        for sort_arg in sortby:
+            field, descending = _parse_sort_arg(sort_arg)
+            if field not in self.SORTBY_FIELDS and field not in self.SORTBY_FIELDS.values():
+                logger.warning(f"sorting by {field} not supported ... sorting by property path {field}")
+            sorts.append((self.SORTBY_FIELDS.get(field, field), descending))
+        return sorts
 
-    def _get_sort_payload(self, sortby):
-        raise RuntimeError("Not implemented")
+    def _sort_results(self, results: list[dict[str, Any]], top_k: int | None = None) -> list[dict[str, Any]]:
+        key_funcs = [partial(_get_task_sort_value, path=path) for path, _ in self.sortby]
+        descending = [desc for _, desc in self.sortby]
+        return _sort_items(results, key_funcs, descending, top_k=top_k)
 
     def _get_query_payload(self, kwargs) -> dict[str, Any]:
         query_payload: dict[str, Any] = defaultdict(dict)
 
         if self.SEARCH_ENTITY == SearchEntity.TASKING_REQUEST:
-            query_payload["includeRepeatingTasks"] = {"eq": False}
+            query_payload["includeRepeatingTasks"] = {"eq": self.include_repeating_tasks}
 
         for_org = kwargs.pop("for_org", False)
         query_payload = self._add_user_org_query(query_payload, for_org, **kwargs)
@@ -691,24 +1104,68 @@ class AbstractTaskRepeatSearch(AbstractSearch):
     def fetch_all(self) -> TaskingRequestSearchResult | RepeatRequestSearchResult:
         search_result = self._init_search_result()
         logger.info(f"searching {self.SEARCH_ENTITY.value}s with payload {self.payload}")
-        first_page = _fetch_page(
-            params={"page": 1, "limit": self.page_size},
-            session=self.session,
-            search_endpoint=self.SEARCH_ENDPOINT,
-            search_entity=self.SEARCH_ENTITY,
-            search_payload=self.payload,
-        )
-
-        total_pages = first_page["totalPages"]
-        fetch_more = total_pages > 1
 
+        pages = self.iter_pages()
+        first_page = next(pages)
         search_result.add(first_page)
-        if not fetch_more:
-            print_task_search_result(search_result._features, search_entity=self.SEARCH_ENTITY.value)
-            return search_result
+        num_pages = self._get_num_pages(first_page)
 
-        page_params = [{"page": i, "limit": self.page_size} for i in range(2, total_pages + 1)]
+        if not self.show_progress or num_pages <= 1:
+            for page in pages:
+                search_result.add(page)
+        else:
+            # with progress bar
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+            ) as progress:
+                task = progress.add_task(f"[cyan]Fetching {self.SEARCH_ENTITY.value}s...", total=num_pages)
+                progress.update(task, advance=1)
+
+                for page in pages:
+                    search_result.add(page)
+                    progress.update(task, advance=1)
+
+        if self.sortby:
+            search_result._features = self._sort_results(search_result._features, top_k=self.max_results)
+            search_result._reset_indexes()
+
+        search_result._truncate(limit=self.max_results)
+        print_task_search_result(search_result._features, search_entity=self.SEARCH_ENTITY.value)
+        return search_result
+
+    def iter_results(self) -> Iterator[dict[str, Any]]:
+        """
+        yield matched results in page order, stops fetching pages once `max_results` are yielded
+
+        if `sortby` is provided all pages are fetched before yielding the sorted results
+        """
+        if self.sortby:
+            results = [result for page in self.iter_pages() for result in page["results"]]
+            yield from self._sort_results(results, top_k=self.max_results)
+            return
 
+        pages = self.iter_pages()
+        num_yielded = 0
+        try:
+            for page in pages:
+                for result in page["results"]:
+                    if self.max_results is not None and num_yielded >= self.max_results:
+                        return
+                    yield result
+                    num_yielded += 1
+        finally:
+            pages.close()
+
+    def iter_pages(self) -> Generator[dict[str, Any], None, None]:
+        """
+        yield result pages in page order
+
+        if threaded max. TR_MAX_CONCURRENCY pages are requested ahead of the page currently processed (within the
+        concurrency budget shared by bulk operations), pages beyond `max_results` are not requested
+        """
         _fetch_worker = partial(
             _fetch_page,
             session=self.session,
@@ -717,58 +1174,71 @@ class AbstractTaskRepeatSearch(AbstractSearch):
             search_payload=self.payload,
             silent=self.show_progress,
         )
+        executor = BulkExecutor(max_workers=TR_MAX_CONCURRENCY if self.threaded else 1)
+        first_page = executor.call(
+            _fetch_page,
+            params={"page": 1, "limit": self.page_size},
+            session=self.session,
+            search_endpoint=self.SEARCH_ENDPOINT,
+            search_entity=self.SEARCH_ENTITY,
+            search_payload=self.payload,
+        )
+        yield first_page
 
-        if not self.show_progress:
-            if self.threaded:
-                with ThreadPoolExecutor(max_workers=TR_MAX_CONCURRENCY) as executor:
-                    results = executor.map(_fetch_worker, page_params)
-
-                for page in results:
-                    search_result.add(page)
-            else:
-                for params in page_params:
-                    page = _fetch_worker(params)
-                    search_result.add(page)
-            print_task_search_result(search_result._features, search_entity=self.SEARCH_ENTITY.value)
-            return search_result
+        page_params = iter(
+            [{"page": i, "limit": self.page_size} for i in range(2, self._get_num_pages(first_page) + 1)]
+        )
 
-        # with progress bar
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-        ) as progress:
-            task = progress.add_task(f"[cyan]Fetching {self.SEARCH_ENTITY.value}s...", total=total_pages)
-            progress.update(task, advance=1)
-
-            if self.threaded:
-                with ThreadPoolExecutor(max_workers=TR_MAX_CONCURRENCY) as executor:
-                    futures = {executor.submit(_fetch_worker, params): params for params in page_params}
-
-                    for future in as_completed(futures):
-                        page = future.result()
-                        search_result.add(page)
-                        progress.update(task, advance=1)
-            else:
-                for params in page_params:
-                    page = _fetch_worker(params)
-                    search_result.add(page)
-                    progress.update(task, advance=1)
+        if not self.threaded:
+            for params in page_params:
+                yield executor.call(_fetch_worker, params)
+            return
 
-        print_task_search_result(search_result._features, search_entity=self.SEARCH_ENTITY.value)
-        return search_result
+        with executor:
+            in_flight = deque(
+                executor.submit(_fetch_worker, params) for params in islice(page_params, TR_MAX_CONCURRENCY)
+            )
+            while in_flight:
+                page = in_flight.popleft().result()
+                next_params = next(page_params, None)
+                if next_params is not None:
+                    in_flight.append(executor.submit(_fetch_worker, next_params))
+                yield page
+
+    def _get_num_pages(self, first_page: dict[str, Any]) -> int:
+        total_pages: int = first_page["totalPages"]
+        # sorting requires all results
+        if self.max_results is None or self.sortby:
+            return total_pages
+        return min(total_pages, max(ceil(self.max_results / self.page_size), 1))
 
     @abstractmethod
     def _init_search_result(self) -> TaskingRequestSearchResult | RepeatRequestSearchResult: ...
 
 
+def _get_task_sort_value(item: dict[str, Any], path: str) -> Any:
+    """sort value of (dotted) property `path` of tasking/ repeat request, datetime properties are parsed"""
+    properties = item.get("properties", {})
+    if path in ("lastStatusTime", "lastStatusCode"):
+        status_history = properties.get("statusHistory") or [{}]
+        value = status_history[0].get("time" if path == "lastStatusTime" else "code")
+    else:
+        value = properties
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+
+    if value is not None and path in TASK_REPEAT_SORTBY_DATETIME_PROPERTIES:
+        value = parse(value)
+    return value
+
+
 class TaskingRequestSearch(AbstractTaskRepeatSearch):
     SEARCH_ENTITY = SearchEntity.TASKING_REQUEST
     SEARCH_ENDPOINT = "/tasks/search"
     QUERY_PAYLOAD_FIELD = "query"
     SUPPORTED_QUERY_FIELDS = SUPPORTED_TASKING_REQUEST_SEARCH_QUERY_FIELDS
     FILTERS_BY_QUERY_FIELDS = TR_FILTERS_BY_QUERY_FIELDS
+    SORTBY_FIELDS = TR_SORTBY_FIELDS
     QUERY_SANITIZER_CLS: type[AbstractQuerySanitizer] = TaskingRequestQuerySanitizer
 
     def _init_search_result(self) -> TaskingRequestSearchResult:
@@ -781,6 +1251,7 @@ class RepeatRequestSearch(AbstractTaskRepeatSearch):
     QUERY_PAYLOAD_FIELD = "filter"
     SUPPORTED_QUERY_FIELDS = SUPPORTED_RR_SEARCH_QUERY_FIELDS
     FILTERS_BY_QUERY_FIELDS = RR_FILTERS_BY_QUERY_FIELDS
+    SORTBY_FIELDS = RR_SORTBY_FIELDS
     QUERY_SANITIZER_CLS = RepeatRequestQuerySanitizer
 
     def _init_search_result(self) -> RepeatRequestSearchResult:
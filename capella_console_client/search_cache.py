@@ -0,0 +1,129 @@
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from capella_console_client.config import (
+    SEARCH_CACHE_DEFAULT_PATH,
+    SEARCH_CACHE_DEFAULT_TTL,
+    SEARCH_CACHE_MAX_BYTES,
+)
+from capella_console_client.logconf import logger
+from capella_console_client.stac_item import CompactStacItem
+
+
+def _to_json(obj: Any) -> dict[str, Any]:
+    """serialize mapping-like items, CompactStacItem without caching its decoded fields"""
+    if isinstance(obj, CompactStacItem):
+        return obj.to_dict()
+    return dict(obj)
+
+
+class SearchCache:
+    """
+    opt-in on-disk (SQLite) cache of STAC search responses
+
+    Args:
+        path: SQLite file the cached pages are stored in
+        ttl: seconds a cached search result is valid for
+        max_bytes: upper bound of cached page bytes, least recently used entries are evicted first
+    """
+
+    def __init__(
+        self,
+        path: Path | str = SEARCH_CACHE_DEFAULT_PATH,
+        ttl: float = SEARCH_CACHE_DEFAULT_TTL,
+        max_bytes: int = SEARCH_CACHE_MAX_BYTES,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "key TEXT PRIMARY KEY, created_at REAL, accessed_at REAL, size INTEGER, pages BLOB)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # one connection per operation keeps the cache usable from multiple threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def key(payload: dict[str, Any], scope: str = "") -> str:
+        """
+        canonical hash of search payload (query, sortby, limit, ownership, ...)
+
+        * dict keys are sorted
+        * values of `in` filters and `ids` are order independent
+        * `scope` separates results of different API environments/ users
+        """
+        canonical = dict(payload)
+        if "ids" in canonical:
+            canonical["ids"] = sorted(canonical["ids"])
+
+        query = canonical.get("query")
+        if query:
+            canonical["query"] = {
+                field: {op: sorted(val, key=str) if op == "in" else val for op, val in ops.items()}
+                for field, ops in query.items()
+            }
+
+        serialized = json.dumps([scope, canonical], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT created_at, pages FROM search_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            created_at, pages = row
+            if now - created_at > self.ttl:
+                conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                return None
+
+            conn.execute("UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key))
+
+        logger.info(f"serving search from cache {self.path}")
+        return json.loads(pages)
+
+    def set(self, key: str, pages: list[dict[str, Any]]) -> None:
+        now = time.time()
+        blob = json.dumps(pages, default=_to_json).encode()
+        if len(blob) > self.max_bytes:
+            logger.warning(
+                f"search result ({len(blob)} bytes) exceeds cache size ({self.max_bytes} bytes) ... not caching"
+            )
+            return
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?)",
+                (key, now, now, len(blob), blob),
+            )
+            conn.execute("DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl,))
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM search_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evict = []
+        for key, size in conn.execute("SELECT key, size FROM search_cache ORDER BY accessed_at ASC"):
+            if total <= self.max_bytes:
+                break
+            evict.append((key,))
+            total -= size
+
+        conn.executemany("DELETE FROM search_cache WHERE key = ?", evict)
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM search_cache")
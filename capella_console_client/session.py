@@ -1,10 +1,13 @@
+import hashlib
 import os
 import warnings
 from enum import Enum
 from getpass import getpass
+from typing import Any
 
 import httpx
 
+from capella_console_client.codec import JsonCodec, get_json_codec
 from capella_console_client.config import CAPELLA_API_KEY_ENV, CONSOLE_API_URL, DEFAULT_TIMEOUT
 from capella_console_client.enumerations import AuthHeaderPrefix
 from capella_console_client.exceptions import (
@@ -32,6 +35,7 @@ class CapellaConsoleSession(httpx.Client):
     def __init__(self, *args, **kwargs):
         verbose = kwargs.pop("verbose", False)
         search_url = kwargs.pop("search_url", None)
+        json_codec = kwargs.pop("json_codec", None)
         event_hooks = [translate_error_to_exception]
         if verbose:
             event_hooks.insert(0, log_on_4xx_5xx)
@@ -53,6 +57,18 @@ class CapellaConsoleSession(httpx.Client):
         self.organization_id = None
 
         self.search_url = search_url if search_url is not None else f"{self.base_url}/catalog/search"
+        self.json_codec: JsonCodec = get_json_codec(json_codec)
+
+    def build_request(self, method, url, *, content=None, json=None, **kwargs) -> httpx.Request:
+        """encode json request bodies with configured json codec"""
+        if json is not None and content is None:
+            content = self.json_codec.dumps(json)
+            json = None
+        return super().build_request(method, url, content=content, json=json, **kwargs)
+
+    def decode_json(self, response: httpx.Response) -> Any:
+        """decode json response body with configured json codec"""
+        return self.json_codec.loads(response.content)
 
     def authenticate(
         self,
@@ -109,6 +125,16 @@ class CapellaConsoleSession(httpx.Client):
 
         self.headers[AUTHORIZATION_HEADER_NAME] = token
 
+    @property
+    def identity(self) -> str | None:
+        """user id or hash of credential if user info not cached (`no_token_check`), None if unauthenticated"""
+        if self.customer_id:
+            return f"user:{self.customer_id}"
+        credential = self.headers.get(AUTHORIZATION_HEADER_NAME)
+        if not credential:
+            return None
+        return f"credential:{hashlib.sha256(credential.encode()).hexdigest()}"
+
     def _cache_user_info(self):
         """cache customer_id and organization_id - serves as test for successful auth"""
         resp = self.get("/user")
@@ -1,5 +1,16 @@
+import heapq
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from functools import partial
 from typing import Any
 
+from dateutil.parser import parse
+
+from capella_console_client.config import (
+    STAC_DATETIME_FIELDS,
+    STAC_PREFIXED_BY_QUERY_FIELDS,
+    STAC_ROOT_LEVEL_GROUPBY_FIELDS,
+)
 from capella_console_client.logconf import logger
 
 
@@ -7,6 +18,10 @@ def _sort_stac_items(items: list[dict[str, Any]], stac_ids: list[str]) -> list[d
     """
     sort items by stac_ids
 
+    * items sharing the same id are kept in their original relative order
+    * repeated stac_ids are sorted by their first occurrence
+    * stac_ids not contained in items are skipped, items not contained in stac_ids are appended in original order
+
     Args:
         items (List[Dict[str, Any]]): stac items
         stac_ids (List[str]): stac ids to sort by
@@ -18,15 +33,104 @@ def _sort_stac_items(items: list[dict[str, Any]], stac_ids: list[str]) -> list[d
         logger.warning(f"wrong size stac_ids ({len(stac_ids)} instead of {len(items)})... omitting sort ")
         return items
 
+    items_by_id = defaultdict(list)
+    for item in items:
+        items_by_id[item["id"]].append(item)
+
     sorted = []
-    item_ids = [s["id"] for s in items]
-    for stac_id in stac_ids:
-        try:
-            cur = items[item_ids.index(stac_id)]
-        except ValueError:
-            continue
-        sorted.append(cur)
-
-    not_in_items = [item for item in items if item["id"] not in stac_ids]
-    sorted.extend(not_in_items)
+    missing = []
+    for stac_id in dict.fromkeys(stac_ids):
+        if stac_id in items_by_id:
+            sorted.extend(items_by_id.pop(stac_id))
+        else:
+            missing.append(stac_id)
+
+    if missing:
+        logger.info(f"{len(missing)} stac_ids to sort by not contained in items: {', '.join(map(str, missing))}")
+
+    # items_by_id preserves insertion order
+    sorted.extend(item for cur in items_by_id.values() for item in cur)
     return sorted
+
+
+def _parse_sort_arg(sort_arg: str) -> tuple[str, bool]:
+    """(field, descending) of sort argument with optional direction prefix "-" (descending) or "+" (ascending)"""
+    descending = sort_arg.startswith("-")
+    field = sort_arg[1:] if sort_arg[:1] in ("-", "+") else sort_arg
+    return field, descending
+
+
+def _get_sort_value(item: dict[str, Any], field: str) -> Any:
+    """sort value of STAC item `field`, datetime properties are parsed"""
+    if field in STAC_ROOT_LEVEL_GROUPBY_FIELDS:
+        return item.get(field)
+
+    value = item.get("properties", {}).get(STAC_PREFIXED_BY_QUERY_FIELDS.get(field, field))
+    if value is not None and field in STAC_DATETIME_FIELDS:
+        value = parse(value)
+    return value
+
+
+def _sort_stac_items_by_properties(items: list[dict[str, Any]], sortby: str | list[str]) -> list[dict[str, Any]]:
+    """
+    sort items by properties
+
+    Args:
+        items (List[Dict[str, Any]]): stac items
+        sortby (str | List[str]): fields to sort by with optional direction prefix (same syntax as search sortby),
+                                  e.g. ["-datetime", "+incidence_angle"] - items missing a field are sorted last
+
+    Returns:
+        List[Dict[str, Any]]: stac items sorted by properties
+    """
+    if isinstance(sortby, str):
+        sortby = [sortby]
+
+    sorts = [_parse_sort_arg(sort_arg) for sort_arg in sortby]
+    key_funcs = [partial(_get_sort_value, field=field) for field, _ in sorts]
+    return _sort_items(items, key_funcs, [descending for _, descending in sorts])
+
+
+class _SortKey:
+    """precomputed multi key sort value, None values are sorted last regardless of direction"""
+
+    __slots__ = ("values", "descending")
+
+    def __init__(self, values: tuple[Any, ...], descending: Sequence[bool]):
+        self.values = values
+        self.descending = descending
+
+    def __lt__(self, other: "_SortKey") -> bool:
+        for value, other_value, descending in zip(self.values, other.values, self.descending):
+            if value == other_value:
+                continue
+            if value is None:
+                return False
+            if other_value is None:
+                return True
+            return bool(value > other_value) if descending else bool(value < other_value)
+        return False
+
+
+def _sort_items(
+    items: list[dict[str, Any]],
+    key_funcs: Sequence[Callable[[dict[str, Any]], Any]],
+    descending: Sequence[bool],
+    top_k: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    stable multi key sort of items
+
+    Args:
+        items: items to sort
+        key_funcs: sort value extraction per key (called once per item and key)
+        descending: sort direction per key
+        top_k: only return first `top_k` sorted items (partial sort)
+    """
+    keys = [_SortKey(tuple(key_func(item) for key_func in key_funcs), descending) for item in items]
+    indices = range(len(items))
+    if top_k is not None and top_k < len(items):
+        order = heapq.nsmallest(top_k, indices, key=keys.__getitem__)
+    else:
+        order = sorted(indices, key=keys.__getitem__)
+    return [items[idx] for idx in order]
@@ -0,0 +1,293 @@
+"""in-memory spatial index over STAC item footprints (planar lon/lat coordinates)"""
+
+import heapq
+from collections.abc import Iterator
+from itertools import count
+from math import ceil, hypot, sqrt
+from typing import Any
+
+# max number of children per STR-tree node
+STR_TREE_NODE_CAPACITY = 16
+
+BBox = tuple[float, float, float, float]
+Coordinate = tuple[float, float]
+Segment = tuple[Coordinate, Coordinate]
+
+
+def _as_geometry(geom: Any) -> dict[str, Any]:
+    """GeoJSON geometry of GeoJSON Feature, geometry or (lon, lat) point"""
+    if isinstance(geom, (tuple, list)):
+        return {"type": "Point", "coordinates": list(geom)}
+    if geom.get("type") == "Feature":
+        return dict(geom["geometry"])
+    return dict(geom)
+
+
+def _iter_coordinates(coordinates: Any) -> Iterator[Coordinate]:
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        yield (coordinates[0], coordinates[1])
+        return
+    for cur in coordinates:
+        yield from _iter_coordinates(cur)
+
+
+def _iter_parts(geometry: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """single part geometries (Point, LineString, Polygon) of (multi part) geometry"""
+    geom_type = geometry["type"]
+    if geom_type == "GeometryCollection":
+        for cur in geometry["geometries"]:
+            yield from _iter_parts(cur)
+    elif geom_type.startswith("Multi"):
+        for coordinates in geometry["coordinates"]:
+            yield {"type": geom_type[len("Multi") :], "coordinates": coordinates}
+    else:
+        yield geometry
+
+
+def geometry_bbox(geometry: dict[str, Any]) -> BBox:
+    xs, ys = zip(*(c for part in _iter_parts(geometry) for c in _iter_coordinates(part["coordinates"])))
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def stac_bbox(bbox: list[float]) -> BBox:
+    """2D bbox of STAC `bbox`, 3D bboxes are [min_x, min_y, min_z, max_x, max_y, max_z]"""
+    if len(bbox) == 6:
+        return (bbox[0], bbox[1], bbox[3], bbox[4])
+    return (bbox[0], bbox[1], bbox[2], bbox[3])
+
+
+def _bboxes_intersect(a: BBox, b: BBox) -> bool:
+    return not (a[0] > b[2] or a[2] < b[0] or a[1] > b[3] or a[3] < b[1])
+
+
+def _bbox_distance(point: Coordinate, bbox: BBox) -> float:
+    dx = max(bbox[0] - point[0], 0.0, point[0] - bbox[2])
+    dy = max(bbox[1] - point[1], 0.0, point[1] - bbox[3])
+    return hypot(dx, dy)
+
+
+def _union(bboxes: list[BBox]) -> BBox:
+    return (
+        min(b[0] for b in bboxes),
+        min(b[1] for b in bboxes),
+        max(b[2] for b in bboxes),
+        max(b[3] for b in bboxes),
+    )
+
+
+def _segments(geometry: dict[str, Any]) -> list[Segment]:
+    segments: list[Segment] = []
+    for part in _iter_parts(geometry):
+        if part["type"] == "LineString":
+            lines = [part["coordinates"]]
+        elif part["type"] == "Polygon":
+            lines = part["coordinates"]
+        else:
+            continue
+        for line in lines:
+            coordinates = [(c[0], c[1]) for c in line]
+            segments.extend(zip(coordinates[:-1], coordinates[1:]))
+    return segments
+
+
+def _point_in_ring(point: Coordinate, ring: list[list[float]]) -> bool:
+    x, y = point
+    inside = False
+    for (x1, y1), (x2, y2) in zip(ring[:-1], ring[1:]):
+        if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+            inside = not inside
+    return inside
+
+
+def _point_in_area(point: Coordinate, geometry: dict[str, Any]) -> bool:
+    """True if point is contained in interior of any polygon (outer ring without holes) of geometry"""
+    for part in _iter_parts(geometry):
+        if part["type"] != "Polygon":
+            continue
+        outer, *holes = part["coordinates"]
+        if _point_in_ring(point, outer) and not any(_point_in_ring(point, hole) for hole in holes):
+            return True
+    return False
+
+
+def _point_segment_distance(point: Coordinate, segment: Segment) -> float:
+    (x1, y1), (x2, y2) = segment
+    dx, dy = x2 - x1, y2 - y1
+    if dx == dy == 0:
+        return hypot(point[0] - x1, point[1] - y1)
+    t = max(0.0, min(1.0, ((point[0] - x1) * dx + (point[1] - y1) * dy) / (dx * dx + dy * dy)))
+    return hypot(point[0] - (x1 + t * dx), point[1] - (y1 + t * dy))
+
+
+def _orientation(a: Coordinate, b: Coordinate, c: Coordinate) -> float:
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def _segments_intersect(s: Segment, t: Segment) -> bool:
+    d1 = _orientation(t[0], t[1], s[0])
+    d2 = _orientation(t[0], t[1], s[1])
+    d3 = _orientation(s[0], s[1], t[0])
+    d4 = _orientation(s[0], s[1], t[1])
+    if ((d1 > 0) != (d2 > 0) and d1 != 0 and d2 != 0) and ((d3 > 0) != (d4 > 0) and d3 != 0 and d4 != 0):
+        return True
+    # collinear or touching
+    return (
+        _point_segment_distance(s[0], t) == 0
+        or _point_segment_distance(s[1], t) == 0
+        or _point_segment_distance(t[0], s) == 0
+        or _point_segment_distance(t[1], s) == 0
+    )
+
+
+def distance(point: Coordinate, geometry: dict[str, Any]) -> float:
+    """planar distance from point to geometry (0 if contained)"""
+    if _point_in_area(point, geometry):
+        return 0.0
+
+    distances = [_point_segment_distance(point, segment) for segment in _segments(geometry)]
+    distances.extend(
+        hypot(point[0] - part["coordinates"][0], point[1] - part["coordinates"][1])
+        for part in _iter_parts(geometry)
+        if part["type"] == "Point"
+    )
+    return min(distances, default=float("inf"))
+
+
+def intersects(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    """True if geometries `a` and `b` share at least one point"""
+    if not _bboxes_intersect(geometry_bbox(a), geometry_bbox(b)):
+        return False
+
+    a_segments, b_segments = _segments(a), _segments(b)
+    if not a_segments or not b_segments:
+        # (multi) point geometry
+        points, other = (a, b) if not a_segments else (b, a)
+        return any(
+            distance(c, other) == 0 for part in _iter_parts(points) for c in _iter_coordinates(part["coordinates"])
+        )
+
+    if any(_point_in_area(c, b) for c, _ in a_segments) or any(_point_in_area(c, a) for c, _ in b_segments):
+        return True
+
+    return any(_segments_intersect(s, t) for s in a_segments for t in b_segments)
+
+
+class STRtree:
+    """
+    static R-tree bulk loaded with the Sort-Tile-Recursive algorithm
+
+    leaf entries are indices into provided `bboxes`
+    """
+
+    def __init__(self, bboxes: list[BBox], node_capacity: int = STR_TREE_NODE_CAPACITY):
+        self.bboxes = bboxes
+        self.node_capacity = node_capacity
+        # node: (bbox, children, is_leaf)
+        self.root: tuple[BBox, list[Any], bool] | None = self._build()
+
+    def _pack(self, entries: list[tuple[BBox, Any]], is_leaf: bool) -> list[tuple[BBox, list[Any], bool]]:
+        capacity = self.node_capacity
+        num_slices = ceil(sqrt(ceil(len(entries) / capacity)))
+        slice_size = num_slices * capacity
+
+        entries = sorted(entries, key=lambda e: e[0][0] + e[0][2])
+        nodes = []
+        for slice_start in range(0, len(entries), slice_size):
+            cur_slice = sorted(entries[slice_start : slice_start + slice_size], key=lambda e: e[0][1] + e[0][3])
+            for node_start in range(0, len(cur_slice), capacity):
+                children = cur_slice[node_start : node_start + capacity]
+                nodes.append((_union([c[0] for c in children]), [c[1] for c in children], is_leaf))
+        return nodes
+
+    def _build(self) -> tuple[BBox, list[Any], bool] | None:
+        if not self.bboxes:
+            return None
+
+        nodes = self._pack([(bbox, idx) for idx, bbox in enumerate(self.bboxes)], is_leaf=True)
+        while len(nodes) > 1:
+            nodes = self._pack([(node[0], node) for node in nodes], is_leaf=False)
+        return nodes[0]
+
+    def query(self, bbox: BBox) -> list[int]:
+        """indices of entries whose bbox intersects `bbox`"""
+        if self.root is None:
+            return []
+
+        matches: list[int] = []
+        stack = [self.root]
+        while stack:
+            node_bbox, children, is_leaf = stack.pop()
+            if not _bboxes_intersect(node_bbox, bbox):
+                continue
+            if is_leaf:
+                matches.extend(idx for idx in children if _bboxes_intersect(self.bboxes[idx], bbox))
+            else:
+                stack.extend(children)
+        return sorted(matches)
+
+    def iter_nearest(self, point: Coordinate) -> Iterator[tuple[float, int]]:
+        """(bbox distance, index) of entries in ascending bbox distance to `point` (best first search)"""
+        if self.root is None:
+            return
+
+        tiebreak = count()
+        heap: list[tuple[float, int, Any, bool]] = [(0.0, next(tiebreak), self.root, False)]
+        while heap:
+            dist, _, entry, is_item = heapq.heappop(heap)
+            if is_item:
+                yield dist, entry
+                continue
+
+            _, children, is_leaf = entry
+            for child in children:
+                child_bbox = self.bboxes[child] if is_leaf else child[0]
+                heapq.heappush(heap, (_bbox_distance(point, child_bbox), next(tiebreak), child, is_leaf))
+
+
+class SpatialIndex:
+    """
+    spatial index over STAC item footprints, see :py:meth:`StacSearchResult.spatial_index`
+
+    * geometries can be GeoJSON geometries, GeoJSON Features or (lon, lat) points
+    * predicates are evaluated on planar lon/lat coordinates
+    """
+
+    def __init__(self, features: list[dict[str, Any]]):
+        self.features = [f for f in features if f.get("geometry")]
+        self._geometries = [_as_geometry(f["geometry"]) for f in self.features]
+        bboxes = [
+            stac_bbox(f["bbox"]) if f.get("bbox") else geometry_bbox(geometry)
+            for f, geometry in zip(self.features, self._geometries)
+        ]
+        self.tree = STRtree(bboxes)  # type: ignore[arg-type]
+
+    def __len__(self):
+        return len(self.features)
+
+    def intersecting(self, geom: Any) -> list[dict[str, Any]]:
+        """STAC items whose footprint intersects `geom`"""
+        geometry = _as_geometry(geom)
+        candidates = self.tree.query(geometry_bbox(geometry))
+        return [self.features[idx] for idx in candidates if intersects(self._geometries[idx], geometry)]
+
+    def covering(self, point: Any) -> list[dict[str, Any]]:
+        """STAC items whose footprint contains `point`"""
+        geometry = _as_geometry(point)
+        coordinate = next(_iter_coordinates(geometry["coordinates"]))
+        candidates = self.tree.query((*coordinate, *coordinate))
+        return [self.features[idx] for idx in candidates if distance(coordinate, self._geometries[idx]) == 0]
+
+    def nearest(self, point: Any, k: int = 1) -> list[dict[str, Any]]:
+        """`k` STAC items with footprint nearest to `point` (nearest first)"""
+        coordinate = next(_iter_coordinates(_as_geometry(point)["coordinates"]))
+
+        found: list[tuple[float, int]] = []
+        for bbox_dist, idx in self.tree.iter_nearest(coordinate):
+            # bbox distance is a lower bound of footprint distance
+            if len(found) >= k and bbox_dist > found[-1][0]:
+                break
+            found.append((distance(coordinate, self._geometries[idx]), idx))
+            found.sort()
+            del found[k:]
+
+        return [self.features[idx] for _, idx in found]
@@ -0,0 +1,67 @@
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+from capella_console_client.codec import JsonCodec, get_json_codec
+
+# kept decoded, all other fields are encoded
+_DECODED_KEYS = ("id", "collection")
+
+
+class CompactStacItem(Mapping):
+    """
+    read-only STAC item holding its fields as compact JSON bytes
+
+    * `id` and `collection` are kept decoded
+    * all other fields (`properties`, `assets`, `geometry`, ...) are encoded separately (with the session's json codec)
+      and decoded once on first access
+    * supports dict style access for backwards compatibility, e.g. item["id"], item["properties"], item.get(...)
+    """
+
+    __slots__ = ("id", "collection", "_keys", "_encoded", "_decoded", "_loads")
+
+    def __init__(self, feature: dict[str, Any], codec: JsonCodec | None = None):
+        codec = codec or get_json_codec()
+        self.id: str = feature["id"]
+        self.collection: str | None = feature.get("collection")
+        self._keys: tuple[str, ...] = tuple(feature)
+        self._encoded: dict[str, bytes] = {
+            key: codec.dumps(value) for key, value in feature.items() if key not in _DECODED_KEYS
+        }
+        self._decoded: dict[str, Any] = {}
+        self._loads: Callable[[bytes], Any] = codec.loads
+
+    @classmethod
+    def from_feature(
+        cls, feature: "dict[str, Any] | CompactStacItem", codec: JsonCodec | None = None
+    ) -> "CompactStacItem":
+        if isinstance(feature, CompactStacItem):
+            return feature
+        return cls(feature, codec)
+
+    def to_dict(self) -> dict[str, Any]:
+        """decoded copy of item (not cached)"""
+        return {
+            key: getattr(self, key) if key in _DECODED_KEYS else self._loads(self._encoded[key]) for key in self._keys
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _DECODED_KEYS:
+            if key not in self._keys:
+                raise KeyError(key)
+            return getattr(self, key)
+
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        # concurrent readers decoding the same field keep the first decoded value
+        return self._decoded.setdefault(key, self._loads(self._encoded[key]))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(id={self.id!r})"
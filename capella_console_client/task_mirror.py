@@ -0,0 +1,171 @@
+import json
+import sqlite3
+import time
+from contextlib import closing
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+
+from dateutil.parser import parse
+
+from capella_console_client.config import QUERY_OPERATORS, TASK_MIRROR_DEFAULT_PATH
+from capella_console_client.enumerations import BaseEnum
+from capella_console_client.logconf import logger
+from capella_console_client.validate import _datetime_to_iso8601_str
+
+MIRROR_ENTITIES = ("tasking_request", "repeat_request")
+
+SQL_OPERATORS = {"eq": "=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+# query filter -> column
+MIRROR_DATETIME_COLUMNS = {"last_status_time", "submission_time", "window_open", "window_close"}
+MIRROR_VALUE_COLUMNS = {"status", "collection_type", "collection_tier"}
+
+
+def _to_utc_str(value: Any) -> str | None:
+    """normalized UTC timestamp (fixed millisecond precision) in order to compare stored timestamps as text"""
+    if value is None:
+        return None
+    dt = value if not isinstance(value, str) else parse(value)
+    # naive datetimes are UTC
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return _datetime_to_iso8601_str(dt)
+
+
+def _get_row(entity: str, item: dict[str, Any]) -> tuple[Any, ...]:
+    properties = item["properties"]
+    last_status = (properties.get("statusHistory") or [{}])[0]
+
+    if entity == "repeat_request":
+        request_id = properties["repeatrequestId"]
+        repetition_properties = properties.get("repetitionProperties") or {}
+        window_open = repetition_properties.get("repeatStart")
+        window_close = repetition_properties.get("repeatEnd")
+    else:
+        request_id = properties["taskingrequestId"]
+        window_open = properties.get("windowOpen")
+        window_close = properties.get("windowClose")
+
+    return (
+        request_id,
+        entity,
+        last_status.get("code"),
+        _to_utc_str(last_status.get("time")),
+        _to_utc_str(properties.get("submissionTime")),
+        _to_utc_str(window_open),
+        _to_utc_str(window_close),
+        properties.get("collectionType"),
+        properties.get("collectionTier"),
+        json.dumps(item),
+    )
+
+
+class TaskingRequestMirror:
+    """
+    local SQLite mirror of tasking and repeat requests, see :py:meth:`CapellaConsoleClient.sync_tasking_requests`
+
+    Args:
+        path: SQLite file the mirrored requests are stored in
+    """
+
+    def __init__(self, path: Path | str = TASK_MIRROR_DEFAULT_PATH):
+        self.path = Path(path)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS requests ("
+                "id TEXT, entity TEXT, status TEXT, last_status_time TEXT, submission_time TEXT, "
+                "window_open TEXT, window_close TEXT, collection_type TEXT, collection_tier TEXT, item TEXT, PRIMARY KEY (entity, id))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS requests_status ON requests (entity, status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS requests_window ON requests (entity, window_open)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (scope TEXT PRIMARY KEY, watermark TEXT, synced_at REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # one connection per operation keeps the mirror usable from multiple threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get_watermark(self, scope: str) -> str | None:
+        """newest `lastStatusTime` seen by previous sync of `scope`"""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT watermark FROM sync_state WHERE scope = ?", (scope,)).fetchone()
+        return (row[0] or None) if row else None
+
+    def upsert(self, entity: str, items: list[dict[str, Any]], scope: str) -> int:
+        """
+        insert or replace `items` and advance watermark of `scope` to their newest `lastStatusTime`
+
+        Returns:
+            int: number of upserted items
+        """
+        rows = [_get_row(entity, item) for item in items]
+        watermark = max((row[3] for row in rows if row[3]), default=None)
+
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO requests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.execute(
+                "INSERT INTO sync_state VALUES (?, ?, ?) ON CONFLICT(scope) DO UPDATE SET "
+                "watermark = MAX(COALESCE(watermark, ''), COALESCE(excluded.watermark, '')), "
+                "synced_at = excluded.synced_at",
+                (scope, watermark, time.time()),
+            )
+        return len(rows)
+
+    def query(self, entity: str = "tasking_request", **filters: Any) -> list[dict[str, Any]]:
+        """
+        mirrored requests matching `filters`, latest status change first
+
+        supported filters:
+
+         • status: str | List[str], current status, e.g. "completed", ["accepted", "active"]
+         • collection_type: str | List[str], e.g. "spotlight"
+         • collection_tier: str | List[str], e.g. "priority"
+         • last_status_time, submission_time: str | datetime, UTC datetime
+         • window_open, window_close: str | datetime, UTC datetime (repeatStart/ repeatEnd of repeat requests)
+
+        supported operators (datetime filters): eq, gt, gte, lt, lte, e.g. window_open__gte="2024-01-01"
+
+        Args:
+            entity: "tasking_request" or "repeat_request"
+        """
+        if entity not in MIRROR_ENTITIES:
+            raise ValueError(f"entity {entity} not supported, must be one of {', '.join(MIRROR_ENTITIES)}")
+
+        clauses = ["entity = ?"]
+        params: list[Any] = [entity]
+        for name, value in filters.items():
+            column, _, op = name.partition("__")
+            op = op or "eq"
+            if column not in MIRROR_DATETIME_COLUMNS | MIRROR_VALUE_COLUMNS or op not in QUERY_OPERATORS:
+                logger.warning(f"filter {name} not supported ... omitting")
+                continue
+
+            if column in MIRROR_DATETIME_COLUMNS:
+                if op not in SQL_OPERATORS:
+                    logger.warning(f"operator {op} not supported for {column} ... omitting")
+                    continue
+                clauses.append(f"{column} {SQL_OPERATORS[op]} ?")
+                params.append(_to_utc_str(value))
+                continue
+
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            values = [str(v.value if isinstance(v, BaseEnum) else v).lower() for v in values]
+            clauses.append(f"LOWER({column}) IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+
+        sql = f"SELECT item FROM requests WHERE {' AND '.join(clauses)} ORDER BY last_status_time DESC"
+        with closing(self._connect()) as conn:
+            return [json.loads(row[0]) for row in conn.execute(sql, params)]
+
+    def __len__(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM requests").fetchone()[0]
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM requests")
+            conn.execute("DELETE FROM sync_state")
@@ -0,0 +1,182 @@
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from capella_console_client.config import (
+    TR_WATCH_BACKOFF_FACTOR,
+    TR_WATCH_MAX_INTERVAL,
+    TR_WATCH_MAX_NOT_FOUND,
+    TR_WATCH_MIN_INTERVAL,
+)
+from capella_console_client.enumerations import TaskingRequestStatus
+from capella_console_client.exceptions import CapellaConsoleClientError
+from capella_console_client.hooks import is_transient_error
+from capella_console_client.logconf import logger
+from capella_console_client.search import TaskingRequestSearch
+from capella_console_client.session import CapellaConsoleSession
+from capella_console_client.tasking_request import _task_contains_status
+
+# pseudo status of tasking requests not found by `TR_WATCH_MAX_NOT_FOUND` consecutive polls
+TR_NOT_FOUND_STATUS = "not_found"
+
+# no further status changes expected
+TR_TERMINAL_STATUSES = {
+    TR_NOT_FOUND_STATUS,
+    TaskingRequestStatus.completed.value,
+    TaskingRequestStatus.rejected.value,
+    TaskingRequestStatus.expired.value,
+    TaskingRequestStatus.canceled.value,
+    TaskingRequestStatus.error.value,
+    TaskingRequestStatus.failed.value,
+}
+
+
+def _get_status(task: dict[str, Any]) -> str | None:
+    status_history = task["properties"].get("statusHistory") or [{}]
+    status: str | None = status_history[0].get("code")
+    return status
+
+
+@dataclass
+class _WatchState:
+    status: str | None = None
+    completed: bool = False
+    interval: float = TR_WATCH_MIN_INTERVAL
+    next_poll: float = 0.0
+    not_found: int = 0
+
+
+class TaskingRequestWatcher:
+    """
+    poll status of many tasking requests by batched tasking request searches
+
+    * each tasking request is polled with jittered exponential backoff which is reset on status change
+    * tasking requests due within the same cycle are polled by a single search (including tasking requests derived
+      from repeat requests)
+    * tasking requests not found by `TR_WATCH_MAX_NOT_FOUND` consecutive polls (e.g. invalid ids or owned by other
+      users without `for_org`) get the terminal status "not_found"
+    * polls failing with transient errors (429, 5xx, connection errors) are logged and retried with backoff
+
+    Args:
+        session: authenticated session
+        tasking_request_ids: tasking requests to watch
+        on_status_change: called with (task, previous status, current status) on status change
+        on_completed: called with task once completed
+        min_interval: initial polling interval (seconds)
+        max_interval: max. polling interval (seconds)
+        for_org: watch tasking requests of user's org (requires elevated permissions)
+    """
+
+    def __init__(
+        self,
+        session: CapellaConsoleSession,
+        tasking_request_ids: list[str],
+        on_status_change: Callable[[dict[str, Any], str | None, str | None], Any] | None = None,
+        on_completed: Callable[[dict[str, Any]], Any] | None = None,
+        min_interval: float = TR_WATCH_MIN_INTERVAL,
+        max_interval: float = TR_WATCH_MAX_INTERVAL,
+        for_org: bool = False,
+    ):
+        self.session = session
+        self.on_status_change = on_status_change
+        self.on_completed = on_completed
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.for_org = for_org
+
+        self.tasks: dict[str, dict[str, Any]] = {}
+        self._states = {tr_id: _WatchState(interval=min_interval) for tr_id in dict.fromkeys(tasking_request_ids)}
+
+    @property
+    def pending_ids(self) -> list[str]:
+        return [tr_id for tr_id, state in self._states.items() if state.status not in TR_TERMINAL_STATUSES]
+
+    def poll(self, tasking_request_ids: list[str]) -> None:
+        """fetch `tasking_request_ids` by single search and dispatch status changes"""
+        search = TaskingRequestSearch(
+            session=self.session,
+            tasking_request_id=tasking_request_ids,
+            for_org=self.for_org,
+            include_repeating_tasks=True,
+        )
+        tasks_by_id = {task["properties"]["taskingrequestId"]: task for task in search.iter_results()}
+
+        now = time.monotonic()
+        for tr_id in tasking_request_ids:
+            state = self._states[tr_id]
+            task = tasks_by_id.get(tr_id)
+            if task is None:
+                state.not_found += 1
+                if state.not_found < TR_WATCH_MAX_NOT_FOUND:
+                    logger.warning(f"TaskingRequest<{tr_id}> not found")
+                    self._backoff(state, now)
+                    continue
+
+                logger.error(f"TaskingRequest<{tr_id}> not found by {state.not_found} polls ... not watching")
+                task = {"properties": {"taskingrequestId": tr_id, "statusHistory": []}}
+                previous, state.status = state.status, TR_NOT_FOUND_STATUS
+                if self.on_status_change is not None:
+                    self.on_status_change(task, previous, TR_NOT_FOUND_STATUS)
+                continue
+
+            state.not_found = 0
+            self.tasks[tr_id] = task
+            status = _get_status(task)
+            if status == state.status:
+                self._backoff(state, now)
+                continue
+
+            previous, state.status = state.status, status
+            state.interval = self.min_interval
+            state.next_poll = now + self._jitter(state.interval)
+
+            if self.on_status_change is not None:
+                self.on_status_change(task, previous, status)
+            if not state.completed and _task_contains_status(task, "completed"):
+                state.completed = True
+                if self.on_completed is not None:
+                    self.on_completed(task)
+
+    def _backoff(self, state: _WatchState, now: float) -> None:
+        state.interval = min(state.interval * TR_WATCH_BACKOFF_FACTOR, self.max_interval)
+        state.next_poll = now + self._jitter(state.interval)
+
+    def _jitter(self, interval: float) -> float:
+        # equal jitter: spread polls of tasking requests sharing the same state
+        return interval / 2 + random.uniform(0, interval / 2)
+
+    def watch(self, timeout: float | None = None) -> dict[str, dict[str, Any]]:
+        """
+        poll until all tasking requests reached a terminal status or `timeout` (seconds) expired
+
+        Returns:
+            Dict[str, Dict[str, Any]]: latest task by tasking request id
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while self.pending_ids:
+            now = time.monotonic()
+            due = [tr_id for tr_id in self.pending_ids if self._states[tr_id].next_poll <= now]
+            if due:
+                try:
+                    self.poll(due)
+                except (CapellaConsoleClientError, httpx.TransportError) as exc:
+                    if not is_transient_error(exc):
+                        raise
+                    logger.warning(f"polling {len(due)} tasking requests failed ({exc!r}) ... retrying")
+                    now = time.monotonic()
+                    for tr_id in due:
+                        self._backoff(self._states[tr_id], now)
+                continue
+
+            next_poll = min(self._states[tr_id].next_poll for tr_id in self.pending_ids)
+            if deadline is not None and next_poll > deadline:
+                logger.warning(f"timeout while watching {len(self.pending_ids)} tasking requests")
+                break
+            time.sleep(next_poll - now)
+
+        return self.tasks
@@ -1,4 +1,3 @@
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -6,8 +5,10 @@ import geojson
 from dateutil.parser import parse
 
 from capella_console_client.config import (
+    BULK_UPDATE_RATE,
     TASKING_REQUEST_COLLECT_CONSTRAINTS_FIELDS,
     TR_CANCEL_MAX_CONCURRENCY,
+    TR_COLLECTS_MAX_CONCURRENCY,
     TR_UPDATABLE_PROPERTIES,
     TR_UPDATE_MAX_CONCURRENCY,
 )
@@ -23,8 +24,9 @@ from capella_console_client.enumerations import (
     ProductType,
     SquintMode,
 )
-from capella_console_client.exceptions import CapellaConsoleClientError
+from capella_console_client.executor import BulkExecutor
 from capella_console_client.logconf import logger
+from capella_console_client.rate_limit import RateLimiter
 from capella_console_client.session import CapellaConsoleSession
 from capella_console_client.validate import (
     _datetime_to_iso8601_str,
@@ -61,7 +63,38 @@ def create_tasking_request(
     max_squint_angle: int | None = None,
     contract_id: str | None = None,
 ) -> dict[str, Any]:
+    payload = _build_tasking_request_payload(**{k: v for k, v in locals().items() if k != "session"})
+    logger.info(f"creating tasking request with payload {payload}")
+    return session.decode_json(session.post("/task", json=payload))
+
 
+def _build_tasking_request_payload(
+    geometry: geojson.geometry.Geometry,
+    name: str,
+    description: str | None = "",
+    collection_type: CollectionType | str | None = CollectionType.SPOTLIGHT,
+    collection_tier: CollectionTier | str | None = CollectionTier.standard,
+    window_open: datetime | str | None = None,
+    window_close: datetime | str | None = None,
+    local_time: LocalTimeOption | list[int] | None = None,
+    product_types: list[ProductType | str] | None = None,
+    off_nadir_min: int | None = None,
+    off_nadir_max: int | None = None,
+    image_width: int | None = None,
+    orbital_planes: list[OrbitalPlane | int] | None = None,
+    asc_dsc: OrbitState | str | None = OrbitState.either,
+    look_direction: ObservationDirection | str | None = ObservationDirection.either,
+    polarization: Polarization | str | None = None,
+    archive_holdback: ArchiveHoldback | str | None = ArchiveHoldback.none,
+    custom_attribute_1: str | None = None,
+    custom_attribute_2: str | None = None,
+    pre_approval: bool = False,
+    azimuth_angle_min: int | None = None,
+    azimuth_angle_max: int | None = None,
+    squint: SquintMode | str | None = None,
+    max_squint_angle: int | None = None,
+    contract_id: str | None = None,
+) -> dict[str, Any]:
     window_open, window_close = _set_window_open_close(window_open, window_close)
 
     if squint is None:
@@ -98,8 +131,7 @@ def create_tasking_request(
     if contract_id:
         payload["contractId"] = contract_id
 
-    logger.info(f"creating tasking request with payload {payload}")
-    return session.post("/task", json=payload).json()
+    return payload
 
 
 def _set_window_open_close(window_open: datetime | str | None, window_close: datetime | str | None) -> tuple[str, str]:
@@ -130,34 +162,45 @@ def _update_worker(session: CapellaConsoleSession, endpoint: str, prop_map: dict
     if kwargs.get("product_types") is not None:
         properties["processingConfig"] = {"productTypes": kwargs["product_types"]}
 
-    try:
-        return session.patch(endpoint, json={"properties": properties}).json()
-    except CapellaConsoleClientError as exc:
-        if exc.response is not None:
-            return {"success": False, **exc.response.json()}
-        return {"success": False}
+    result: dict[str, Any] = session.decode_json(session.patch(endpoint, json={"properties": properties}))
+    return result
+
+
+def _get_properties_by_id(
+    update_ids: tuple[str, ...], properties_by_id: dict[str, dict[str, Any]] | None, **kwargs
+) -> dict[str, dict[str, Any]]:
+    """properties to update per id, id specific properties take precedence over `kwargs` shared by all ids"""
+    properties_by_id = properties_by_id or {}
+    return {_id: {**kwargs, **properties_by_id.get(_id, {})} for _id in dict.fromkeys([*update_ids, *properties_by_id])}
 
 
 def _update_multi_parallel(
-    *update_ids: str, session: CapellaConsoleSession, update_fct, max_concurrency: int, **kwargs
+    properties_by_id: dict[str, dict[str, Any]],
+    session: CapellaConsoleSession,
+    update_fct,
+    max_concurrency: int,
+    rate: float = BULK_UPDATE_RATE,
 ) -> dict[str, Any]:
-    max_workers = min(max_concurrency, len(update_ids))
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {_id: executor.submit(update_fct, session=session, update_id=_id, **kwargs) for _id in update_ids}
-    return {_id: fut.result() for _id, fut in futures.items()}
+    # PATCH of same properties is idempotent, i.e. safe to retry
+    return BulkExecutor(max_workers=max_concurrency, rate_limiter=RateLimiter(rate)).map(
+        update_fct,
+        {_id: {"session": session, "update_id": _id, **properties} for _id, properties in properties_by_id.items()},
+    )
 
 
 def update_tasking_requests(
     *tasking_request_ids: str,
     session: CapellaConsoleSession,
+    properties_by_id: dict[str, dict[str, Any]] | None = None,
+    rate: float = BULK_UPDATE_RATE,
     **kwargs,
 ) -> dict[str, Any]:
     return _update_multi_parallel(
-        *tasking_request_ids,
+        _get_properties_by_id(tasking_request_ids, properties_by_id, **kwargs),
         session=session,
         update_fct=_update_tasking_request_worker,
         max_concurrency=TR_UPDATE_MAX_CONCURRENCY,
-        **kwargs,
+        rate=rate,
     )
 
 
@@ -167,13 +210,36 @@ def _update_tasking_request_worker(session: CapellaConsoleSession, update_id: st
 
 def get_tasking_request(tasking_request_id: str, session: CapellaConsoleSession) -> dict[str, Any]:
     task_response = session.get(f"/task/{tasking_request_id}")
-    return task_response.json()
+    return session.decode_json(task_response)
 
 
 def _task_contains_status(task: dict[str, Any], status_name: str) -> bool:
     return status_name.lower() in (s["code"] for s in task["properties"]["statusHistory"])
 
 
+def get_collects_for_tasking_requests(
+    *tasking_request_ids: str,
+    session: CapellaConsoleSession,
+    max_concurrency: int = TR_COLLECTS_MAX_CONCURRENCY,
+) -> dict[str, Any]:
+    return BulkExecutor(max_workers=max_concurrency).map(
+        _get_collects_worker,
+        {_id: {"session": session, "tasking_request_id": _id} for _id in dict.fromkeys(tasking_request_ids)},
+    )
+
+
+def _get_collects_worker(session: CapellaConsoleSession, tasking_request_id: str) -> dict[str, Any]:
+    task = get_tasking_request(tasking_request_id, session)
+    if not _task_contains_status(task, "completed"):
+        return {
+            "success": False,
+            "status": task["properties"]["statusHistory"][0]["code"],
+            "message": f"TaskingRequest<{tasking_request_id}> is not in completed state",
+        }
+    collects = session.decode_json(session.get(f"/collects/list/{tasking_request_id}"))
+    return {"success": True, "collects": collects}
+
+
 def cancel_tasking_requests(
     *tasking_request_ids: str,
     session: CapellaConsoleSession,
@@ -187,23 +253,9 @@ def cancel_tasking_requests(
 
 
 def _cancel_multi_parallel(*cancel_ids: str, session, cancel_fct, max_concurrency: int):
-    max_workers = min(max_concurrency, len(cancel_ids))
-
-    results_by_cancel_id = {}
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures_by_cancel_id = {}
-
-        for _id in cancel_ids:
-            futures_by_cancel_id[_id] = executor.submit(
-                cancel_fct,
-                session=session,
-                cancel_id=_id,
-            )
-
-        for key, fut in futures_by_cancel_id.items():
-            results_by_cancel_id[key] = fut.result()
-
-    return results_by_cancel_id
+    return BulkExecutor(max_workers=max_concurrency).map(
+        cancel_fct, {_id: {"session": session, "cancel_id": _id} for _id in cancel_ids}
+    )
 
 
 def _cancel_tasking_request(session: CapellaConsoleSession, cancel_id: str):
@@ -211,13 +263,7 @@ def _cancel_tasking_request(session: CapellaConsoleSession, cancel_id: str):
 
 
 def _cancel_worker(session: CapellaConsoleSession, endpoint: str):
-    try:
-        session.patch(endpoint, json={"status": "canceled"})
-    except CapellaConsoleClientError as exc:
-        if exc.response is not None:
-            return {"success": False, **exc.response.json()}
-        return {"success": False}
-
+    session.patch(endpoint, json={"status": "canceled"})
     return {
         "success": True,
     }
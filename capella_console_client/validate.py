@@ -67,7 +67,7 @@ def _validate_and_filter_stac_ids(stac_ids: list[str] | None) -> list[str]:
     if not stac_ids:
         return []
 
-    valid_stac_ids = list(set(filter(STAC_ID_REGEX_STRICT.match, stac_ids)))
+    valid_stac_ids = _compact_unique(s for s in stac_ids if STAC_ID_REGEX_STRICT.match(s))
 
     diff = set(stac_ids) - set(valid_stac_ids)
     if diff:
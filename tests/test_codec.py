@@ -0,0 +1,47 @@
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from capella_console_client.codec import JsonCodec, get_json_codec
+from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.session import CapellaConsoleSession
+
+
+def test_get_json_codec_stdlib():
+    codec = get_json_codec("json")
+    assert codec.name == "json"
+    assert codec.loads(codec.dumps({"a": [1, 2.5, None]})) == {"a": [1, 2.5, None]}
+
+
+def test_get_json_codec_unknown():
+    with pytest.raises(ValueError, match="unknown json codec"):
+        get_json_codec("ujson")
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec"])
+def test_fast_json_codec_roundtrip(name):
+    pytest.importorskip(name)
+    codec = get_json_codec(name)
+    payload = {"collections": ["capella-open-data"], "limit": 10, "big": 2**70}
+    assert json.loads(codec.dumps(payload)) == payload
+    assert codec.loads(json.dumps(payload).encode()) == payload
+
+
+def test_session_uses_json_codec(httpx_mock: HTTPXMock):
+    encoded = []
+
+    def dumps(obj):
+        encoded.append(obj)
+        return json.dumps(obj).encode()
+
+    codec = JsonCodec(name="custom", loads=json.loads, dumps=dumps)
+    session = CapellaConsoleSession(base_url=CONSOLE_API_URL, json_codec=codec)
+    httpx_mock.add_response(url=f"{CONSOLE_API_URL}/catalog/search", json={"features": []})
+
+    resp = session.post("/catalog/search", json={"limit": 1})
+
+    assert encoded == [{"limit": 1}]
+    assert json.loads(httpx_mock.get_request().content) == {"limit": 1}
+    assert httpx_mock.get_request().headers["Content-Type"] == "application/json; charset=utf-8"
+    assert session.decode_json(resp) == {"features": []}
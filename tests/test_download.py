@@ -2,7 +2,9 @@
 
 """Tests for `capella_console_client` package."""
 
+import json
 import tempfile
+import time
 from pathlib import Path
 
 import httpx
@@ -19,6 +21,7 @@ from .test_data import (
     create_mock_asset_hrefs,
     create_mock_items_presigned,
     get_mock_responses,
+    post_mock_responses,
 )
 
 MOCK_ASSETS_PRESIGNED = create_mock_asset_hrefs()
@@ -330,6 +333,96 @@ def test_download_products_for_tasking_request(
         _shared_dl_asserts(paths_by_stac_id_and_key, temp_dir)
 
 
+def _add_pipeline_responses(auth_httpx_mock):
+    items_presigned = get_mock_responses("/orders/1/download")
+    for endpoint in ("/tasks/search?page=1&limit=250", "/task/abc", "/collects/list/abc", "/orders/1/download"):
+        auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}{endpoint}", json=get_mock_responses(endpoint))
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/catalog/search",
+        json={"features": [{"id": items_presigned[0]["id"], "collection": "capella-archive"}], "numberMatched": 1},
+    )
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders?customerId=MOCK_ID", json=get_mock_responses("/orders"))
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/review", json=get_mock_responses("/orders/review_success")
+    )
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders", json=post_mock_responses("/submitOrder"))
+    auth_httpx_mock.add_response(url=MOCK_ASSET_HREF, text="MOCK_CONTENT", headers={"Content-Length": "12"})
+
+
+@pytest.fixture
+def pipeline_client(test_client, auth_httpx_mock):
+    _add_pipeline_responses(auth_httpx_mock)
+    yield test_client
+
+
+def test_download_on_completion(pipeline_client, auth_httpx_mock, disable_validate_uuid, tmp_path):
+    state_path = tmp_path / "pipeline.json"
+
+    state = pipeline_client.download_on_completion(["abc"], local_dir=tmp_path, state_path=state_path, include=["HH"])
+
+    assert state["abc"]["stage"] == "done"
+    assert state["abc"]["order_id"] == "1"
+    paths = {stac_id: {k: Path(p) for k, p in cur.items()} for stac_id, cur in state["abc"]["paths"].items()}
+    assert len(paths) == 1
+    _shared_dl_asserts(paths, tmp_path)
+    assert json.loads(state_path.read_text()) == state
+
+    # resumed from persisted state without further requests
+    num_requests = len(auth_httpx_mock.get_requests())
+    assert pipeline_client.download_on_completion(["abc"], state_path=state_path) == state
+    assert len(auth_httpx_mock.get_requests()) == num_requests
+
+
+def test_download_on_completion_resumes_download_stage(
+    pipeline_client, auth_httpx_mock, disable_validate_uuid, tmp_path
+):
+    state_path = tmp_path / "pipeline.json"
+    state_path.write_text(json.dumps({"abc": {"stage": "downloading", "order_id": "1", "stac_ids": None}}))
+
+    state = pipeline_client.download_on_completion(["abc"], local_dir=tmp_path, state_path=state_path, include=["HH"])
+
+    assert state["abc"]["stage"] == "done"
+    assert len(state["abc"]["paths"]) == 1
+    assert not auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250")
+
+
+def test_download_on_completion_retries_transient_error(test_client, auth_httpx_mock, disable_validate_uuid, tmp_path):
+    state_path = tmp_path / "pipeline.json"
+    state_path.write_text(json.dumps({"abc": {"stage": "downloading", "order_id": "1", "stac_ids": None}}))
+    auth_httpx_mock.add_exception(httpx.ConnectError("Connection failed"), url=f"{CONSOLE_API_URL}/orders/1/download")
+
+    state = test_client.download_on_completion(["abc"], local_dir=tmp_path, state_path=state_path, include=["HH"])
+
+    assert state["abc"]["stage"] == "downloading"
+    assert state["abc"]["error"] == "Connection failed"
+
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/1/download", json=get_mock_responses("/orders/1/download")
+    )
+    auth_httpx_mock.add_response(url=MOCK_ASSET_HREF, text="MOCK_CONTENT", headers={"Content-Length": "12"})
+    state = test_client.download_on_completion(["abc"], local_dir=tmp_path, state_path=state_path, include=["HH"])
+
+    assert state["abc"]["stage"] == "done"
+    assert "error" not in state["abc"]
+
+
+def test_download_on_completion_retries_transient_watch_error(
+    test_client, auth_httpx_mock, disable_validate_uuid, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    auth_httpx_mock.add_exception(
+        httpx.ConnectError("Connection failed"), url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250"
+    )
+    _add_pipeline_responses(auth_httpx_mock)
+
+    state = test_client.download_on_completion(
+        ["abc"], local_dir=tmp_path, state_path=tmp_path / "pipeline.json", include=["HH"]
+    )
+
+    assert state["abc"]["stage"] == "done"
+    assert len(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250")) == 2
+
+
 def test_download_products_for_order_id(verbose_download_multiple_client, disable_validate_uuid):
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_dir = Path(temp_dir)
@@ -0,0 +1,92 @@
+import time
+
+import httpx
+import pytest
+
+from capella_console_client.exceptions import CapellaConsoleClientError
+from capella_console_client.executor import AdaptiveConcurrencyLimit, BulkExecutor
+
+
+def _api_error(status_code):
+    response = httpx.Response(status_code, json={"error": {"code": f"HTTP_{status_code}"}})
+    return CapellaConsoleClientError(message="failed", response=response)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+
+
+def test_adaptive_limit_aimd():
+    limit = AdaptiveConcurrencyLimit(initial=8, max_limit=10, cooldown=60)
+
+    limit.acquire()
+    limit.release(429)
+    assert limit.limit == 4
+
+    # requests rate limited together decrease once per cooldown
+    limit.acquire()
+    limit.release(429)
+    assert limit.limit == 4
+
+    # additive increase by ~1 per `limit` successful requests
+    for _ in range(5):
+        limit.acquire()
+        limit.release()
+    assert limit.limit == 5
+
+    for _ in range(100):
+        limit.acquire()
+        limit.release()
+    assert limit.limit == 10
+
+    limit.acquire()
+    limit.release(400)
+    assert limit.limit == 10
+
+
+def test_bulk_executor_map_retries_transient_errors(no_sleep):
+    failures = {"a": [_api_error(429), _api_error(503)], "b": [_api_error(400)]}
+
+    def fn(key):
+        if failures.get(key):
+            raise failures[key].pop(0)
+        return {"success": True, "key": key}
+
+    limit = AdaptiveConcurrencyLimit(initial=2, cooldown=0)
+    results = BulkExecutor(max_workers=2, limit=limit).map(fn, {key: {"key": key} for key in ("a", "b", "c")})
+
+    assert results == {
+        "a": {"success": True, "key": "a"},
+        "b": {"success": False, "error": {"code": "HTTP_400"}},
+        "c": {"success": True, "key": "c"},
+    }
+
+
+def test_bulk_executor_map_transport_error(no_sleep):
+    def fn(key):
+        raise httpx.ReadTimeout("timed out")
+
+    limit = AdaptiveConcurrencyLimit(initial=8, cooldown=60)
+    results = BulkExecutor(max_workers=1, limit=limit).map(fn, {"a": {"key": "a"}})
+
+    assert results == {"a": {"success": False, "message": "timed out"}}
+    # connection errors signal congestion
+    assert limit.limit == 4
+
+
+def test_bulk_executor_nested_map_runs_inline():
+    limit = AdaptiveConcurrencyLimit(initial=1, max_limit=1)
+    executor = BulkExecutor(max_workers=2, limit=limit)
+
+    def inner(key):
+        return {"success": True, "key": key}
+
+    def outer(key):
+        # outer call holds the only budget slot
+        return {"success": True, "inner": executor.map(inner, {f"{key}-1": {"key": f"{key}-1"}})}
+
+    results = executor.map(outer, {"a": {"key": "a"}, "b": {"key": "b"}})
+
+    assert results["a"] == {"success": True, "inner": {"a-1": {"success": True, "key": "a-1"}}}
+    assert results["b"]["success"] is True
@@ -1,3 +1,4 @@
+import json
 import random
 import uuid
 
@@ -50,6 +51,62 @@ def test_create_repeat_request_with_invalid_contract_id(test_client, auth_httpx_
         test_client.create_repeat_request(geometry=mock_geojson, name="test", contract_id="invalid-contract")
 
 
+def test_create_repeat_requests_validates_before_submission(test_client, auth_httpx_mock):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/repeat-requests/search?page=1&limit=250",
+        json={"results": [], "currentPage": 1, "totalPages": 1},
+    )
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/repeat-requests", method="POST", json=post_mock_responses("/repeat-requests")
+    )
+    features = [
+        # feature metadata (`id`, `site`) is not passed to payload
+        {
+            "type": "Feature",
+            "geometry": mock_geojson,
+            "properties": {"name": "a", "repetition_count": 5, "id": "aoi-1", "site": "Boulder"},
+        },
+        {"type": "Feature", "geometry": mock_geojson, "properties": {"name": "b", "collection_tier": "PANDA"}},
+        {
+            "type": "Feature",
+            "geometry": mock_geojson,
+            "properties": {"name": "c", "repeat_end": "2030-01-01", "repetition_count": 5},
+        },
+        {"type": "Feature", "geometry": {"type": "LineString", "coordinates": []}, "properties": {"name": "d"}},
+    ]
+    results = test_client.create_repeat_requests(features, look_direction="left", rate=1000)
+
+    assert [r["success"] for r in results] == [True, False, False, False]
+    assert results[0]["result"] == post_mock_responses("/repeat-requests")
+    assert "collection_tier" in results[1]["message"]
+    assert "repetition_count" in results[2]["message"]
+    assert "geometry" in results[3]["message"]
+
+    create_requests = auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/repeat-requests", method="POST")
+    assert len(create_requests) == 1
+    payload = json.loads(create_requests[0].read())
+    assert payload["properties"]["collectConstraints"]["lookDirection"] == "left"
+    assert payload["properties"]["collectConstraints"]["squint"] == "enabled"
+    assert payload["properties"]["repetitionProperties"]["repetitionCount"] == 5
+
+
+@pytest.mark.parametrize(
+    "invalid_properties, invalid_arg",
+    [
+        ({"orbital_planes": [42]}, "orbital_planes"),
+        ({"collection_type": "PANDA"}, "collection_type"),
+    ],
+)
+def test_create_repeat_requests_all_invalid_no_network(test_client, auth_httpx_mock, invalid_properties, invalid_arg):
+    features = [{"type": "Feature", "geometry": mock_geojson, "properties": {"name": "a", **invalid_properties}}]
+    results = test_client.create_repeat_requests(features)
+
+    assert not results[0]["success"]
+    assert f"invalid {invalid_arg}" in results[0]["message"]
+    assert not auth_httpx_mock.get_requests(method="POST", url=f"{CONSOLE_API_URL}/repeat-requests")
+    assert not auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/repeat-requests/search?page=1&limit=250")
+
+
 def test_cancel_success_single_repeat(test_client, task_cancel_success_mock):
     rr_id = str(uuid.uuid4())
     result = test_client.cancel_repeat_requests(rr_id)
@@ -1,8 +1,17 @@
 #!/usr/bin/env python
 
+import json
+from copy import deepcopy
+
+import httpx
 import pytest
 
-from capella_console_client.search import StacSearch
+from capella_console_client import aoi_search as aoi_search_module
+from capella_console_client import incremental as incremental_module
+from capella_console_client import search as search_module
+from capella_console_client import spatial as spatial_module
+from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.search import CompactStacSearchResult, StacSearch
 from capella_console_client.validate import _validate_uuid
 
 from .test_data import (
@@ -70,3 +79,273 @@ def test_threaded_paginated_search_multi_page(single_page_search_client):
     results = search.fetch_all()
     assert len(results) == 1
     assert results[0] == get_canned_search_results_single_page()["features"][0]
+
+
+def test_threaded_search_reuses_first_page(verbose_test_client, auth_httpx_mock, monkeypatch):
+    monkeypatch.setattr(search_module, "CATALOG_MAX_PAGE_SIZE", 2)
+    page1 = get_canned_search_results_multi_page_page1()
+    page2 = get_canned_search_results_multi_page_page2()
+    for page_number, page in enumerate((page1, page2), start=1):
+        auth_httpx_mock.add_response(
+            url=f"{CONSOLE_API_URL}/catalog/search",
+            match_json={"limit": 2, "page": page_number},
+            json=page,
+        )
+
+    search = StacSearch(verbose_test_client._sesh, limit=4, threaded=True, max_concurrency=1)
+    results = search.fetch_all()
+
+    assert search.max_concurrency == 1
+    assert results.stac_ids == [f["id"] for f in [*page1["features"], *page2["features"]]]
+    assert len(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")) == 2
+
+
+def test_page_search_retries_transient_errors(verbose_test_client, auth_httpx_mock, monkeypatch):
+    monkeypatch.setattr(search_module._page_search.retry, "sleep", lambda _: None)
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/catalog/search", status_code=429, json={"error": {"message": "Too Many Requests"}}
+    )
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/catalog/search", json=get_canned_search_results_single_page())
+
+    search = StacSearch(verbose_test_client._sesh, limit=4, threaded=True)
+    results = search.fetch_all()
+
+    assert len(results) == 4
+    assert len(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")) == 2
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_paginated_search_prefetch(multi_page_search_client, auth_httpx_mock, prefetch):
+    search = StacSearch(multi_page_search_client._sesh, limit=6, prefetch=prefetch)
+    results = search.fetch_all()
+
+    assert results.stac_ids == [
+        f["id"]
+        for f in [
+            *get_canned_search_results_multi_page_page1()["features"],
+            *get_canned_search_results_multi_page_page2()["features"],
+        ]
+    ]
+    assert len(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search?page=2")) == 1
+
+
+def test_paginated_search_without_prefetch_no_thread_pool(multi_page_search_client, monkeypatch):
+    def no_thread_pool(*args, **kwargs):
+        raise AssertionError("thread pool created without prefetch")
+
+    monkeypatch.setattr(search_module, "ThreadPoolExecutor", no_thread_pool)
+    search = StacSearch(multi_page_search_client._sesh, limit=6, prefetch=False)
+
+    results = search.fetch_all()
+
+    assert len(results) == len(get_canned_search_results_multi_page_page1()["features"]) + len(
+        get_canned_search_results_multi_page_page2()["features"]
+    )
+
+
+def test_paginated_search_no_prefetch_beyond_limit(multi_page_search_client, auth_httpx_mock):
+    search = StacSearch(multi_page_search_client._sesh, limit=2)
+    results = search.fetch_all()
+
+    assert len(results) == 2
+    assert not auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search?page=2")
+
+
+def test_search_incremental(verbose_test_client, auth_httpx_mock, tmp_path, monkeypatch):
+    monkeypatch.setattr(incremental_module, "MY_SEARCH_QUERIES_PATH", tmp_path / "my-search-queries.json")
+    page = get_canned_search_results_single_page()
+    for idx, feature in enumerate(page["features"]):
+        feature["properties"] = {"datetime": f"2024-01-0{idx + 1}T00:00:00Z"}
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/catalog/search", json=page)
+
+    first = verbose_test_client.search_incremental("aoi", product_type="GEO")
+    assert len(first) == 4
+
+    # item seen at the watermark is returned again along with a late item of the same datetime
+    seen, late = deepcopy(page["features"][-1]), deepcopy(page["features"][-1])
+    late["id"] = "late-item"
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/catalog/search", json={"features": [seen, late], "numberMatched": 2}
+    )
+    second = verbose_test_client.search_incremental("aoi", product_type="GEO")
+    assert second.stac_ids == ["late-item"]
+
+    payload = json.loads(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")[-1].read())
+    assert payload["query"]["datetime"] == {"gte": "2024-01-04T00:00:00Z"}
+    assert payload["sortby"] == [{"field": "properties.datetime", "direction": "asc"}]
+
+    saved = json.loads((tmp_path / "my-search-queries.json").read_text())
+    assert saved["aoi"]["data"] == {"product_type": "GEO"}
+    assert saved["aoi"]["watermark"] == "2024-01-04T00:00:00Z"
+    assert saved["aoi"]["watermark_ids"] == sorted([seen["id"], "late-item"])
+
+
+def test_search_incremental_filters_changed(tmp_path):
+    path = tmp_path / "my-search-queries.json"
+    incremental_module.save_watermark("aoi", {"product_type": "GEO"}, "2024-01-04T00:00:00Z", path=path)
+
+    assert incremental_module.get_watermark("aoi", {"product_type": "GEO"}, path=path) == "2024-01-04T00:00:00Z"
+    assert incremental_module.get_watermark("aoi", {"product_type": "SLC"}, path=path) is None
+
+
+def test_compact_search(single_page_search_client):
+    results = StacSearch(single_page_search_client._sesh, compact=True).fetch_all()
+    assert isinstance(results, CompactStacSearchResult)
+    assert results.stac_ids == [f["id"] for f in get_canned_search_results_single_page()["features"]]
+
+
+def _square(x: float, y: float, size: float = 1.0):
+    return {
+        "type": "Polygon",
+        "coordinates": [[[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]],
+    }
+
+
+@pytest.fixture
+def many_aoi_client(test_client, auth_httpx_mock):
+    items = [
+        {"id": "near-a", "geometry": _square(0.1, 0.1, 0.05), "properties": {}},
+        {"id": "near-b", "geometry": _square(0.3, 0.3, 0.05), "properties": {}},
+        {"id": "far", "geometry": _square(10, 10), "properties": {}},
+    ]
+
+    def search_callback(request):
+        payload = json.loads(request.read())
+        geometry = payload.get("intersects") or _square(
+            payload["bbox"][0], payload["bbox"][1], payload["bbox"][2] - payload["bbox"][0]
+        )
+        features = [item for item in items if spatial_module.intersects(item["geometry"], geometry)]
+        return httpx.Response(200, json={"features": features, "numberMatched": len(features)})
+
+    auth_httpx_mock.add_callback(search_callback, url=f"{CONSOLE_API_URL}/catalog/search")
+    yield test_client
+
+
+def test_search_many_aoi(many_aoi_client, auth_httpx_mock):
+    aois = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "id": "a", "geometry": _square(0, 0, 0.2), "properties": {}},
+            {"type": "Feature", "id": "b", "geometry": _square(0.25, 0.25, 0.2), "properties": {}},
+            {"type": "Feature", "geometry": _square(9.5, 9.5), "properties": {"id": "c"}},
+            # duplicate geometry of c
+            {"type": "Feature", "id": "d", "geometry": _square(9.5, 9.5), "properties": {}},
+        ],
+    }
+
+    result = many_aoi_client.search_many_aoi(aois, product_type="GEO")
+
+    assert result == {"a": ["near-a"], "b": ["near-b"], "c": ["far"], "d": ["far"]}
+    payloads = [json.loads(r.read()) for r in auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")]
+    # a + b merged into shared bbox query, c + d deduplicated
+    assert len(payloads) == 2
+    assert sorted("bbox" in p for p in payloads) == [False, True]
+    assert all(p["query"] == {"sar:product_type": {"eq": "GEO"}} for p in payloads)
+
+
+def test_search_many_aoi_split_on_limit(many_aoi_client, auth_httpx_mock):
+    aois = [
+        {"type": "Feature", "id": "a", "geometry": _square(0, 0, 0.2), "properties": {}},
+        {"type": "Feature", "id": "b", "geometry": _square(0.25, 0.25, 0.2), "properties": {}},
+    ]
+
+    result = many_aoi_client.search_many_aoi(aois, limit=2)
+
+    assert result == {"a": ["near-a"], "b": ["near-b"]}
+    payloads = [json.loads(r.read()) for r in auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")]
+    assert ["bbox" in p for p in payloads] == [True, False, False]
+
+
+def test_get_aoi_geometries_ids():
+    aois = [
+        {"type": "Feature", "id": 0, "geometry": _square(0, 0), "properties": {}},
+        {"type": "Feature", "geometry": _square(1, 1), "properties": {"id": 0}},
+    ]
+    with pytest.raises(ValueError, match="duplicate AOI id 0"):
+        aoi_search_module._get_aoi_geometries(aois)
+
+    aois[0]["id"] = "a"
+    assert list(aoi_search_module._get_aoi_geometries(aois)) == ["a", "0"]
+
+
+def test_search_many_aoi_spatial_filter_not_supported(test_client):
+    with pytest.raises(ValueError, match="bbox"):
+        test_client.search_many_aoi([], bbox=[0, 0, 1, 1])
+
+
+def test_search_by_ids_chunked(test_client, auth_httpx_mock):
+    stac_ids = [f"stac-id-{idx}" for idx in range(7)]
+
+    def search_callback(request):
+        payload = json.loads(request.read())
+        # stac-id-3 does not exist, results in reverse order
+        features = [{"id": i, "properties": {}} for i in reversed(payload["ids"]) if i != "stac-id-3"]
+        return httpx.Response(200, json={"features": features, "numberMatched": len(features)})
+
+    auth_httpx_mock.add_callback(search_callback, url=f"{CONSOLE_API_URL}/catalog/search")
+
+    result = search_module.search_by_ids(test_client._sesh, [*stac_ids, "stac-id-0"], chunk_size=3)
+
+    assert result.stac_ids == [i for i in stac_ids if i != "stac-id-3"]
+    assert result.missing_ids == ["stac-id-3"]
+    payloads = [json.loads(r.read()) for r in auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")]
+    assert sorted((p["ids"], p["limit"]) for p in payloads) == [
+        (["stac-id-0", "stac-id-1", "stac-id-2"], 3),
+        (["stac-id-3", "stac-id-4", "stac-id-5"], 3),
+        (["stac-id-6"], 1),
+    ]
+
+
+@pytest.fixture
+def count_client(test_client, auth_httpx_mock):
+    def count_callback(request):
+        payload = json.loads(request.read())
+        number_matched = {"SLC": 3, "GEO": 5}.get(payload.get("query", {}).get("sar:product_type", {}).get("eq"), 1)
+        return httpx.Response(200, json={"features": [{"id": "a"}], "numberMatched": number_matched})
+
+    auth_httpx_mock.add_callback(count_callback, url=f"{CONSOLE_API_URL}/catalog/search")
+    yield test_client
+
+
+def test_count(count_client, auth_httpx_mock):
+    assert count_client.count(product_type="GEO", limit=1000) == 5
+    payload = json.loads(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")[-1].read())
+    assert payload["limit"] == 1
+
+
+@pytest.mark.parametrize(
+    "page, expected",
+    [
+        ({"features": [{"id": "a"}], "context": {"matched": 7}}, 7),
+        ({"features": [{"id": "a"}]}, None),
+        ({"features": []}, 0),
+    ],
+)
+def test_count_number_matched_missing(test_client, auth_httpx_mock, page, expected):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/catalog/search", json=page)
+    assert test_client.count() == expected
+
+
+def test_facet_counts(count_client):
+    assert count_client.facet_counts("product_type", buckets=["SLC", "GEO", "SICD"], collections=["c"]) == {
+        "SLC": 3,
+        "GEO": 5,
+        "SICD": 1,
+    }
+
+
+def test_facet_counts_time_bins(count_client, auth_httpx_mock):
+    counts = count_client.facet_counts(
+        "datetime", interval="month", datetime__gte="2024-01-01T00:00:00Z", datetime__lt="2024-03-15T00:00:00Z"
+    )
+
+    assert list(counts) == ["2024-01-01T00:00:00.000Z", "2024-02-01T00:00:00.000Z", "2024-03-01T00:00:00.000Z"]
+    payloads = [json.loads(r.read()) for r in auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")]
+    assert sorted(p["query"]["datetime"]["lt"] for p in payloads)[-1] == "2024-03-15T00:00:00.000Z"
+
+
+def test_facet_counts_invalid(test_client):
+    with pytest.raises(ValueError, match="buckets required"):
+        test_client.facet_counts("incidence_angle")
+    with pytest.raises(ValueError, match="require datetime__gte"):
+        test_client.facet_counts("datetime", interval="month")
@@ -0,0 +1,77 @@
+import json
+import time
+
+import pytest
+
+from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.search import StacSearch
+from capella_console_client.search_cache import SearchCache
+from capella_console_client.session import CapellaConsoleSession
+
+from .test_data import get_canned_search_results_single_page
+
+
+@pytest.fixture
+def search_cache(tmp_path):
+    yield SearchCache(path=tmp_path / "search-cache.sqlite")
+
+
+def test_cache_key_canonical():
+    key = SearchCache.key(
+        {"limit": 10, "query": {"sar:product_type": {"in": ["SLC", "GEO"]}}, "ids": ["b", "a"]},
+    )
+    assert key == SearchCache.key(
+        {"ids": ["a", "b"], "query": {"sar:product_type": {"in": ["GEO", "SLC"]}}, "limit": 10},
+    )
+    assert key != SearchCache.key({"limit": 11, "query": {"sar:product_type": {"in": ["SLC", "GEO"]}}})
+    assert key != SearchCache.key(
+        {"limit": 10, "query": {"sar:product_type": {"in": ["SLC", "GEO"]}}, "ids": ["b", "a"]}, scope="other"
+    )
+
+
+def test_cache_get_set(search_cache):
+    pages = [get_canned_search_results_single_page()]
+    assert search_cache.get("key") is None
+
+    search_cache.set("key", pages)
+    assert search_cache.get("key") == pages
+
+
+def test_cache_ttl_expired(search_cache, monkeypatch):
+    search_cache.set("key", [get_canned_search_results_single_page()])
+
+    later = time.time() + search_cache.ttl + 1
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert search_cache.get("key") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    page = get_canned_search_results_single_page()
+    cache = SearchCache(path=tmp_path / "search-cache.sqlite", max_bytes=len(json.dumps([page])) * 2)
+    cache.set("first", [page])
+    cache.set("second", [page])
+    cache.get("first")
+    cache.set("third", [page])
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+
+
+def test_search_served_from_cache(single_page_search_client, auth_httpx_mock, search_cache):
+    first = StacSearch(single_page_search_client._sesh, cache=search_cache).fetch_all()
+    second = StacSearch(single_page_search_client._sesh, cache=search_cache).fetch_all()
+
+    assert first.stac_ids == second.stac_ids
+    assert len(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/catalog/search")) == 1
+
+
+def test_cache_scoped_by_credential_without_user_info():
+    first = CapellaConsoleSession(base_url=CONSOLE_API_URL)
+    second = CapellaConsoleSession(base_url=CONSOLE_API_URL)
+    assert first.identity is None
+
+    first.authenticate(api_key="first-key", no_token_check=True)
+    second.authenticate(api_key="second-key", no_token_check=True)
+    assert first.identity is not None
+    assert first.identity != second.identity
@@ -1,15 +1,22 @@
+import json
+from copy import deepcopy
+
 import pytest
 
+from capella_console_client import columnar
+from capella_console_client.codec import JsonCodec
 from capella_console_client.config import (
     RR_SUPPORTED_GROUPBY_FIELDS,
     STAC_ROOT_LEVEL_GROUPBY_FIELDS,
     TR_SUPPORTED_GROUPBY_FIELDS,
 )
 from capella_console_client.search import (
+    CompactStacSearchResult,
     RepeatRequestSearchResult,
     StacSearchResult,
     TaskingRequestSearchResult,
 )
+from capella_console_client.stac_item import CompactStacItem
 
 from .test_data import (
     MOCK_GROUPBY_STAC_ITEM,
@@ -217,3 +224,235 @@ def test_repeat_request_search_result_groupby_scenarios(field, expected_groups,
     ret = result.groupby(field=field)
     assert len(ret) == expected_groups
     assert ret == expected_values
+
+
+def test_search_result_to_numpy():
+    np = pytest.importorskip("numpy")
+    result = StacSearchResult()
+    result.add({"features": [MOCK_GROUPBY_STAC_ITEM]})
+
+    arrays = result.to_numpy(["id", "incidence_angle", "looks_range", "datetime", "polarizations", "missing"])
+
+    assert arrays["id"].tolist() == [MOCK_GROUPBY_STAC_ITEM["id"]]
+    assert arrays["incidence_angle"].dtype == np.float64
+    assert arrays["looks_range"].dtype == np.int64
+    assert arrays["datetime"].dtype == np.dtype("datetime64[us]")
+    assert arrays["datetime"][0] == np.datetime64("2024-05-12T17:17:10.928694")
+    assert arrays["polarizations"][0] == ["HH"]
+    assert arrays["missing"][0] is None
+
+
+def test_search_result_to_arrow_and_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    result = StacSearchResult()
+    result.add({"features": [MOCK_GROUPBY_STAC_ITEM]})
+
+    table = result.to_arrow()
+    assert "incidence_angle" in table.column_names
+    assert "start_datetime" in table.column_names
+    assert table.schema.field("datetime").type == pa.timestamp("us", tz="UTC")
+    assert table.column("product_type").to_pylist() == ["SLC"]
+
+    path = result.to_parquet(tmp_path / "result.parquet", fields=["id", "orbit_state"])
+    assert pq.read_table(path).to_pylist() == [{"id": MOCK_GROUPBY_STAC_ITEM["id"], "orbit_state": "ascending"}]
+
+
+def test_compact_search_result_lazy_decode():
+    page = {"features": [MOCK_GROUPBY_STAC_ITEM, MOCK_GROUPBY_STAC_ITEM]}
+    decoded = []
+
+    def loads(encoded):
+        value = json.loads(encoded)
+        decoded.append(value)
+        return value
+
+    codec = JsonCodec(name="counting", loads=loads, dumps=lambda obj: json.dumps(obj).encode())
+    result = CompactStacSearchResult(codec=codec)
+    assert result.add(page) == 1
+
+    item = result[0]
+    assert isinstance(item, CompactStacItem)
+    assert item["id"] == MOCK_GROUPBY_STAC_ITEM["id"]
+    assert item["collection"] == MOCK_GROUPBY_STAC_ITEM["collection"]
+    assert result.stac_ids == [MOCK_GROUPBY_STAC_ITEM["id"]]
+    assert len(item) == len(MOCK_GROUPBY_STAC_ITEM)
+    assert list(item) == list(MOCK_GROUPBY_STAC_ITEM)
+    assert not decoded
+
+    # each field decoded once on first access
+    assert item["properties"] == MOCK_GROUPBY_STAC_ITEM["properties"]
+    assert result.groupby("product_type") == {"SLC": [item]}
+    assert result.collect_ids == [MOCK_GROUPBY_STAC_ITEM["properties"]["capella:collect_id"]]
+    assert decoded == [MOCK_GROUPBY_STAC_ITEM["properties"]]
+
+    assert item == MOCK_GROUPBY_STAC_ITEM
+    assert dict(item) == MOCK_GROUPBY_STAC_ITEM
+    assert len(decoded) == len(MOCK_GROUPBY_STAC_ITEM) - 2
+
+    # decoded copy
+    assert result.to_feature_collection()["features"] == [MOCK_GROUPBY_STAC_ITEM]
+    assert result.to_feature_collection()["features"][0]["properties"] is not item["properties"]
+
+
+def _filter_search_result():
+    features = []
+    for idx, (incidence_angle, orbit_state, product_type) in enumerate(
+        [(11.6, "ascending", "SLC"), (35.2, "descending", "GEO"), (42.0, "ascending", "GEO")]
+    ):
+        item = deepcopy(MOCK_GROUPBY_STAC_ITEM)
+        item["id"] = f"item-{idx}"
+        item["properties"].update(
+            {
+                "view:incidence_angle": incidence_angle,
+                "sat:orbit_state": orbit_state,
+                "sar:product_type": product_type,
+                "datetime": f"2024-05-1{idx}T17:17:10.928694Z",
+            }
+        )
+        features.append(item)
+
+    result = StacSearchResult()
+    result.add({"features": features})
+    return result
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+@pytest.mark.parametrize(
+    "filters, expected_ids",
+    [
+        ({"incidence_angle__gt": 30}, ["item-1", "item-2"]),
+        ({"incidence_angle__gte": 35.2, "orbit_state": "ascending"}, ["item-2"]),
+        ({"product_type__in": ["SLC", "GEO"], "incidence_angle__lt": 40}, ["item-0", "item-1"]),
+        ({"product_type": ["SLC"]}, ["item-0"]),
+        ({"polarizations": "HH"}, ["item-0", "item-1", "item-2"]),
+        ({"datetime__lte": "2024-05-11T00:00:00Z"}, ["item-0"]),
+        ({"ids": ["item-2", "item-0"]}, ["item-0", "item-2"]),
+        ({"collections": ["capella-open-data"]}, []),
+        ({"orbit_state": "ascending", "limit": 1}, ["item-0"]),
+        ({"unsupported__gt": 1}, ["item-0", "item-1", "item-2"]),
+    ],
+)
+def test_search_result_filter(filters, expected_ids, with_numpy, monkeypatch):
+    if not with_numpy:
+        monkeypatch.setattr(columnar, "_optional_numpy", lambda: None)
+
+    filtered = _filter_search_result().filter(**filters)
+    assert isinstance(filtered, StacSearchResult)
+    assert filtered.stac_ids == expected_ids
+
+
+def test_search_result_filter_bbox_3d():
+    result = StacSearchResult()
+    result.add({"features": [{"id": "item-3d", "bbox": [0, 0, -10, 1, 1, 500], "properties": {}}]})
+
+    assert result.filter(bbox=[0.5, 0.5, 2, 2]).stac_ids == ["item-3d"]
+    assert result.filter(bbox=[0.5, 2, 0.8, 3]).stac_ids == []
+    assert result.filter(bbox=[0.5, 0.5, -1, 2, 2, 1]).stac_ids == ["item-3d"]
+
+
+def test_search_result_filter_column_cache_reset_on_add():
+    result = _filter_search_result()
+    assert len(result.filter(orbit_state="ascending")) == 2
+    assert "orbit_state" in result._columns
+
+    item = deepcopy(MOCK_GROUPBY_STAC_ITEM)
+    item["id"] = "item-3"
+    result.add({"features": [item]})
+
+    assert result._columns == {}
+    assert result.filter(orbit_state="ascending").stac_ids == ["item-0", "item-2", "item-3"]
+
+
+@pytest.mark.parametrize(
+    "prev_filters, filters, prev_result_count, expected",
+    [
+        ({"product_type": ["SLC", "GEO"], "limit": 50}, {"product_type": ["GEO"], "limit": 50}, 10, True),
+        ({"product_type": ["GEO"], "limit": 50}, {"product_type": ["SLC", "GEO"], "limit": 50}, 10, False),
+        ({"limit": 50}, {"orbit_state": "ascending", "limit": 50}, 10, True),
+        ({"orbit_state": "ascending", "limit": 50}, {"limit": 50}, 10, False),
+        ({"incidence_angle__gt": 30, "limit": 50}, {"incidence_angle__gt": 35, "limit": 50}, 10, True),
+        ({"incidence_angle__gt": 30, "limit": 50}, {"incidence_angle__gte": 30, "limit": 50}, 10, False),
+        ({"incidence_angle__gte": 30, "limit": 50}, {"incidence_angle__gt": 30, "limit": 50}, 10, True),
+        ({"incidence_angle__lt": 40, "limit": 50}, {"incidence_angle": 35.5, "limit": 50}, 10, True),
+        (
+            {"datetime__gt": "2024-01-01T00:00:00Z", "limit": 50},
+            {"datetime__gt": "2024-02-01T00:00:00Z", "limit": 50},
+            10,
+            True,
+        ),
+        (
+            {"bbox": [0, 0, 1, 1], "limit": 50},
+            {"bbox": [0, 0, 1, 1], "orbit_state": "ascending", "limit": 50},
+            10,
+            True,
+        ),
+        ({"bbox": [0, 0, 1, 1], "limit": 50}, {"bbox": [0, 0, 0.5, 0.5], "limit": 50}, 10, False),
+        # previous result truncated by limit
+        ({"limit": 50}, {"orbit_state": "ascending", "limit": 50}, 50, False),
+        ({"orbit_state": "ascending", "limit": 50}, {"orbit_state": "ascending", "limit": 20}, 50, True),
+        ({"orbit_state": "ascending", "limit": 50}, {"orbit_state": "ascending", "limit": 100}, 50, False),
+        # previous result truncated by STAC server's max. item return
+        ({"limit": 20000}, {"orbit_state": "ascending", "limit": 20000}, 10000, False),
+        ({"limit": 20000}, {"orbit_state": "ascending", "limit": 20000}, 9999, True),
+    ],
+)
+def test_is_narrower_search(prev_filters, filters, prev_result_count, expected):
+    assert columnar.is_narrower_search(prev_filters, filters, prev_result_count) == expected
+
+
+def test_narrowing_filters_applied_to_previous_result():
+    prev_filters = {"product_type": ["SLC", "GEO"], "limit": 50}
+    filters = {"product_type": ["SLC", "GEO"], "incidence_angle__gt": 30, "limit": 1}
+    narrowing = columnar.get_narrowing_filters(prev_filters, filters)
+
+    assert narrowing == {"incidence_angle__gt": 30, "limit": 1}
+    assert _filter_search_result().filter(**narrowing).stac_ids == ["item-1"]
+
+
+def test_search_result_groupby_multiple_fields():
+    ret = _filter_search_result().groupby(field=["orbit_state", "product_type"])
+    assert {key: [item["id"] for item in items] for key, items in ret.items()} == {
+        ("ascending", "SLC"): ["item-0"],
+        ("descending", "GEO"): ["item-1"],
+        ("ascending", "GEO"): ["item-2"],
+    }
+
+
+@pytest.mark.parametrize(
+    "by, agg, field, expected",
+    [
+        ("orbit_state", "count", None, {"ascending": 2, "descending": 1}),
+        (
+            ["orbit_state", "product_type"],
+            "count",
+            None,
+            {("ascending", "SLC"): 1, ("descending", "GEO"): 1, ("ascending", "GEO"): 1},
+        ),
+        ("product_type", "min", "incidence_angle", {"SLC": 11.6, "GEO": 35.2}),
+        ("product_type", "max", "incidence_angle", {"SLC": 11.6, "GEO": 42.0}),
+        ("orbit_state", "mean", "incidence_angle", {"ascending": pytest.approx(26.8), "descending": 35.2}),
+        ("orbit_state", "max", "epsg", {"ascending": None, "descending": None}),
+    ],
+)
+def test_search_result_aggregate(by, agg, field, expected):
+    assert _filter_search_result().aggregate(by=by, agg=agg, field=field) == expected
+
+
+@pytest.mark.parametrize("agg, field", [("median", "incidence_angle"), ("mean", None), ("mean", "product_type")])
+def test_search_result_aggregate_invalid(agg, field):
+    with pytest.raises(ValueError):
+        _filter_search_result().aggregate(by="orbit_state", agg=agg, field=field)
+
+
+def test_search_result_group_keys_reset_on_add():
+    result = _filter_search_result()
+    assert result.aggregate(by="orbit_state") == {"ascending": 2, "descending": 1}
+    assert "orbit_state" in result._group_keys
+
+    item = deepcopy(MOCK_GROUPBY_STAC_ITEM)
+    item["id"] = "item-3"
+    result.add({"features": [item]})
+
+    assert result._group_keys == {}
+    assert result.aggregate(by="orbit_state") == {"ascending": 3, "descending": 1}
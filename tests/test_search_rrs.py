@@ -121,3 +121,8 @@ def test_search_rrs_drops_invalid_enum_values(test_client, authed_tasking_reques
     request_payload = json.loads(request.read())
     assert "lastStatusCode" not in request_payload["filter"].keys()
     assert "collectionTier" not in request_payload["filter"].keys()
+
+
+def test_iter_repeat_requests(test_client, authed_tasking_request_mock):
+    rrs = list(test_client.iter_repeat_requests())
+    assert rrs == get_mock_responses("/repeat-requests/search?page=1&limit=250")["results"]
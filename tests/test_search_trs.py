@@ -17,12 +17,21 @@ def two_page_trs_mock(authed_tasking_request_mock):
             {
                 "type": "Feature",
                 "geometry": {"type": "Point", "coordinates": [-100.0, 40.0]},
-                "properties": {"taskingrequestId": "tr-page1-1", "userId": "MOCK_ID"},
+                "properties": {
+                    "taskingrequestId": "tr-page1-1",
+                    "userId": "MOCK_ID",
+                    "windowOpen": "2024-01-05T00:00:00Z",
+                    "statusHistory": [{"time": "2024-01-02T00:00:00Z", "code": "completed"}],
+                },
             },
             {
                 "type": "Feature",
                 "geometry": {"type": "Point", "coordinates": [-100.0, 40.0]},
-                "properties": {"taskingrequestId": "tr-page1-2", "userId": "MOCK_ID"},
+                "properties": {
+                    "taskingrequestId": "tr-page1-2",
+                    "userId": "MOCK_ID",
+                    "statusHistory": [{"time": "2024-01-03T00:00:00.123Z", "code": "active"}],
+                },
             },
         ],
         "currentPage": 1,
@@ -34,7 +43,12 @@ def two_page_trs_mock(authed_tasking_request_mock):
             {
                 "type": "Feature",
                 "geometry": {"type": "Point", "coordinates": [-100.0, 40.0]},
-                "properties": {"taskingrequestId": "tr-page2-1", "userId": "MOCK_ID"},
+                "properties": {
+                    "taskingrequestId": "tr-page2-1",
+                    "userId": "MOCK_ID",
+                    "windowOpen": "2024-01-04T00:00:00Z",
+                    "statusHistory": [{"time": "2024-01-01T00:00:00Z", "code": "accepted"}],
+                },
             },
         ],
         "currentPage": 2,
@@ -208,3 +222,68 @@ def test_search_trs_drops_invalid_enum_values(test_client, authed_tasking_reques
     request_payload = json.loads(request.read())
     assert "lastStatusCode" not in request_payload["query"].keys()
     assert "collectionTier" not in request_payload["query"].keys()
+
+
+@pytest.mark.parametrize("show_progress", [True, False])
+def test_search_trs_threaded_keeps_page_order(test_client, two_page_trs_mock, disable_validate_uuid, show_progress):
+    tr_results = test_client.search_tasking_requests(show_progress=show_progress, threaded=True)
+    assert tr_results.tasking_request_ids == ["tr-page1-1", "tr-page1-2", "tr-page2-1"]
+
+
+def test_search_trs_max_results(test_client, two_page_trs_mock, disable_validate_uuid):
+    tr_results = test_client.search_tasking_requests(max_results=1)
+
+    assert tr_results.tasking_request_ids == ["tr-page1-1"]
+    assert two_page_trs_mock.get_request(url=f"{CONSOLE_API_URL}/tasks/search?page=2&limit=250") is None
+
+
+@pytest.mark.parametrize("threaded", [True, False])
+def test_iter_tasking_requests(test_client, two_page_trs_mock, disable_validate_uuid, threaded):
+    tr_ids = [tr["properties"]["taskingrequestId"] for tr in test_client.iter_tasking_requests(threaded=threaded)]
+    assert tr_ids == ["tr-page1-1", "tr-page1-2", "tr-page2-1"]
+
+
+def test_iter_tasking_requests_max_results(test_client, two_page_trs_mock, disable_validate_uuid):
+    trs = list(test_client.iter_tasking_requests(max_results=2))
+
+    assert [tr["properties"]["taskingrequestId"] for tr in trs] == ["tr-page1-1", "tr-page1-2"]
+    assert two_page_trs_mock.get_request(url=f"{CONSOLE_API_URL}/tasks/search?page=2&limit=250") is None
+
+
+@pytest.mark.parametrize(
+    "sortby, expected",
+    [
+        ("-last_status_time", ["tr-page1-2", "tr-page1-1", "tr-page2-1"]),
+        (["+status"], ["tr-page2-1", "tr-page1-2", "tr-page1-1"]),
+        ("window_open", ["tr-page2-1", "tr-page1-1", "tr-page1-2"]),
+        ("-windowOpen", ["tr-page1-1", "tr-page2-1", "tr-page1-2"]),
+    ],
+)
+def test_search_trs_sortby(test_client, two_page_trs_mock, disable_validate_uuid, sortby, expected):
+    tr_results = test_client.search_tasking_requests(sortby=sortby)
+    assert tr_results.tasking_request_ids == expected
+
+
+@pytest.mark.parametrize(
+    "sortby, warns",
+    [
+        ("-last_status_time", False),
+        ("windowOpen", False),
+        ("huffelpuff", True),
+    ],
+)
+def test_search_trs_sortby_unsupported_field_warns(caplog, test_client, two_page_trs_mock, sortby, warns):
+    test_client.search_tasking_requests(sortby=sortby)
+    assert ("sorting by huffelpuff not supported" in caplog.text) == warns
+
+
+def test_search_trs_sortby_max_results_fetches_all_pages(test_client, two_page_trs_mock, disable_validate_uuid):
+    tr_results = test_client.search_tasking_requests(sortby="-last_status_time", max_results=2)
+
+    assert tr_results.tasking_request_ids == ["tr-page1-2", "tr-page1-1"]
+    assert two_page_trs_mock.get_request(url=f"{CONSOLE_API_URL}/tasks/search?page=2&limit=250") is not None
+
+
+def test_iter_tasking_requests_sortby(test_client, two_page_trs_mock, disable_validate_uuid):
+    trs = list(test_client.iter_tasking_requests(sortby="last_status_time", max_results=1))
+    assert [tr["properties"]["taskingrequestId"] for tr in trs] == ["tr-page2-1"]
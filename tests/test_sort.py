@@ -1,6 +1,6 @@
 import pytest
 
-from capella_console_client.sort import _sort_stac_items
+from capella_console_client.sort import _sort_stac_items, _sort_stac_items_by_properties
 
 TEST_CASES = [
     pytest.param(
@@ -33,6 +33,12 @@ TEST_CASES = [
         [{"id": 4}, {"id": 5}, {"id": 3}],
         id="unequal length",
     ),
+    pytest.param(
+        [{"id": 4, "n": 1}, {"id": 3}, {"id": 4, "n": 2}],
+        [4, 3, 4],
+        [{"id": 4, "n": 1}, {"id": 4, "n": 2}, {"id": 3}],
+        id="duplicates",
+    ),
     pytest.param([], [], [], id="empty"),
 ]
 
@@ -40,3 +46,24 @@ TEST_CASES = [
 @pytest.mark.parametrize("stac_items,stac_ids,sorted", TEST_CASES)
 def test_sort_stac_items(stac_items, stac_ids, sorted):
     assert _sort_stac_items(stac_items, stac_ids) == sorted
+
+
+SORT_BY_PROPERTIES_ITEMS = [
+    {"id": "a", "properties": {"datetime": "2024-01-02T00:00:00Z", "view:incidence_angle": 30}},
+    {"id": "b", "properties": {"datetime": "2024-01-01T00:00:00Z", "view:incidence_angle": 40}},
+    {"id": "c", "properties": {"datetime": "2024-01-02T00:00:00Z", "view:incidence_angle": 20}},
+    {"id": "d", "properties": {}},
+]
+
+
+@pytest.mark.parametrize(
+    "sortby,expected_ids",
+    [
+        pytest.param("datetime", ["b", "a", "c", "d"], id="asc"),
+        pytest.param("-incidence_angle", ["b", "a", "c", "d"], id="desc prefixed field"),
+        pytest.param(["-datetime", "+incidence_angle"], ["c", "a", "b", "d"], id="multiple"),
+        pytest.param("-id", ["d", "c", "b", "a"], id="root level field"),
+    ],
+)
+def test_sort_stac_items_by_properties(sortby, expected_ids):
+    assert [i["id"] for i in _sort_stac_items_by_properties(SORT_BY_PROPERTIES_ITEMS, sortby)] == expected_ids
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from capella_console_client.search import StacSearchResult
+from capella_console_client.spatial import STRtree, intersects
+
+
+def _square(x: float, y: float, size: float = 1.0):
+    return {
+        "type": "Polygon",
+        "coordinates": [[[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]],
+    }
+
+
+def _grid_search_result(n: int = 10) -> StacSearchResult:
+    # 1x1 degree footprints with lower left corner at (x, y) for x, y in range(n)
+    features = [{"id": f"{x}-{y}", "geometry": _square(x, y)} for x in range(n) for y in range(n)]
+    result = StacSearchResult()
+    result.add({"features": features})
+    return result
+
+
+def test_str_tree_query_matches_brute_force():
+    rnd = random.Random(42)
+    bboxes = []
+    for _ in range(500):
+        x, y = rnd.uniform(-180, 170), rnd.uniform(-80, 70)
+        bboxes.append((x, y, x + rnd.uniform(0, 10), y + rnd.uniform(0, 10)))
+
+    tree = STRtree(bboxes)
+    query = (0, 0, 20, 20)
+    expected = [
+        idx
+        for idx, b in enumerate(bboxes)
+        if not (b[0] > query[2] or b[2] < query[0] or b[1] > query[3] or b[3] < query[1])
+    ]
+    assert tree.query(query) == expected
+
+
+def test_spatial_index_covering():
+    index = _grid_search_result().spatial_index()
+    assert [item["id"] for item in index.covering((3.5, 4.5))] == ["3-4"]
+    assert index.covering({"type": "Point", "coordinates": [20, 20]}) == []
+
+
+def test_spatial_index_intersecting():
+    index = _grid_search_result().spatial_index()
+    aoi = {"type": "Feature", "geometry": _square(2.5, 2.5, 0.25), "properties": {}}
+    assert [item["id"] for item in index.intersecting(aoi)] == ["2-2"]
+
+    line = {"type": "LineString", "coordinates": [[0.5, 0.5], [2.5, 0.5]]}
+    assert sorted(item["id"] for item in index.intersecting(line)) == ["0-0", "1-0", "2-0"]
+
+
+def test_spatial_index_nearest():
+    index = _grid_search_result(3).spatial_index()
+    assert [item["id"] for item in index.nearest((10, 2.5))] == ["2-2"]
+    assert [item["id"] for item in index.nearest((1.5, 1.5), k=1)] == ["1-1"]
+    assert len(index.nearest((1.5, 1.5), k=5)) == 5
+
+
+def test_spatial_index_3d_bbox():
+    feature = {"id": "3d", "geometry": _square(0, 0), "bbox": [0, 0, -10, 1, 1, 500]}
+    result = StacSearchResult()
+    result.add({"features": [feature]})
+    index = result.spatial_index()
+
+    assert index.tree.bboxes == [(0, 0, 1, 1)]
+    assert [item["id"] for item in index.covering((0.5, 0.5))] == ["3d"]
+
+
+def test_spatial_index_reset_on_add():
+    result = _grid_search_result(2)
+    index = result.spatial_index()
+    assert result.spatial_index() is index
+
+    result.add({"features": [{"id": "new", "geometry": _square(5, 5)}]})
+    assert result.spatial_index() is not index
+    assert len(result.spatial_index()) == 5
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (_square(0, 0), _square(0.5, 0.5), True),
+        (_square(0, 0), _square(2, 2), False),
+        (_square(0, 0, 10), _square(2, 2), True),
+        (_square(0, 0), _square(1, 0), True),
+        ({"type": "Point", "coordinates": [0.5, 0.5]}, _square(0, 0), True),
+        ({"type": "Point", "coordinates": [1.5, 0.5]}, _square(0, 0), False),
+        (
+            {"type": "MultiPolygon", "coordinates": [_square(5, 5)["coordinates"], _square(0, 0)["coordinates"]]},
+            _square(0.5, 0.5),
+            True,
+        ),
+    ],
+)
+def test_intersects(a, b, expected):
+    assert intersects(a, b) == expected
+    assert intersects(b, a) == expected
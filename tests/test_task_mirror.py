@@ -0,0 +1,74 @@
+import json
+from copy import deepcopy
+
+import pytest
+
+from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.task_mirror import TaskingRequestMirror
+from tests.test_data import TASK_1, get_mock_responses
+
+
+@pytest.fixture
+def mirror_path(tmp_path):
+    yield tmp_path / "tasking-requests.sqlite"
+
+
+def _get_search_payloads(httpx_mock, endpoint):
+    return [json.loads(r.read()) for r in httpx_mock.get_requests(url=f"{CONSOLE_API_URL}{endpoint}?page=1&limit=250")]
+
+
+def test_sync_tasking_requests_incremental(test_client, authed_tasking_request_mock, mirror_path):
+    mirror = test_client.sync_tasking_requests(db_path=mirror_path)
+    assert len(mirror) == 4
+
+    updated = deepcopy(TASK_1)
+    updated["properties"]["statusHistory"].insert(
+        0, {"time": "2020-05-01T00:00:00Z", "code": "canceled", "message": "canceled"}
+    )
+    authed_tasking_request_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250",
+        json={"results": [updated], "currentPage": 1, "totalPages": 1},
+    )
+    authed_tasking_request_mock.add_response(
+        url=f"{CONSOLE_API_URL}/repeat-requests/search?page=1&limit=250",
+        json={"results": [], "currentPage": 1, "totalPages": 1},
+    )
+    mirror = test_client.sync_tasking_requests(db_path=mirror_path)
+
+    tr_payloads = _get_search_payloads(authed_tasking_request_mock, "/tasks/search")
+    assert "lastStatusTime" not in tr_payloads[0]["query"]
+    assert tr_payloads[1]["query"]["lastStatusTime"] == {"gt": "2021-01-21T23:25:08.190Z"}
+
+    rr_payloads = _get_search_payloads(authed_tasking_request_mock, "/repeat-requests/search")
+    assert rr_payloads[1]["filter"]["lastStatusTime"] == {"gt": "2023-09-08T17:35:26.172Z"}
+
+    assert len(mirror) == 4
+    assert [tr["properties"]["taskingrequestId"] for tr in mirror.query(status="canceled")] == ["abc"]
+
+
+def test_mirror_query(mirror_path):
+    mirror = TaskingRequestMirror(mirror_path)
+    trs = get_mock_responses("/tasks/search?page=1&limit=250")["results"]
+    rrs = get_mock_responses("/repeat-requests/search?page=1&limit=250")["results"]
+    mirror.upsert("tasking_request", trs, scope="trs")
+    mirror.upsert("repeat_request", rrs, scope="rrs")
+
+    assert mirror.get_watermark("trs") == "2021-01-21T23:25:08.190Z"
+    assert len(mirror.query()) == len(trs)
+    assert [tr["properties"]["taskingrequestId"] for tr in mirror.query(status=["COMPLETED"])] == ["abc"]
+    assert mirror.query(window_open__gte="2020-04-22", window_close__lt="2020-04-22") == []
+    assert len(mirror.query(entity="repeat_request", window_open__gte="2023-09-08")) == 2
+
+    with pytest.raises(ValueError):
+        mirror.query(entity="order")
+
+
+def test_mirror_normalizes_utc_offsets(mirror_path):
+    mirror = TaskingRequestMirror(mirror_path)
+    task = deepcopy(TASK_1)
+    task["properties"]["windowOpen"] = "2024-01-01T23:00:00-05:00"
+    mirror.upsert("tasking_request", [task], scope="trs")
+
+    assert len(mirror.query(window_open__gte="2024-01-02T03:59:59Z")) == 1
+    assert mirror.query(window_open__gte="2024-01-02T04:00:01Z") == []
+    assert len(mirror.query(window_open__lt="2024-01-02T01:00:00+02:00")) == 0
@@ -1,11 +1,17 @@
+import json
 import random
+import re
+import time
 import uuid
 
+import httpx
 import pytest
 
 from capella_console_client import CapellaConsoleClient
-from capella_console_client.config import CONSOLE_API_URL
-from capella_console_client.exceptions import ContractNotFoundError, TaskNotCompleteError
+from capella_console_client.bulk import _get_idempotency_key
+from capella_console_client.config import BULK_MAX_ATTEMPTS, CONSOLE_API_URL
+from capella_console_client.exceptions import CapellaConsoleClientError, ContractNotFoundError, TaskNotCompleteError
+from capella_console_client.tasking_request import get_collects_for_tasking_requests
 
 from .test_data import get_mock_responses, post_mock_responses
 
@@ -48,6 +54,44 @@ def test_get_collects_for_task_not_completed(test_client, auth_httpx_mock, disab
         test_client.get_collects_for_task("def")
 
 
+def test_get_collects_for_tasks(test_client, authed_tasking_request_mock, disable_validate_uuid):
+    authed_tasking_request_mock.add_response(
+        url=f"{CONSOLE_API_URL}/collects/list/abc",
+        json=get_mock_responses("/collects/list/abc"),
+    )
+    authed_tasking_request_mock.add_response(
+        url=f"{CONSOLE_API_URL}/task/ghi",
+        status_code=404,
+        json={"message": "Tasking request not found", "code": "NOT_FOUND"},
+    )
+
+    results = test_client.get_collects_for_tasks(["abc", "def", "ghi"])
+
+    assert results["abc"] == {"success": True, "collects": get_mock_responses("/collects/list/abc")}
+    assert results["def"]["success"] is False
+    assert results["def"]["status"] == get_mock_responses("/task/def")["properties"]["statusHistory"][0]["code"]
+    assert results["ghi"] == {"success": False, "message": "Tasking request not found", "code": "NOT_FOUND"}
+
+
+def test_get_collects_for_tasks_retries_transient_error(
+    test_client, authed_tasking_request_mock, disable_validate_uuid, monkeypatch
+):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    authed_tasking_request_mock.add_response(url=f"{CONSOLE_API_URL}/collects/list/abc", status_code=503, json={})
+    authed_tasking_request_mock.add_response(
+        url=f"{CONSOLE_API_URL}/collects/list/abc",
+        json=get_mock_responses("/collects/list/abc"),
+    )
+
+    results = test_client.get_collects_for_tasks(["abc"])
+
+    assert results == {"abc": {"success": True, "collects": get_mock_responses("/collects/list/abc")}}
+
+
+def test_get_collects_for_tasking_requests_no_ids(test_client):
+    assert get_collects_for_tasking_requests(session=test_client._sesh) == {}
+
+
 def test_create_task_returns_new_task(test_client, authed_tasking_request_mock):
     tasking_requests = test_client.create_tasking_request(geometry=mock_geojson, name="test")
     assert tasking_requests == post_mock_responses("/task")
@@ -158,3 +202,220 @@ def test_update_tasks_partial_failure(test_client, task_update_partial_mock, dis
     assert result[tr_id_success] == get_mock_responses("/task/abc")
     assert result[tr_id_error]["success"] is False
     assert result[tr_id_error]["error"]["code"] == "UNABLE_TO_UPDATE_TASKING_REQUEST"
+
+
+def test_update_tasks_properties_by_id(test_client, authed_tasking_request_mock, disable_validate_uuid, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    tr_ids = [str(uuid.uuid4()) for _ in range(3)]
+    rate_limited = {tr_ids[0]}
+
+    def update_callback(request):
+        tr_id = request.url.path.rsplit("/", 1)[-1]
+        if tr_id in rate_limited:
+            rate_limited.remove(tr_id)
+            return httpx.Response(429, json={"message": "Too Many Requests"})
+        return httpx.Response(200, json=json.loads(request.read()))
+
+    authed_tasking_request_mock.add_callback(
+        update_callback, url=re.compile(rf"{CONSOLE_API_URL}/task/[0-9a-f\-]{{36}}$"), method="PATCH"
+    )
+    result = test_client.update_tasking_requests(
+        tr_ids[2],
+        properties_by_id={tr_id: {"custom_attribute_1": f"project-{i}"} for i, tr_id in enumerate(tr_ids[:2])},
+        description="shared",
+        rate=1000,
+    )
+
+    assert list(result) == [tr_ids[2], *tr_ids[:2]]
+    for i, tr_id in enumerate(tr_ids[:2]):
+        assert result[tr_id]["properties"] == {
+            "taskingrequestDescription": "shared",
+            "customAttribute1": f"project-{i}",
+        }
+    assert result[tr_ids[2]]["properties"] == {"taskingrequestDescription": "shared"}
+    assert len(authed_tasking_request_mock.get_requests(method="PATCH")) == 4
+
+
+def _task_with_status(tr_id, *codes):
+    status_history = [{"time": f"2024-01-0{i + 1}T00:00:00Z", "code": code} for i, code in enumerate(codes)]
+    return {"properties": {"taskingrequestId": tr_id, "statusHistory": status_history[::-1]}}
+
+
+def test_watch_tasking_requests(test_client, auth_httpx_mock, disable_validate_uuid):
+    polls = {
+        "tr-1": iter([["accepted"], ["accepted"], ["accepted", "active"], ["accepted", "active", "completed"]]),
+        "tr-2": iter([["accepted", "rejected"]]),
+    }
+    searched_ids = []
+
+    def search_callback(request):
+        tr_ids = json.loads(request.read())["query"]["taskingrequestIds"]
+        searched_ids.append(tr_ids)
+        results = [_task_with_status(tr_id, *next(polls[tr_id])) for tr_id in tr_ids]
+        return httpx.Response(200, json={"results": results, "currentPage": 1, "totalPages": 1})
+
+    auth_httpx_mock.add_callback(search_callback, url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250")
+
+    changes, completed = [], []
+    tasks = test_client.watch_tasking_requests(
+        ["tr-1", "tr-2"],
+        on_status_change=lambda task, prev, cur: changes.append((task["properties"]["taskingrequestId"], prev, cur)),
+        on_completed=lambda task: completed.append(task["properties"]["taskingrequestId"]),
+        min_interval=0,
+    )
+
+    # single search per polling cycle
+    assert searched_ids == [["tr-1", "tr-2"], ["tr-1"], ["tr-1"], ["tr-1"]]
+    assert changes == [
+        ("tr-1", None, "accepted"),
+        ("tr-2", None, "rejected"),
+        ("tr-1", "accepted", "active"),
+        ("tr-1", "active", "completed"),
+    ]
+    assert completed == ["tr-1"]
+    assert set(tasks) == {"tr-1", "tr-2"}
+
+
+def test_watch_tasking_requests_transient_error(test_client, auth_httpx_mock, disable_validate_uuid):
+    polls = iter([httpx.ConnectError("connection reset"), ["accepted"], ["accepted", "completed"]])
+
+    def search_callback(request):
+        poll = next(polls)
+        if isinstance(poll, Exception):
+            raise poll
+        results = [_task_with_status("tr-1", *poll)]
+        return httpx.Response(200, json={"results": results, "currentPage": 1, "totalPages": 1})
+
+    auth_httpx_mock.add_callback(search_callback, url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250")
+
+    changes = []
+    tasks = test_client.watch_tasking_requests(
+        ["tr-1"], on_status_change=lambda task, prev, cur: changes.append(cur), min_interval=0
+    )
+
+    assert changes == ["accepted", "completed"]
+    assert tasks["tr-1"]["properties"]["statusHistory"][0]["code"] == "completed"
+
+
+def test_watch_tasking_requests_error(test_client, auth_httpx_mock, disable_validate_uuid):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250", status_code=403, json={"message": "Forbidden"}
+    )
+    with pytest.raises(CapellaConsoleClientError):
+        test_client.watch_tasking_requests(["tr-1"], min_interval=0)
+
+
+def test_watch_tasking_requests_timeout(test_client, auth_httpx_mock, disable_validate_uuid):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250",
+        json={"results": [_task_with_status("tr-1", "accepted")], "currentPage": 1, "totalPages": 1},
+    )
+    tasks = test_client.watch_tasking_requests(["tr-1"], min_interval=60, timeout=1)
+
+    assert len(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250")) == 1
+    assert tasks["tr-1"]["properties"]["statusHistory"][0]["code"] == "accepted"
+
+
+def test_watch_tasking_requests_not_found(test_client, auth_httpx_mock, disable_validate_uuid):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250",
+        json={"results": [], "currentPage": 1, "totalPages": 1},
+    )
+    changes = []
+    tasks = test_client.watch_tasking_requests(
+        ["tr-1"], on_status_change=lambda task, prev, cur: changes.append(cur), min_interval=0
+    )
+
+    assert tasks == {}
+    assert changes == ["not_found"]
+    requests = auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250")
+    assert len(requests) == 3
+    # tasking requests derived from repeat requests are watched as well
+    assert json.loads(requests[0].read())["query"]["includeRepeatingTasks"] == {"eq": True}
+
+
+def test_create_tasking_requests(test_client, auth_httpx_mock, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    existing_task = _task_with_status("existing-tr", "accepted")
+    existing_task["properties"]["customAttribute1"] = "existing-key"
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250",
+        json={"results": [existing_task], "currentPage": 1, "totalPages": 1},
+    )
+    responses = iter([httpx.Response(503, json={"message": "Service Unavailable"})])
+
+    def create_callback(request):
+        return next(responses, None) or httpx.Response(200, json=post_mock_responses("/task"))
+
+    auth_httpx_mock.add_callback(create_callback, url=f"{CONSOLE_API_URL}/task", method="POST")
+
+    features = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": mock_geojson,
+                "properties": {"name": "a", "idempotency_key": "existing-key"},
+            },
+            {"type": "Feature", "geometry": mock_geojson, "properties": {"name": "b"}},
+            {"type": "Feature", "geometry": mock_geojson, "properties": {"name": "c", "window_open": "PANDA"}},
+            {
+                "type": "Feature",
+                "geometry": mock_geojson,
+                "properties": {"name": "d", "custom_attribute_1": "PROJECT-X"},
+            },
+        ],
+    }
+    results = test_client.create_tasking_requests(
+        features, collection_tier="priority", custom_attribute_2="batch", rate=1000, max_concurrency=1
+    )
+
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert results[0]["existing"] is True
+    assert results[0]["result"] == existing_task
+    assert results[1]["success"] is True
+    assert results[1]["existing"] is False
+    assert results[1]["idempotency_key"].startswith("ccc-")
+    assert results[2]["success"] is False
+    assert results[3]["success"] is True
+    assert results[3]["idempotency_key"] is None
+
+    create_requests = auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/task", method="POST")
+    assert len(create_requests) == 3
+    payload = json.loads(create_requests[1].read())
+    assert payload["properties"]["customAttribute1"] == results[1]["idempotency_key"]
+    assert payload["properties"]["collectionTier"] == "priority"
+    # user provided custom_attribute_1 is kept
+    assert json.loads(create_requests[2].read())["properties"]["customAttribute1"] == "PROJECT-X"
+    # existence of ambiguous (5xx) submission checked before retry
+    assert len(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250")) == 2
+
+
+def test_create_tasking_requests_transport_error(test_client, auth_httpx_mock, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250",
+        json={"results": [], "currentPage": 1, "totalPages": 1},
+    )
+
+    def create_callback(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    auth_httpx_mock.add_callback(create_callback, url=f"{CONSOLE_API_URL}/task", method="POST")
+
+    features = [{"type": "Feature", "geometry": mock_geojson, "properties": {"name": "a"}}]
+    results = test_client.create_tasking_requests(features, rate=1000)
+
+    assert results[0]["success"] is False
+    assert results[0]["message"] == "timed out"
+    assert len(auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/task", method="POST")) == BULK_MAX_ATTEMPTS
+    # existence checked before every retry
+    searches = auth_httpx_mock.get_requests(url=f"{CONSOLE_API_URL}/tasks/search?page=1&limit=250")
+    assert len(searches) == BULK_MAX_ATTEMPTS
+
+
+def test_create_tasking_requests_idempotency_key_stable():
+    kwargs = {"geometry": mock_geojson, "name": "a", "collection_tier": "priority"}
+    assert _get_idempotency_key(0, kwargs) == _get_idempotency_key(0, dict(reversed(kwargs.items())))
+    assert _get_idempotency_key(0, kwargs) != _get_idempotency_key(1, kwargs)
+    assert _get_idempotency_key(0, kwargs) != _get_idempotency_key(0, {**kwargs, "name": "b"})